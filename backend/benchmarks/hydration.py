@@ -0,0 +1,79 @@
+"""
+Стоимость гидратации одной строки users в UserEntity.
+
+"validated" - прежний путь через конструкторы VO и ValidatedField,
+"trusted" - UserModelMapper.model_to_entity (from_trusted, без повторной валидации).
+
+Запуск из backend/ (нужны переменные окружения БД, как для приложения):
+    python -m benchmarks.hydration
+"""
+
+import timeit
+import uuid
+from datetime import UTC, datetime
+
+from src.data_access.mappers.user_mapper import UserModelMapper
+from src.data_access.models import UserModel
+from src.domain.user.entity import UserEntity
+from src.domain.user.value_objects import (
+    PasswordHashVo,
+    UserCreatedAtVo,
+    UserEmailVo,
+    UserFirstNameVo,
+    UserIdVo,
+    UserLastNameVo,
+    UserUpdatedAtVo,
+)
+
+ROWS = 1_000
+REPEAT = 5
+
+
+def make_models(count: int) -> list[UserModel]:
+    now = datetime.now(UTC)
+    return [
+        UserModel(
+            id=uuid.uuid4(),
+            email=f"user{i}@example.com",
+            password="$argon2id$v=19$m=65536,t=3,p=4$c2FsdA$aGFzaA",
+            first_name="Ivan",
+            last_name="Petrov",
+            is_superuser=False,
+            is_active=True,
+            created_at=now,
+            updated_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+def validated_model_to_entity(model: UserModel) -> UserEntity:
+    return UserEntity(
+        id_=UserIdVo(model.id),
+        email=UserEmailVo(model.email),
+        password=PasswordHashVo.from_hash(model.password),
+        first_name=UserFirstNameVo(model.first_name) if model.first_name else None,
+        last_name=UserLastNameVo(model.last_name) if model.last_name else None,
+        is_superuser=model.is_superuser,
+        is_active=model.is_active,
+        created_at=UserCreatedAtVo(model.created_at),
+        updated_at=UserUpdatedAtVo(model.updated_at),
+    )
+
+
+def bench(name: str, func, models: list[UserModel]) -> float:
+    timings = timeit.repeat(lambda: [func(model) for model in models], number=1, repeat=REPEAT)
+    per_row_us = min(timings) / len(models) * 1_000_000
+    print(f"{name:<10} {per_row_us:8.2f} us/row")
+    return per_row_us
+
+
+def main() -> None:
+    models = make_models(ROWS)
+    before = bench("validated", validated_model_to_entity, models)
+    after = bench("trusted", UserModelMapper.model_to_entity, models)
+    print(f"speedup    {before / after:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""
+Бюджет времени импорта для каждой роли процесса (API, воркер taskiq, планировщик).
+
+Каждая роль импортирует свои модули в отдельном интерпретаторе с -X importtime,
+время - лучшее из --runs запусков в мс (первый прогон прогревает кеш байткода).
+Таблица "top" - сумма собственного (self) времени импорта по корневым пакетам
+для роли api: с неё и стоит начинать, если бюджет превышен.
+
+Базовые значения лежат в benchmarks/baselines/importtime.json. Роль, ставшая медленнее
+базы больше чем на --threshold (по умолчанию 25%) и больше чем на MIN_DELTA_MS,
+считается регрессией, и скрипт завершается с кодом 1.
+Цифры зависят от машины: сравнивайте с базой, снятой на ней же.
+
+Переменные окружения для импорта не нужны: настройки создаются при первом обращении.
+Запуск из backend/:
+    python -m benchmarks.importtime             # сравнить с базой
+    python -m benchmarks.importtime --save      # перезаписать базу
+"""
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "importtime.json"
+BACKEND_DIR = Path(__file__).parent.parent
+DEFAULT_THRESHOLD = 0.25
+DEFAULT_RUNS = 5
+# Холодный импорт шумит на десятки мс; меньшую разницу не считаем регрессией
+MIN_DELTA_MS = 50
+TOP = 12
+
+# Что импортирует процесс каждой роли до того, как начнёт обслуживать запросы
+ROLES = {
+    "api": ["src.main"],
+    "worker": ["src.core.bg_tasks.tasks", "src.main"],
+    "scheduler": ["src.core.bg_tasks.scheduler", "src.core.bg_tasks.tasks"],
+}
+
+SCRIPT = """
+import time
+start = time.perf_counter()
+{imports}
+print((time.perf_counter() - start) * 1000)
+"""
+
+
+def import_once(modules: list[str]) -> tuple[float, str]:
+    code = SCRIPT.format(imports="\n".join(f"import {module}" for module in modules))
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return float(completed.stdout.strip().splitlines()[-1]), completed.stderr
+
+
+def measure(modules: list[str], runs: int) -> tuple[float, str]:
+    results = [import_once(modules) for _ in range(runs)]
+    return min(results, key=lambda result: result[0])
+
+
+def self_time_by_package(importtime_log: str) -> dict[str, float]:
+    """
+    Собственное время импорта в мс по корневым пакетам из вывода -X importtime.
+    """
+    totals: dict[str, float] = defaultdict(float)
+    for line in importtime_log.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        totals[name.strip().split(".")[0]] += int(self_us) / 1000
+    return totals
+
+
+def load_baseline() -> dict:
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text())
+
+
+def save_baseline(results: dict[str, float]) -> None:
+    BASELINE_PATH.parent.mkdir(exist_ok=True)
+    baseline = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {name: round(value, 1) for name, value in results.items()},
+    }
+    BASELINE_PATH.write_text(json.dumps(baseline, indent=2) + "\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--save", action="store_true", help="записать результаты как базу")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS)
+    args = parser.parse_args()
+
+    baseline = load_baseline()
+    expected = baseline.get("results", {})
+    if expected and baseline.get("python") != platform.python_version():
+        print(f"база снята на Python {baseline['python']}, сравнение приблизительное")
+
+    import_once(ROLES["api"])  # прогрев кеша байткода
+    results: dict[str, float] = {}
+    regressions: list[str] = []
+    logs: dict[str, str] = {}
+    print(f"{'role':<12} {'ms':>9} {'base':>9} {'delta':>8}")
+    for role, modules in ROLES.items():
+        value, logs[role] = measure(modules, args.runs)
+        results[role] = value
+        base = expected.get(role)
+        delta = f"{value / base - 1:+8.1%}" if base else f"{'-':>8}"
+        if base and value > base * (1 + args.threshold) and value - base > MIN_DELTA_MS:
+            regressions.append(role)
+        base_str = f"{base:9.1f}" if base else f"{'-':>9}"
+        print(f"{role:<12} {value:9.1f} {base_str} {delta}")
+
+    print(f"\ntop {TOP} packages (api, self ms)")
+    packages = self_time_by_package(logs["api"])
+    for name, value in sorted(packages.items(), key=lambda item: -item[1])[:TOP]:
+        print(f"{name:<32} {value:9.1f}")
+
+    if args.save:
+        save_baseline({**expected, **results})
+        print(f"база сохранена в {BASELINE_PATH}")
+        return 0
+
+    if regressions:
+        print(f"регрессия больше {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
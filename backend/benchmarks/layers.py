@@ -0,0 +1,189 @@
+"""
+Микробенчмарки слоёв, через которые проходит запрос на создание/чтение пользователя.
+
+Каждый кейс - один вызов без I/O, результат - лучшее время из REPEAT замеров в мкс/вызов.
+"roundtrip.*" - вся цепочка в процессе:
+    dict -> UserCreateSchema -> UserInputDto -> UserEntity -> UserModel
+         -> UserEntity -> UserOutputDto -> payload -> JSON (как FastJSONResponse)
+Хеширование пароля (Argon2) не входит: оно на порядки дороже и вынесено в пул хешера.
+Колонка "share" - доля шага от roundtrip.create_and_read, с неё и стоит начинать оптимизацию.
+
+Базовые значения лежат в benchmarks/baselines/layers.json. Кейс, ставший медленнее
+базы больше чем на --threshold (по умолчанию 25%) и больше чем на MIN_DELTA_US,
+считается регрессией, и скрипт завершается с кодом 1.
+Цифры зависят от машины: сравнивайте с базой, снятой на ней же.
+
+Запуск из backend/ (нужны переменные окружения БД, как для приложения):
+    python -m benchmarks.layers                 # сравнить с базой
+    python -m benchmarks.layers --save          # перезаписать базу
+    python -m benchmarks.layers -k vo.          # только кейсы с подстрокой в имени
+"""
+
+import argparse
+import json
+import platform
+import sys
+import timeit
+import uuid
+from collections.abc import Callable
+from datetime import UTC, datetime
+from pathlib import Path
+
+from pydantic_core import to_json
+
+from src.api.user.mappers import UserApiMapper
+from src.api.user.schemas import UserCreateSchema
+from src.data_access.mappers.user_mapper import UserModelMapper
+from src.domain.user.entity import UserEntity
+from src.domain.user.mappers import UserDomainMapper
+from src.domain.user.value_objects import (
+    PasswordHashVo,
+    UserCreatedAtVo,
+    UserEmailVo,
+    UserFirstNameVo,
+    UserIdVo,
+    UserLastNameVo,
+    UserUpdatedAtVo,
+)
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "layers.json"
+DEFAULT_THRESHOLD = 0.25
+# Кейсы меньше микросекунды шумят на десятки процентов; меньшую разницу не считаем регрессией
+MIN_DELTA_US = 0.2
+ROUNDTRIP = "roundtrip.create_and_read"
+NUMBER = 5_000
+REPEAT = 7
+
+PASSWORD_HASH = "$argon2id$v=19$m=65536,t=3,p=4$c2FsdA$aGFzaA"
+PAYLOAD = {
+    "email": "ivan.petrov@example.com",
+    "password": "Secret_123",
+    "first_name": "Ivan",
+    "last_name": "Petrov",
+}
+
+
+def roundtrip(payload: dict) -> bytes:
+    schema = UserCreateSchema.model_validate(payload)
+    dto = UserApiMapper.schema_to_dto(schema)
+    PasswordHashVo._validate_plain(dto.password)
+    entity = UserDomainMapper.input_dto_to_entity(dto, PasswordHashVo.from_hash(PASSWORD_HASH))
+    model = UserModelMapper.entity_to_model(entity)
+    loaded = UserModelMapper.model_to_entity(model)
+    output = UserDomainMapper.entity_to_output_dto(loaded)
+    return to_json(UserApiMapper.dto_to_payload(output))
+
+
+def make_cases() -> dict[str, Callable[[], object]]:
+    now = datetime.now(UTC)
+    user_id = uuid.uuid4()
+    password_vo = PasswordHashVo.from_hash(PASSWORD_HASH)
+    schema = UserCreateSchema.model_validate(PAYLOAD)
+    input_dto = UserApiMapper.schema_to_dto(schema)
+    entity = UserDomainMapper.input_dto_to_entity(input_dto, password_vo)
+    model = UserModelMapper.entity_to_model(entity)
+    output_dto = UserDomainMapper.entity_to_output_dto(entity)
+    response = UserApiMapper.dto_to_schema(output_dto)
+    payload = UserApiMapper.dto_to_payload(output_dto)
+
+    vo_kwargs = {
+        "email": UserEmailVo(entity.email.value),
+        "password": password_vo,
+        "created_at": UserCreatedAtVo(now),
+        "updated_at": UserUpdatedAtVo(now),
+        "first_name": UserFirstNameVo("Ivan"),
+        "last_name": UserLastNameVo("Petrov"),
+        "is_superuser": False,
+        "is_active": True,
+    }
+
+    return {
+        ROUNDTRIP: lambda: roundtrip(PAYLOAD),
+        "vo.UserIdVo": lambda: UserIdVo(user_id),
+        "vo.UserCreatedAtVo": lambda: UserCreatedAtVo(now),
+        "vo.UserFirstNameVo": lambda: UserFirstNameVo("Ivan"),
+        "vo.UserEmailVo": lambda: UserEmailVo(PAYLOAD["email"]),
+        "vo.PasswordHashVo.from_hash": lambda: PasswordHashVo.from_hash(PASSWORD_HASH),
+        "vo.PasswordHashVo.from_trusted": lambda: PasswordHashVo.from_trusted(PASSWORD_HASH),
+        "vo.password_rules": lambda: PasswordHashVo._validate_plain(PAYLOAD["password"]),
+        "entity.UserEntity": lambda: UserEntity(id_=UserIdVo(user_id), **vo_kwargs),
+        "entity.UserEntity.from_trusted": lambda: UserEntity.from_trusted(
+            id_=UserIdVo(user_id), **vo_kwargs
+        ),
+        "api.UserCreateSchema.model_validate": lambda: UserCreateSchema.model_validate(PAYLOAD),
+        "api.schema_to_dto": lambda: UserApiMapper.schema_to_dto(schema),
+        "domain.input_dto_to_entity": lambda: UserDomainMapper.input_dto_to_entity(
+            input_dto, password_vo
+        ),
+        "data.entity_to_model": lambda: UserModelMapper.entity_to_model(entity),
+        "data.entity_to_record": lambda: UserModelMapper.entity_to_record(entity),
+        "data.model_to_entity": lambda: UserModelMapper.model_to_entity(model),
+        "domain.entity_to_output_dto": lambda: UserDomainMapper.entity_to_output_dto(entity),
+        "api.dto_to_schema": lambda: UserApiMapper.dto_to_schema(output_dto),
+        "api.UserResponseSchema.model_dump_json": lambda: response.model_dump_json(),
+        "api.dto_to_payload": lambda: UserApiMapper.dto_to_payload(output_dto),
+        "api.to_json(payload)": lambda: to_json(payload),
+    }
+
+
+def measure(func: Callable[[], object]) -> float:
+    timings = timeit.repeat(func, number=NUMBER, repeat=REPEAT)
+    return min(timings) / NUMBER * 1_000_000
+
+
+def load_baseline() -> dict:
+    if not BASELINE_PATH.exists():
+        return {}
+    return json.loads(BASELINE_PATH.read_text())
+
+
+def save_baseline(results: dict[str, float]) -> None:
+    BASELINE_PATH.parent.mkdir(exist_ok=True)
+    baseline = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {name: round(value, 3) for name, value in results.items()},
+    }
+    BASELINE_PATH.write_text(json.dumps(baseline, indent=2) + "\n")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--save", action="store_true", help="записать результаты как базу")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    parser.add_argument("-k", dest="pattern", default="", help="подстрока имени кейса")
+    args = parser.parse_args()
+
+    cases = {name: func for name, func in make_cases().items() if args.pattern in name}
+    baseline = load_baseline()
+    expected = baseline.get("results", {})
+    if expected and baseline.get("python") != platform.python_version():
+        print(f"база снята на Python {baseline['python']}, сравнение приблизительное")
+
+    results: dict[str, float] = {}
+    regressions: list[str] = []
+    print(f"{'case':<40} {'us/call':>9} {'base':>9} {'delta':>8} {'share':>7}")
+    for name, func in cases.items():
+        results[name] = value = measure(func)
+        base = expected.get(name)
+        delta = f"{value / base - 1:+8.1%}" if base else f"{'-':>8}"
+        if base and value > base * (1 + args.threshold) and value - base > MIN_DELTA_US:
+            regressions.append(name)
+        base_str = f"{base:9.2f}" if base else f"{'-':>9}"
+        roundtrip_us = results.get(ROUNDTRIP) or expected.get(ROUNDTRIP)
+        share = f"{value / roundtrip_us:7.1%}" if roundtrip_us else f"{'-':>7}"
+        print(f"{name:<40} {value:9.2f} {base_str} {delta} {share}")
+
+    if args.save:
+        save_baseline({**expected, **results})
+        print(f"база сохранена в {BASELINE_PATH}")
+        return 0
+
+    if regressions:
+        print(f"регрессия больше {args.threshold:.0%}: {', '.join(regressions)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Строк в секунду на чтении users: ORM-путь против проекции колонок.
+
+"orm" - select(UserModel) -> UserModelMapper -> UserDomainMapper (путь UserRepository),
+"projection" - select(*USER_OUTPUT_COLUMNS) -> UserRowMapper (путь UserQueryService).
+
+Запросы идут в SQLite в памяти, чтобы измерить именно затраты на стороне Python:
+ORM-инстансы, identity map и маппинг. Сеть и Postgres в цифры не входят.
+
+Запуск из backend/ (нужны переменные окружения БД, как для приложения):
+    python -m benchmarks.read_path
+"""
+
+import timeit
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+
+from src.data_access.mappers.user_mapper import UserModelMapper
+from src.data_access.mappers.user_row_mapper import USER_OUTPUT_COLUMNS, UserRowMapper
+from src.data_access.models import Base, UserModel
+from src.domain.user.mappers import UserDomainMapper
+
+ROWS = 5_000
+REPEAT = 5
+
+
+def fill(session: Session, count: int) -> None:
+    now = datetime.now(UTC)
+    session.execute(
+        insert(UserModel),
+        [
+            {
+                "id": uuid.uuid4(),
+                "email": f"user{i}@example.com",
+                "password": "$argon2id$v=19$m=65536,t=3,p=4$c2FsdA$aGFzaA",
+                "first_name": "Ivan",
+                "last_name": "Petrov",
+                "is_superuser": False,
+                "is_active": True,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(count)
+        ],
+    )
+    session.commit()
+
+
+def orm_path(session: Session) -> list:
+    session.expunge_all()  # Каждый запрос обычно идёт в новой сессии с пустой identity map
+    models = session.execute(select(UserModel)).scalars().all()
+    return [
+        UserDomainMapper.entity_to_output_dto(UserModelMapper.model_to_entity(model))
+        for model in models
+    ]
+
+
+def projection_path(session: Session) -> list:
+    rows = session.execute(select(*USER_OUTPUT_COLUMNS))
+    return [UserRowMapper.row_to_output_dto(row) for row in rows]
+
+
+def bench(name: str, func, session: Session) -> float:
+    func(session)  # Прогрев кеша скомпилированных запросов
+    timings = timeit.repeat(lambda: func(session), number=1, repeat=REPEAT)
+    rows_per_sec = ROWS / min(timings)
+    print(f"{name:<11} {rows_per_sec:12,.0f} rows/s")
+    return rows_per_sec
+
+
+def main() -> None:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        fill(session, ROWS)
+        before = bench("orm", orm_path, session)
+        after = bench("projection", projection_path, session)
+    print(f"speedup     {after / before:12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
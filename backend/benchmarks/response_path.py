@@ -0,0 +1,112 @@
+"""
+CPU на сериализацию ответа: прежний путь через response_model против FastJSONResponse.
+
+"response_model" - UserApiMapper -> pydantic-схема -> повторная валидация FastAPI
+(serialize_response по response_field роута) -> JSONResponse (json.dumps),
+"fast" - UserApiMapper.*_to_payload -> FastJSONResponse (pydantic_core.to_json).
+Оба пути берут response_field реальных роутов, тела ответов сверяются перед замером.
+
+Запуск из backend/ (нужны переменные окружения БД, как для приложения):
+    python -m benchmarks.response_path
+"""
+
+import json
+import timeit
+import uuid
+from datetime import UTC, datetime
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute, serialize_response
+
+from src.api.responses import FastJSONResponse
+from src.api.user.mappers import UserApiMapper
+from src.api.user.pagination import encode_cursor
+from src.api.user.schemas import UserPageSchema
+from src.domain.user.dtos import UserOutputDto, UserPageDto
+from src.main import create_app
+
+PAGE_SIZE = 50
+NUMBER = 2_000
+REPEAT = 5
+
+
+def make_dto(index: int) -> UserOutputDto:
+    now = datetime.now(UTC)
+    return UserOutputDto(
+        id=uuid.uuid4(),
+        email=f"user{index}@example.com",
+        created_at=now,
+        updated_at=now,
+        first_name="Ivan",
+        last_name="Petrov",
+    )
+
+
+def route_field(app, path: str, method: str):
+    for route in app.routes:
+        if isinstance(route, APIRoute) and route.path == path and method in route.methods:
+            return route.response_field
+    raise LookupError(f"{method} {path}")
+
+
+def response_model_body(field, content) -> bytes:
+    coroutine = serialize_response(field=field, response_content=content)
+    # В serialize_response нет await, поэтому корутина завершается на первом send
+    try:
+        coroutine.send(None)
+    except StopIteration as result:
+        return JSONResponse(result.value).body
+    raise RuntimeError("serialize_response suspended")
+
+
+def page_to_schema(page: UserPageDto) -> UserPageSchema:
+    return UserPageSchema(
+        items=[UserApiMapper.dto_to_schema(item) for item in page.items],
+        next_cursor=encode_cursor(page.next_cursor),
+    )
+
+
+def bench(name: str, func) -> float:
+    timings = timeit.repeat(func, number=NUMBER, repeat=REPEAT)
+    per_call_us = min(timings) / NUMBER * 1_000_000
+    print(f"{name:<28} {per_call_us:9.2f} us/response")
+    return per_call_us
+
+
+def compare(title: str, before, after) -> None:
+    assert json.loads(before()) == json.loads(after()), f"{title}: тела ответов различаются"
+    slow = bench(f"{title} response_model", before)
+    fast = bench(f"{title} fast", after)
+    print(f"{title + ' speedup':<28} {slow / fast:9.2f}x")
+
+
+def main() -> None:
+    user = make_dto(0)
+    users = [make_dto(i) for i in range(PAGE_SIZE)]
+    page = UserPageDto(items=users, next_cursor=(users[-1].created_at, users[-1].id))
+    app = create_app()
+    user_field = route_field(app, "/api/v1/users/{user_id}", "GET")
+    page_field = route_field(app, "/api/v1/users/", "GET")
+    search_field = route_field(app, "/api/v1/users/search", "GET")
+
+    compare(
+        "user",
+        lambda: response_model_body(user_field, UserApiMapper.dto_to_schema(user)),
+        lambda: FastJSONResponse(UserApiMapper.dto_to_payload(user)).body,
+    )
+    compare(
+        f"page[{PAGE_SIZE}]",
+        lambda: response_model_body(page_field, page_to_schema(page)),
+        lambda: FastJSONResponse(UserApiMapper.page_dto_to_payload(page)).body,
+    )
+    compare(
+        f"search[{PAGE_SIZE}]",
+        lambda: response_model_body(
+            search_field, [UserApiMapper.dto_to_schema(item) for item in users]
+        ),
+        lambda: FastJSONResponse([UserApiMapper.dto_to_payload(item) for item in users]).body,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Писем в секунду: новое SMTP-соединение на каждое письмо против SMTPConnectionPool.
+
+Сервер - локальный aiosmtpd (dev-зависимость) с AUTH без TLS, поэтому в цифры входят
+TCP-подключение, EHLO и LOGIN, но не TLS-рукопожатие и не сетевые задержки:
+на реальном SMTP-сервере разница больше.
+
+Запуск из backend/:
+    uv run python -m benchmarks.smtp_throughput
+"""
+
+import asyncio
+import logging
+import socket
+import time
+from email.message import EmailMessage
+
+from aiosmtpd.controller import Controller
+from aiosmtpd.smtp import AuthResult
+
+from src.config.smtp_settings import SMTPSettings
+from src.core.bg_tasks.smtp_pool import SMTPConnectionPool
+from src.core.bg_tasks.utils import connect_smtp_and_send_email
+
+MESSAGES = 500
+CONCURRENCY = 4
+
+
+class _SinkHandler:
+    async def handle_DATA(self, server, session, envelope) -> str:
+        return "250 OK"
+
+
+def _accept_any(server, session, envelope, mechanism, auth_data) -> AuthResult:
+    return AuthResult(success=True)
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def make_message(index: int) -> EmailMessage:
+    message = EmailMessage()
+    message["Subject"] = f"benchmark {index}"
+    message["From"] = "bench@example.com"
+    message["To"] = "admin@example.com"
+    message.set_content("Рег пользак с мылом: user@example.com")
+    return message
+
+
+async def run(name: str, send) -> float:
+    queue: asyncio.Queue[int] = asyncio.Queue()
+    for index in range(MESSAGES):
+        queue.put_nowait(index)
+
+    async def worker() -> None:
+        while not queue.empty():
+            await send(make_message(queue.get_nowait()))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+    rate = MESSAGES / (time.perf_counter() - started)
+    print(f"{name:<16} {rate:10,.0f} msg/s")
+    return rate
+
+
+async def main() -> None:
+    # aiosmtpd сам пишет warning про устаревший Session.login_data на каждый AUTH
+    logging.getLogger("mail.log").setLevel(logging.ERROR)
+    port = free_port()
+    controller = Controller(
+        _SinkHandler(),
+        hostname="127.0.0.1",
+        port=port,
+        authenticator=_accept_any,
+        auth_require_tls=False,
+    )
+    controller.start()
+    config = SMTPSettings(
+        host="127.0.0.1",
+        port=port,
+        user="bench",
+        password="bench",
+        start_tls=False,
+        pool_size=CONCURRENCY,
+    )
+    try:
+        before = await run(
+            "per-message", lambda message: connect_smtp_and_send_email(config, message)
+        )
+        pool = SMTPConnectionPool(config)
+        after = await run("pooled", pool.send_message)
+        await pool.close()
+        print(f"speedup          {after / before:10.2f}x")
+    finally:
+        controller.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,139 @@
+"""
+Пакетная проверка значений (validate_many) против конструкторов VO.
+
+Сначала на FUZZ_ROWS случайных значений (включая граничные) сверяются решения:
+код ошибки validate_many должен совпадать с AppError.CODE исключения конструктора VO,
+а None - с успешным созданием. Затем замеряется время на столбец из COLUMN_ROWS значений
+с долей невалидных INVALID_SHARE.
+
+Запуск из backend/:
+    python -m benchmarks.validation
+    python -m benchmarks.validation --seed 7 --fuzz-rows 200000
+"""
+
+import argparse
+import random
+import string
+import sys
+import timeit
+import uuid
+from datetime import UTC, datetime
+
+from src.base_exceptions import AppError
+from src.domain.user.value_objects import (
+    UserCreatedAtVo,
+    UserEmailVo,
+    UserFirstNameVo,
+    UserIdVo,
+)
+from src.shared.validation import validate_many
+from src.shared.value_objects import PositiveIntVo
+
+FUZZ_ROWS = 50_000
+COLUMN_ROWS = 10_000
+INVALID_SHARE = 0.1
+REPEAT = 5
+
+ALPHABET = string.ascii_letters + string.digits + ".@ _-+\t"
+EDGE_STRINGS = [
+    "",
+    " ",
+    "@",
+    "a@b",
+    "a@b.c",
+    " a@b.c ",
+    ".a@b.c",
+    "a.@b.c",
+    "a..b@c.d",
+    "a@@b.c",
+    "a@b@c.d",
+    "@b.c",
+    "a@.",
+    "a@b.",
+    "ab@c.d" + "e" * 250,
+    "é@b.c",
+    "a" * 31,
+]
+
+
+def random_string(rng: random.Random) -> str:
+    if rng.random() < 0.5:
+        local = "".join(rng.choices(ALPHABET, k=rng.randint(0, 12)))
+        domain = "".join(rng.choices(ALPHABET, k=rng.randint(0, 12)))
+        return f"{local}@{domain}"
+    return "".join(rng.choices(ALPHABET, k=rng.randint(0, 300 if rng.random() < 0.05 else 40)))
+
+
+def random_value(rng: random.Random) -> object:
+    roll = rng.random()
+    if roll < 0.1:
+        return rng.choice(EDGE_STRINGS)
+    if roll < 0.15:
+        return rng.choice([None, 0, -1, 1, True, 2.5, b"a@b.c", uuid.uuid4(), datetime.now(UTC)])
+    if roll < 0.2:
+        return rng.randint(-5, 5)
+    return random_string(rng)
+
+
+def vo_code(vo_cls: type, value: object) -> str | None:
+    try:
+        vo_cls(value)
+    except AppError as e:
+        return e.CODE
+    return None
+
+
+def check_equivalence(rng: random.Random, rows: int) -> int:
+    values = [random_value(rng) for _ in range(rows)]
+    mismatches = 0
+    for vo_cls in (UserEmailVo, UserFirstNameVo, UserIdVo, UserCreatedAtVo, PositiveIntVo):
+        expected = [vo_code(vo_cls, value) for value in values]
+        diff = [
+            (value, want, got)
+            for value, want, got in zip(
+                values, expected, validate_many(vo_cls, values), strict=True
+            )
+            if want != got
+        ]
+        for value, want, got in diff[:10]:
+            print(f"{vo_cls.__name__}: {value!r} - VO {want}, validate_many {got}")
+        status = f"{len(diff)} MISMATCHES" if diff else "decisions match"
+        print(f"{vo_cls.__name__:<18} {rows} values, {expected.count(None)} accepted: {status}")
+        mismatches += len(diff)
+    return mismatches
+
+
+def make_column(rng: random.Random) -> list[str]:
+    column = [f"user{i}@example.com" for i in range(COLUMN_ROWS)]
+    for index in rng.sample(range(COLUMN_ROWS), int(COLUMN_ROWS * INVALID_SHARE)):
+        column[index] = rng.choice(EDGE_STRINGS[:4])
+    return column
+
+
+def per_object(column: list[str]) -> list[str | None]:
+    return [vo_code(UserEmailVo, value) for value in column]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--fuzz-rows", type=int, default=FUZZ_ROWS)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    if check_equivalence(rng, args.fuzz_rows):
+        return 1
+
+    column = make_column(rng)
+    assert per_object(column) == validate_many(UserEmailVo, column)
+    slow = min(timeit.repeat(lambda: per_object(column), number=1, repeat=REPEAT))
+    fast = min(timeit.repeat(lambda: validate_many(UserEmailVo, column), number=1, repeat=REPEAT))
+    print(f"\nUserEmailVo, {COLUMN_ROWS} values, {INVALID_SHARE:.0%} invalid")
+    print(f"{'per-object VO':<20} {slow / COLUMN_ROWS * 1e6:8.2f} us/value")
+    print(f"{'validate_many':<20} {fast / COLUMN_ROWS * 1e6:8.2f} us/value")
+    print(f"{'speedup':<20} {slow / fast:8.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""users email normalized
+
+Revision ID: 5f0c3a9e41b7
+Revises: d27da7c6bfe1
+Create Date: 2026-10-17 13:02:17.540981
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f0c3a9e41b7'
+down_revision: Union[str, None] = 'd27da7c6bfe1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Генерируемая колонка: ADD COLUMN переписывает таблицу под ACCESS EXCLUSIVE
+    op.add_column(
+        'users',
+        sa.Column(
+            'email_normalized',
+            sa.String(),
+            sa.Computed('lower(email)', persisted=True),
+            nullable=False,
+        ),
+    )
+    # Упадёт, если в users уже есть email, отличающиеся только регистром:
+    # такие дубли нужно разобрать вручную до миграции
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_email_normalized',
+            'users',
+            ['email_normalized'],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+    # Уникальный индекс по lower(email) строже, старый uq_users_email больше не нужен
+    op.drop_constraint('uq_users_email', 'users', type_='unique')
+
+
+def downgrade() -> None:
+    op.create_unique_constraint('uq_users_email', 'users', ['email'])
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_users_email_normalized', table_name='users', postgresql_concurrently=True
+        )
+    op.drop_column('users', 'email_normalized')
@@ -0,0 +1,46 @@
+"""users search trgm indexes
+
+Revision ID: a93e1d0b7c52
+Revises: 5f0c3a9e41b7
+Create Date: 2026-10-17 14:21:05.113472
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a93e1d0b7c52'
+down_revision: Union[str, None] = '5f0c3a9e41b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = ('email', 'first_name', 'last_name')
+
+
+def upgrade() -> None:
+    # Нужны права на CREATE EXTENSION (владелец БД или суперпользователь)
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # GiST, а не GIN: индекс обслуживает и ILIKE, и ORDER BY column <-> term
+    with op.get_context().autocommit_block():
+        for column in SEARCH_COLUMNS:
+            op.create_index(
+                f'ix_users_{column}_trgm_gist',
+                'users',
+                [column],
+                unique=False,
+                postgresql_using='gist',
+                postgresql_ops={column: 'gist_trgm_ops'},
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    # Расширение оставляем: им могут пользоваться другие объекты БД
+    with op.get_context().autocommit_block():
+        for column in SEARCH_COLUMNS:
+            op.drop_index(
+                f'ix_users_{column}_trgm_gist', table_name='users', postgresql_concurrently=True
+            )
@@ -0,0 +1,43 @@
+"""users list filter partial indexes
+
+Revision ID: b58d0e3a7f16
+Revises: c41e8b2f7d09
+Create Date: 2026-10-17 23:51:37.209384
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b58d0e3a7f16'
+down_revision: Union[str, None] = 'c41e8b2f7d09'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Индекс -> условие: GET /users?is_superuser=true и ?is_active=false
+PARTIAL_INDEXES = {
+    'ix_users_superusers_created_at_id': 'is_superuser',
+    'ix_users_inactive_created_at_id': 'NOT is_active',
+}
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, condition in PARTIAL_INDEXES.items():
+            op.create_index(
+                name,
+                'users',
+                ['created_at', 'id'],
+                unique=False,
+                postgresql_where=sa.text(condition),
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name in PARTIAL_INDEXES:
+            op.drop_index(name, table_name='users', postgresql_concurrently=True)
@@ -0,0 +1,34 @@
+"""outbox
+
+Revision ID: c41e8b2f7d09
+Revises: a93e1d0b7c52
+Create Date: 2026-10-17 21:32:44.520917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e8b2f7d09'
+down_revision: Union[str, None] = 'a93e1d0b7c52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('outbox',
+    sa.Column('id', sa.BigInteger(), sa.Identity(always=False), nullable=False),
+    sa.Column('task_id', sa.UUID(), nullable=False),
+    sa.Column('task_name', sa.String(length=255), nullable=False),
+    sa.Column('kwargs', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('id', name=op.f('pk_outbox'))
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('outbox')
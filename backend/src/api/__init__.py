@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 
+from src.api.auth.controllers import router as auth_router
 from src.api.first import router as first_router
 from src.api.user.controllers import router as user_router
 
@@ -8,3 +9,4 @@ def init_routes(app: FastAPI) -> None:
     prefix: str = "/api/v1"
     app.include_router(router=first_router, prefix=f"{prefix}", tags=["First step"])
     app.include_router(router=user_router, prefix=f"{prefix}/users", tags=["Users"])
+    app.include_router(router=auth_router, prefix=f"{prefix}/auth", tags=["Auth"])
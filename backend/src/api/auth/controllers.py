@@ -0,0 +1,61 @@
+from dishka.integrations.fastapi import DishkaRoute, FromDishka
+from fastapi import APIRouter, HTTPException
+
+from src.api.auth.dependencies import CurrentPrincipal, unauthorized
+from src.api.auth.mappers import AuthApiMapper
+from src.api.auth.schemas import LoginSchema, PrincipalSchema, RefreshSchema, TokenPairSchema
+from src.api.responses import FastJSONResponse
+from src.apps.auth.use_cases.login_use_case import LoginUseCase
+from src.apps.auth.use_cases.refresh_use_case import RefreshTokenUseCase
+from src.shared.exceptions import (
+    InactiveUserError,
+    InvalidCredentialsError,
+    InvalidTokenError,
+    PasswordHasherOverloadedError,
+)
+
+router = APIRouter(route_class=DishkaRoute)
+
+
+@router.post(
+    "/login",
+    status_code=200,
+    response_model=TokenPairSchema,
+    responses={
+        401: {"description": "Invalid email or password"},
+        403: {"description": "User account is disabled"},
+        503: {"description": "Password hasher is overloaded"},
+    },
+)
+async def login(credentials: LoginSchema, use_case: FromDishka[LoginUseCase]) -> FastJSONResponse:
+    try:
+        tokens = await use_case.execute(AuthApiMapper.login_schema_to_dto(credentials))
+    except InvalidCredentialsError as e:
+        raise unauthorized(e.message) from e
+    except InactiveUserError as e:
+        raise HTTPException(status_code=403, detail=e.message) from e
+    except PasswordHasherOverloadedError as e:
+        raise HTTPException(status_code=503, detail=e.message, headers={"Retry-After": "1"}) from e
+    return FastJSONResponse(AuthApiMapper.token_pair_to_payload(tokens))
+
+
+@router.post(
+    "/refresh",
+    status_code=200,
+    response_model=TokenPairSchema,
+    responses={401: {"description": "Invalid refresh token"}},
+)
+async def refresh(
+    body: RefreshSchema, use_case: FromDishka[RefreshTokenUseCase]
+) -> FastJSONResponse:
+    try:
+        tokens = await use_case.execute(body.refresh_token)
+    except (InvalidTokenError, InactiveUserError) as e:
+        raise unauthorized(e.message) from e
+    return FastJSONResponse(AuthApiMapper.token_pair_to_payload(tokens))
+
+
+@router.get("/me", status_code=200, response_model=PrincipalSchema)
+async def me(principal: CurrentPrincipal) -> FastJSONResponse:
+    """Данные из access-токена, без обращения к БД"""
+    return FastJSONResponse(AuthApiMapper.principal_to_payload(principal))
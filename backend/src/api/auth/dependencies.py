@@ -0,0 +1,43 @@
+from typing import Annotated
+
+from fastapi import Depends, HTTPException, Request
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from src.apps.auth.dtos import PrincipalDto
+from src.apps.auth.itokens import ITokenService
+from src.shared.exceptions import InvalidTokenError
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+def unauthorized(detail: str) -> HTTPException:
+    return HTTPException(status_code=401, detail=detail, headers={"WWW-Authenticate": "Bearer"})
+
+
+async def get_current_principal(
+    request: Request,
+    credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(bearer_scheme)],
+) -> PrincipalDto:
+    """
+    Проверяет access-токен только по подписи и сроку: ни БД, ни Redis.
+    Сессия БД запроса при этом не открывается, соединение из пула не берётся.
+    """
+    if credentials is None:
+        raise unauthorized("Not authenticated")
+    tokens = await request.state.dishka_container.get(ITokenService)
+    try:
+        return tokens.decode_access(credentials.credentials)
+    except InvalidTokenError as e:
+        raise unauthorized(e.message) from e
+
+
+async def get_current_superuser(
+    principal: Annotated[PrincipalDto, Depends(get_current_principal)],
+) -> PrincipalDto:
+    if not principal.is_superuser:
+        raise HTTPException(status_code=403, detail="Superuser required")
+    return principal
+
+
+CurrentPrincipal = Annotated[PrincipalDto, Depends(get_current_principal)]
+CurrentSuperuser = Annotated[PrincipalDto, Depends(get_current_superuser)]
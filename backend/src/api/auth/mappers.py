@@ -0,0 +1,26 @@
+from src.api.auth.schemas import LoginSchema
+from src.apps.auth.dtos import LoginInputDto, PrincipalDto, TokenPairDto
+
+
+class AuthApiMapper:
+    @staticmethod
+    def login_schema_to_dto(schema: LoginSchema) -> LoginInputDto:
+        return LoginInputDto(email=schema.email, password=schema.password)
+
+    @staticmethod
+    def token_pair_to_payload(dto: TokenPairDto) -> dict:
+        """Тело TokenPairSchema без создания модели, для FastJSONResponse"""
+        return {
+            "access_token": dto.access_token,
+            "refresh_token": dto.refresh_token,
+            "token_type": "bearer",
+            "expires_in": dto.expires_in,
+        }
+
+    @staticmethod
+    def principal_to_payload(dto: PrincipalDto) -> dict:
+        return {
+            "user_id": dto.user_id,
+            "email": dto.email,
+            "is_superuser": dto.is_superuser,
+        }
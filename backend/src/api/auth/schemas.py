@@ -0,0 +1,26 @@
+from typing import Literal
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class LoginSchema(BaseModel):
+    email: str
+    password: str
+
+
+class RefreshSchema(BaseModel):
+    refresh_token: str
+
+
+class TokenPairSchema(BaseModel):
+    access_token: str
+    refresh_token: str
+    token_type: Literal["bearer"] = "bearer"
+    expires_in: int
+
+
+class PrincipalSchema(BaseModel):
+    user_id: UUID
+    email: str
+    is_superuser: bool
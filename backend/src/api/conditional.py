@@ -0,0 +1,66 @@
+"""
+Условный GET (RFC 9110, 13.1): валидаторы ETag и Last-Modified и ответ 304.
+
+ETag строится из id и updated_at ресурса, поэтому проверить его можно, не загружая
+сам ресурс. ETag слабый (W/): тело не сравнивается побайтно, а nginx при gzip всё равно
+превращает сильный ETag в слабый.
+"""
+
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime, parsedate_to_datetime
+from uuid import UUID
+
+from fastapi import Response
+from starlette.datastructures import Headers
+
+EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+# Клиенты и nginx могут хранить ответ, но перед каждым использованием сверяют валидаторы
+CACHE_CONTROL = "no-cache"
+
+
+def make_etag(resource_id: UUID, updated_at: datetime) -> str:
+    # Целые микросекунды: float timestamp() может округлить их по-разному
+    version = (updated_at - EPOCH) // timedelta(microseconds=1)
+    return f'W/"{resource_id.hex}-{version}"'
+
+
+def validator_headers(resource_id: UUID, updated_at: datetime) -> dict[str, str]:
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=UTC)
+    return {
+        "ETag": make_etag(resource_id, updated_at),
+        "Last-Modified": format_datetime(updated_at.astimezone(UTC), usegmt=True),
+        "Cache-Control": CACHE_CONTROL,
+    }
+
+
+def has_conditions(headers: Headers) -> bool:
+    return "if-none-match" in headers or "if-modified-since" in headers
+
+
+def is_not_modified(headers: Headers, resource_id: UUID, updated_at: datetime) -> bool:
+    """
+    If-None-Match (слабое сравнение) важнее If-Modified-Since: второй проверяется,
+    только если первого нет. Last-Modified точен до секунды.
+    """
+    if updated_at.tzinfo is None:
+        updated_at = updated_at.replace(tzinfo=UTC)
+    if_none_match = headers.get("if-none-match")
+    if if_none_match is not None:
+        etag = make_etag(resource_id, updated_at).removeprefix("W/")
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in candidates or etag in candidates
+
+    if_modified_since = headers.get("if-modified-since")
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    return updated_at.replace(microsecond=0) <= since
+
+
+def not_modified(resource_id: UUID, updated_at: datetime) -> Response:
+    # 304 повторяет валидаторы и Cache-Control, которые были бы у ответа 200
+    return Response(status_code=304, headers=validator_headers(resource_id, updated_at))
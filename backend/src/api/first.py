@@ -7,7 +7,7 @@ router = APIRouter(route_class=DishkaRoute)
 
 
 @router.get("/hello")  # простой URL
-async def greet(session: FromDishka[AsyncSession]) -> str:
+async def greet() -> str:
     return "Answer: Good morning AXAXAAX"
 
 
@@ -0,0 +1,68 @@
+import time
+
+from fastapi import APIRouter, FastAPI, Response
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_FLIGHT, metrics_registry
+
+router = APIRouter()
+
+# Произвольный метод из запроса не должен порождать новую серию
+KNOWN_METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"}
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    return Response(generate_latest(metrics_registry()), media_type=CONTENT_TYPE_LATEST)
+
+
+def route_label(scope: Scope, root_path: str) -> str:
+    """
+    Шаблон пути вместо самого пути, чтобы id в URL не плодили серии.
+    Для смонтированных приложений (sqladmin) - префикс монтирования.
+    """
+    route = scope.get("route")
+    if route is not None:
+        return route.path_format
+    mount = scope.get("root_path", "")[len(root_path) :]
+    return f"{mount}/*" if mount else UNMATCHED_ROUTE
+
+
+class PrometheusMiddleware:
+    """Чистый ASGI: латентность по шаблону роута и число запросов в обработке."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        root_path = scope.get("root_path", "")
+        # Если ответ так и не начался, наружу уйдёт 500 от ServerErrorMiddleware
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        method = scope["method"] if scope["method"] in KNOWN_METHODS else "OTHER"
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            HTTP_REQUEST_DURATION.labels(method, route_label(scope, root_path), status).observe(
+                time.perf_counter() - started
+            )
+
+
+def init_metrics(app: FastAPI) -> None:
+    app.add_middleware(PrometheusMiddleware)
+    app.include_router(router=router, tags=["Metrics"])
@@ -0,0 +1,18 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON через pydantic_core.to_json: UUID, datetime и dataclass сериализуются в Rust,
+    без jsonable_encoder и json.dumps.
+
+    Если эндпоинт возвращает Response сам, FastAPI не валидирует ответ по response_model
+    второй раз; response_model остаётся только для OpenAPI. Поэтому содержимое должно
+    совпадать со схемой - собирайте его в мапперах рядом со схемами.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
@@ -0,0 +1,56 @@
+import logging
+
+from fastapi import FastAPI
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.config.sql_profiler_settings import SqlProfilerSettings
+from src.data_access.sql_profiler import SqlProfile, current_sql_profile
+
+logger = logging.getLogger(__name__)
+
+
+class SqlProfilerMiddleware:
+    """
+    Считает SQL-запросы и время БД за HTTP-запрос (заголовки X-DB-Queries и X-DB-Time в мс)
+    и логирует одинаковые запросы, повторённые repeat_threshold раз и больше (N+1).
+    """
+
+    def __init__(self, app: ASGIApp, config: SqlProfilerSettings) -> None:
+        self.app = app
+        self.config = config
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        profile = SqlProfile()
+
+        async def send_wrapper(message: Message) -> None:
+            # К началу ответа запросы эндпоинта уже выполнены; COMMIT сессии идёт позже,
+            # при закрытии контейнера dishka, и через курсор не проходит
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-DB-Queries"] = str(profile.queries)
+                headers["X-DB-Time"] = f"{profile.total_time * 1000:.1f}"
+            await send(message)
+
+        token = current_sql_profile.set(profile)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            current_sql_profile.reset(token)
+            for statement, count in profile.repeated(self.config.repeat_threshold):
+                logger.warning(
+                    "Possible N+1 in %s %s: %d identical statements: %s",
+                    scope["method"],
+                    scope["path"],
+                    count,
+                    statement,
+                )
+
+
+def init_sql_profiler(app: FastAPI, config: SqlProfilerSettings) -> None:
+    if config.enabled:
+        app.add_middleware(SqlProfilerMiddleware, config=config)
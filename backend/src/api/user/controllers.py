@@ -1,33 +1,189 @@
-import os
+from typing import Annotated
 from uuid import UUID
 
 from dishka.integrations.fastapi import DishkaRoute, FromDishka
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query, Request, Response
 
+from src.api.conditional import has_conditions, is_not_modified, not_modified, validator_headers
+from src.api.responses import FastJSONResponse
+from src.api.user.importers import iter_csv_rows, iter_ndjson_rows
 from src.api.user.mappers import UserApiMapper
-from src.api.user.schemas import UserCreateSchema, UserResponseSchema
+from src.api.user.pagination import decode_cursor
+from src.api.user.schemas import (
+    MAX_BATCH_IDS,
+    SearchTerm,
+    UserBatchGetSchema,
+    UserBatchSchema,
+    UserCreateSchema,
+    UserImportReportSchema,
+    UserPageSchema,
+    UserResponseSchema,
+)
+from src.apps.outbox.ioutbox import IOutbox
+from src.apps.user.use_cases.bulk_import_use_case import UserBulkImportUseCase
 from src.apps.user.use_cases.create_use_case import UserCreateUseCase
 from src.apps.user.use_cases.get_by_id_use_case import UserGetByIdUseCase
-from src.core.bg_tasks.tasks import send_email_task
+from src.apps.user.use_cases.get_many_use_case import UserGetManyUseCase
+from src.apps.user.use_cases.get_updated_at_use_case import UserGetUpdatedAtUseCase
+from src.apps.user.use_cases.list_use_case import UserListUseCase
+from src.apps.user.use_cases.search_use_case import UserSearchUseCase
+from src.core.bg_tasks.names import NOTIFY_ADMIN_TASK
+from src.shared.exceptions import PasswordHasherOverloadedError, UserAlreadyExistsError
 
 router = APIRouter(route_class=DishkaRoute)
 
+IMPORT_CONTENT_TYPES = {
+    "application/x-ndjson": iter_ndjson_rows,
+    "application/jsonl": iter_ndjson_rows,
+    "text/csv": iter_csv_rows,
+}
+
+
+@router.get(
+    "/",
+    status_code=200,
+    response_model=UserPageSchema | UserBatchSchema,
+    responses={
+        200: {
+            "description": "UserPageSchema; with ?ids= - UserBatchSchema as in POST /batch-get "
+            "(items by id, not_found), limit and cursor are ignored"
+        }
+    },
+)
+async def list_users(
+    use_case: FromDishka[UserListUseCase],
+    get_many_use_case: FromDishka[UserGetManyUseCase],
+    limit: int = Query(default=50, ge=1, le=200),
+    cursor: str | None = Query(default=None, description="next_cursor предыдущей страницы"),
+    is_active: bool | None = None,
+    is_superuser: bool | None = None,
+    ids: list[UUID] | None = Query(
+        default=None,
+        max_length=MAX_BATCH_IDS,
+        description="только эти id: ответ как у POST /batch-get, limit и cursor не применяются",
+    ),
+) -> FastJSONResponse:
+    if ids:
+        # Не найденные и отфильтрованные is_active/is_superuser id попадают в not_found
+        users = await get_many_use_case.execute(ids, is_active=is_active, is_superuser=is_superuser)
+        return FastJSONResponse(UserApiMapper.batch_to_payload(users, ids))
+    page = await use_case.execute(
+        limit=limit,
+        cursor=decode_cursor(cursor),
+        is_active=is_active,
+        is_superuser=is_superuser,
+    )
+    return FastJSONResponse(UserApiMapper.page_dto_to_payload(page))
+
+
+@router.post("/batch-get", status_code=200, response_model=UserBatchSchema)
+async def batch_get(
+    body: UserBatchGetSchema, use_case: FromDishka[UserGetManyUseCase]
+) -> FastJSONResponse:
+    """До MAX_BATCH_IDS профилей за один запрос: кеш (MGET) и один SELECT ... id = ANY($1)"""
+    users = await use_case.execute(body.ids)
+    return FastJSONResponse(UserApiMapper.batch_to_payload(users, body.ids))
+
+
+@router.get("/search", status_code=200, response_model=list[UserResponseSchema])
+async def search_users(
+    use_case: FromDishka[UserSearchUseCase],
+    q: Annotated[SearchTerm, Query(description="подстрока email, имени или фамилии")],
+    limit: int = Query(default=20, ge=1, le=50),
+) -> FastJSONResponse:
+    users = await use_case.execute(term=q, limit=limit)
+    return FastJSONResponse([UserApiMapper.dto_to_payload(user) for user in users])
+
+
+@router.get(
+    "/{user_id}",
+    status_code=200,
+    response_model=UserResponseSchema,
+    responses={
+        304: {"description": "Not modified since the If-None-Match / If-Modified-Since version"},
+        404: {"description": "User not found"},
+    },
+)
+async def get_by_id(
+    user_id: UUID,
+    request: Request,
+    use_case: FromDishka[UserGetByIdUseCase],
+    updated_at_use_case: FromDishka[UserGetUpdatedAtUseCase],
+) -> Response:
+    # Опрос без изменений отвечает 304 по одному updated_at из кеша или БД, без профиля
+    if has_conditions(request.headers):
+        updated_at = await updated_at_use_case.execute(user_id)
+        if updated_at is not None and is_not_modified(request.headers, user_id, updated_at):
+            return not_modified(user_id, updated_at)
 
-@router.get("/{user_id}", status_code=200, response_model=UserResponseSchema)
-async def get_by_id(user_id: UUID, use_case: FromDishka[UserGetByIdUseCase]) -> UserResponseSchema:
     dto_out = await use_case.execute(user_id)
-    return UserApiMapper.dto_to_schema(dto_out)
+    if dto_out is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    headers = validator_headers(dto_out.id, dto_out.updated_at) if dto_out.updated_at else None
+    return FastJSONResponse(UserApiMapper.dto_to_payload(dto_out), headers=headers)
 
 
-@router.post("/", status_code=201, response_model=UserResponseSchema)
+@router.post(
+    "/",
+    status_code=201,
+    response_model=UserResponseSchema,
+    responses={
+        409: {"description": "User with this email already exists"},
+        503: {"description": "Password hasher is overloaded"},
+    },
+)
 async def create(
     user_data: UserCreateSchema,
     use_case: FromDishka[UserCreateUseCase],
-) -> UserResponseSchema:
-    dto_out = await use_case.execute(UserApiMapper.schema_to_dto(user_data))
-    email_to = [os.getenv("SMTP_EMAIL_TO")]
-    await send_email_task.kiq(
-        data=f"Рег пользак с мылом: {dto_out.email}",
-        email_to=email_to,
-    )
-    return UserApiMapper.dto_to_schema(dto_out)
+    outbox: FromDishka[IOutbox],
+) -> FastJSONResponse:
+    try:
+        dto_out = await use_case.execute(UserApiMapper.schema_to_dto(user_data))
+    except UserAlreadyExistsError as e:
+        raise HTTPException(status_code=409, detail=e.message) from e
+    except PasswordHasherOverloadedError as e:
+        raise HTTPException(status_code=503, detail=e.message, headers={"Retry-After": "1"}) from e
+    # Уведомление уйдёт в брокер через outbox: строка коммитится вместе с пользователем,
+    # а запрос не ждёт Redis. Воркер добавит его в сводку для администратора
+    await outbox.add(NOTIFY_ADMIN_TASK, {"text": f"Рег пользак с мылом: {dto_out.email}"})
+    return FastJSONResponse(UserApiMapper.dto_to_payload(dto_out), status_code=201)
+
+
+@router.post(
+    "/import",
+    status_code=200,
+    response_model=UserImportReportSchema,
+    responses={
+        503: {
+            "description": "Password hasher stayed overloaded; batches before it are imported, "
+            "a retry reports them as existing"
+        }
+    },
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                content_type: {"schema": {"type": "string", "format": "binary"}}
+                for content_type in IMPORT_CONTENT_TYPES
+            },
+        }
+    },
+)
+async def bulk_import(
+    request: Request,
+    use_case: FromDishka[UserBulkImportUseCase],
+) -> UserImportReportSchema:
+    """Потоковый импорт пользователей из NDJSON или CSV (email, password, first_name, last_name)"""
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    parser = IMPORT_CONTENT_TYPES.get(content_type)
+    if parser is None:
+        raise HTTPException(
+            status_code=415,
+            detail=f"Supported content types: {', '.join(IMPORT_CONTENT_TYPES)}",
+        )
+
+    try:
+        report = await use_case.execute(parser(request.stream()))
+    except PasswordHasherOverloadedError as e:
+        raise HTTPException(status_code=503, detail=e.message, headers={"Retry-After": "5"}) from e
+    return UserApiMapper.import_report_to_schema(report)
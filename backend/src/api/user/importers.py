@@ -0,0 +1,79 @@
+import codecs
+import csv
+import json
+from collections.abc import AsyncIterator
+from typing import Any
+
+from fastapi import HTTPException
+from pydantic import ValidationError
+
+from src.api.user.mappers import UserApiMapper
+from src.api.user.schemas import UserCreateSchema
+from src.domain.user.dtos import UserImportRowDto
+
+MAX_LINE_LENGTH = 64 * 1024
+
+
+async def _iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, str]]:
+    """Режет поток байтов на строки, не буферизуя тело запроса целиком."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    tail = ""
+    line_number = 0
+    async for chunk in chunks:
+        tail += decoder.decode(chunk)
+        *lines, tail = tail.split("\n")
+        for line in lines:
+            line_number += 1
+            yield line_number, line.rstrip("\r")
+        if len(tail) > MAX_LINE_LENGTH:
+            raise HTTPException(
+                status_code=413, detail=f"Line {line_number + 1} exceeds {MAX_LINE_LENGTH} bytes"
+            )
+
+    tail += decoder.decode(b"", final=True)
+    if tail:
+        yield line_number + 1, tail.rstrip("\r")
+
+
+def _to_row(line: int, data: Any) -> UserImportRowDto:
+    try:
+        schema = UserCreateSchema.model_validate(data)
+    except ValidationError as e:
+        error = "; ".join(
+            f"{'.'.join(str(loc) for loc in err['loc']) or 'row'}: {err['msg']}"
+            for err in e.errors()
+        )
+        return UserImportRowDto(line=line, error=error)
+    return UserImportRowDto(line=line, user=UserApiMapper.schema_to_dto(schema))
+
+
+async def iter_ndjson_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[UserImportRowDto]:
+    """Один JSON-объект на строку: {"email": ..., "password": ..., "first_name": ...}"""
+    async for line_number, line in _iter_lines(chunks):
+        if not line.strip():
+            continue
+        try:
+            data = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield UserImportRowDto(line=line_number, error=f"invalid JSON: {e.msg}")
+            continue
+        yield _to_row(line_number, data)
+
+
+async def iter_csv_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[UserImportRowDto]:
+    """CSV с заголовком в первой строке. Переводы строк внутри кавычек не поддерживаются."""
+    header: list[str] | None = None
+    async for line_number, line in _iter_lines(chunks):
+        if not line.strip():
+            continue
+        values = next(csv.reader([line]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield UserImportRowDto(
+                line=line_number,
+                error=f"expected {len(header)} columns, got {len(values)}",
+            )
+            continue
+        yield _to_row(line_number, {name: value or None for name, value in zip(header, values)})
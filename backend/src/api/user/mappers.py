@@ -1,11 +1,20 @@
-from src.api.user.schemas import UserCreateSchema, UserResponseSchema
-from src.domain.user.dtos import UserInputDto, UserOutputDto
+from uuid import UUID
+
+from src.api.user.pagination import encode_cursor
+from src.api.user.schemas import (
+    UserCreateSchema,
+    UserImportReportSchema,
+    UserImportRowErrorSchema,
+    UserResponseSchema,
+)
+from src.domain.user.dtos import UserImportReportDto, UserInputDto, UserOutputDto, UserPageDto
 
 
 class UserApiMapper:
     @staticmethod
     def dto_to_schema(dto: UserOutputDto) -> UserResponseSchema:
         return UserResponseSchema(
+            id=dto.id,
             email=dto.email,
             first_name=dto.first_name,
             last_name=dto.last_name,
@@ -15,6 +24,50 @@ class UserApiMapper:
             updated_at=dto.updated_at,
         )
 
+    @staticmethod
+    def dto_to_payload(dto: UserOutputDto) -> dict:
+        """Тело UserResponseSchema без создания модели, для FastJSONResponse"""
+        return {
+            "id": dto.id,
+            "first_name": dto.first_name,
+            "last_name": dto.last_name,
+            "email": dto.email,
+            "created_at": dto.created_at,
+            "updated_at": dto.updated_at,
+            "is_superuser": dto.is_superuser,
+            "is_active": dto.is_active,
+        }
+
+    @staticmethod
+    def page_dto_to_payload(dto: UserPageDto) -> dict:
+        """Тело UserPageSchema без создания моделей, для FastJSONResponse"""
+        return {
+            "items": [UserApiMapper.dto_to_payload(item) for item in dto.items],
+            "next_cursor": encode_cursor(dto.next_cursor),
+        }
+
+    @staticmethod
+    def batch_to_payload(users: dict[UUID, UserOutputDto], requested: list[UUID]) -> dict:
+        """Тело UserBatchSchema без создания моделей, для FastJSONResponse"""
+        return {
+            "items": {
+                str(user_id): UserApiMapper.dto_to_payload(dto) for user_id, dto in users.items()
+            },
+            "not_found": [user_id for user_id in dict.fromkeys(requested) if user_id not in users],
+        }
+
     @staticmethod
     def schema_to_dto(schema: UserCreateSchema) -> UserInputDto:
         return UserInputDto(**schema.__dict__)
+
+    @staticmethod
+    def import_report_to_schema(dto: UserImportReportDto) -> UserImportReportSchema:
+        return UserImportReportSchema(
+            total=dto.total,
+            created=dto.created,
+            failed=dto.failed,
+            errors=[
+                UserImportRowErrorSchema(line=error.line, error=error.error, email=error.email)
+                for error in dto.errors
+            ],
+        )
@@ -0,0 +1,26 @@
+import base64
+import binascii
+from datetime import datetime
+from uuid import UUID
+
+from fastapi import HTTPException
+
+
+def encode_cursor(cursor: tuple[datetime, UUID] | None) -> str | None:
+    """Непрозрачный курсор для клиента: base64url от "created_at|id"."""
+    if cursor is None:
+        return None
+    created_at, user_id = cursor
+    raw = f"{created_at.isoformat()}|{user_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str | None) -> tuple[datetime, UUID] | None:
+    if cursor is None:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, user_id = raw.split("|")
+        return datetime.fromisoformat(created_at), UUID(user_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
@@ -1,6 +1,14 @@
 from datetime import datetime
+from typing import Annotated
+from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, StringConstraints
+
+MAX_BATCH_IDS = 100  # id в одном batch-get и в ?ids= списка
+
+# Длина проверяется после strip: меньше 3 символов не даёт ни одной триграммы,
+# и индекс не помогает, а q="   " превратился бы в ILIKE '%%'
+SearchTerm = Annotated[str, StringConstraints(strip_whitespace=True, min_length=3, max_length=100)]
 
 
 class UserCreateSchema(BaseModel):
@@ -11,6 +19,7 @@ class UserCreateSchema(BaseModel):
 
 
 class UserResponseSchema(BaseModel):
+    id: UUID
     first_name: str | None
     last_name: str | None
     email: str
@@ -20,5 +29,32 @@ class UserResponseSchema(BaseModel):
     is_active: bool
 
 
+class UserPageSchema(BaseModel):
+    items: list[UserResponseSchema]
+    next_cursor: str | None
+
+
+class UserBatchGetSchema(BaseModel):
+    ids: list[UUID] = Field(min_length=1, max_length=MAX_BATCH_IDS)
+
+
+class UserBatchSchema(BaseModel):
+    items: dict[UUID, UserResponseSchema]
+    not_found: list[UUID]
+
+
 class UserUpdateSchema(BaseModel):
     pass
+
+
+class UserImportRowErrorSchema(BaseModel):
+    line: int
+    error: str
+    email: str | None
+
+
+class UserImportReportSchema(BaseModel):
+    total: int
+    created: int
+    failed: int
+    errors: list[UserImportRowErrorSchema]
@@ -1,14 +1,14 @@
 from fastapi import FastAPI
 from sqladmin import Admin
-from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 
 from src.apps.admin.user_admin import UserAdmin
-from src.config import db_settings
 
 
-def init_sql_admin(app: FastAPI) -> None:
-    """Инициализация SQLAdmin"""
-    engine = create_engine(url=db_settings.construct_sync_sqlalchemy_url)
-    admin = Admin(app=app, engine=engine)
+def init_sql_admin(app: FastAPI, engine: AsyncEngine) -> None:
+    """Инициализация SQLAdmin на AsyncEngine приложения: общий пул, без блокирующего I/O"""
+    # Отдельный sessionmaker: Admin перенастраивает переданный (autoflush=False)
+    session_maker = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    admin = Admin(app=app, session_maker=session_maker)
 
     admin.add_view(UserAdmin)
@@ -1,10 +1,13 @@
 from typing import Any
 
 from sqladmin import ModelView
+from sqlalchemy import Select
 from starlette.requests import Request
 
 from src.apps.admin.exception import InvalidAdminUserDataError
+from src.data_access.cache.user_cache import UserCache
 from src.data_access.models import UserModel
+from src.data_access.queries.user_queries import search_condition
 from src.domain.user.dtos import UserInputDto
 from src.domain.user.mappers import UserDomainMapper
 
@@ -37,6 +40,10 @@ class UserAdmin(ModelView, model=UserModel):
         UserModel.is_superuser,
     ]
 
+    def search_query(self, stmt: Select, term: str) -> Select:
+        """То же условие, что и у GET /users/search, чтобы поиск шёл по trgm-индексам"""
+        return stmt.filter(search_condition(term))
+
     async def on_model_change(
         self, data: dict, model: Any, is_created: bool, request: Request
     ) -> None:
@@ -57,3 +64,17 @@ class UserAdmin(ModelView, model=UserModel):
             raise InvalidAdminUserDataError(
                 message=f"Данные пользователя в адмике не валидны: {str(e)}"
             )
+
+    async def after_model_change(
+        self, data: dict, model: Any, is_created: bool, request: Request
+    ) -> None:
+        """Админка коммитит своей сессией, мимо репозитория: сбрасываем кеш профиля сами"""
+        await self._invalidate_cache(model, request)
+
+    async def after_model_delete(self, model: Any, request: Request) -> None:
+        await self._invalidate_cache(model, request)
+
+    @staticmethod
+    async def _invalidate_cache(model: Any, request: Request) -> None:
+        cache = await request.state.dishka_container.get(UserCache)
+        await cache.invalidate([model.id])
@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+
+@dataclass
+class LoginInputDto:
+    email: str
+    password: str
+
+
+@dataclass
+class TokenPairDto:
+    access_token: str
+    refresh_token: str
+    expires_in: int  # Секунды жизни access-токена
+
+
+@dataclass
+class PrincipalDto:
+    """Кто выполняет запрос - целиком из claims access-токена, без обращения к БД."""
+
+    user_id: UUID
+    email: str
+    is_superuser: bool
@@ -0,0 +1,24 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from src.apps.auth.dtos import PrincipalDto, TokenPairDto
+
+
+class ITokenService(ABC):
+    """
+    Подписанные stateless-токены: проверка - только подпись и срок, без БД и Redis.
+    Ошибки проверки - InvalidTokenError.
+    """
+
+    @abstractmethod
+    def issue_pair(self, principal: PrincipalDto) -> TokenPairDto:
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode_access(self, token: str) -> PrincipalDto:
+        raise NotImplementedError
+
+    @abstractmethod
+    def decode_refresh(self, token: str) -> UUID:
+        """id пользователя из refresh-токена."""
+        raise NotImplementedError
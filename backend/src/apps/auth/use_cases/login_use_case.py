@@ -0,0 +1,48 @@
+from typing import NewType
+
+from src.apps.auth.dtos import LoginInputDto, PrincipalDto, TokenPairDto
+from src.apps.auth.itokens import ITokenService
+from src.apps.user.irepo import IUserRepository
+from src.domain.user.interfaces import IAsyncPasswordHasher
+from src.shared.exceptions import InactiveUserError, InvalidCredentialsError
+
+# Хеш случайного пароля с текущими параметрами хешера: для неизвестного email пароль
+# проверяется против него, чтобы время ответа не выдавало, зарегистрирован ли адрес
+DummyPasswordHash = NewType("DummyPasswordHash", str)
+
+
+class LoginUseCase:
+    def __init__(
+        self,
+        user_repo: IUserRepository,
+        hasher: IAsyncPasswordHasher,
+        tokens: ITokenService,
+        dummy_hash: DummyPasswordHash,
+    ):
+        self.user_repo = user_repo
+        self.hasher = hasher
+        self.tokens = tokens
+        self.dummy_hash = dummy_hash
+
+    async def execute(self, dto: LoginInputDto) -> TokenPairDto:
+        user = await self.user_repo.get_by_email(dto.email)
+        if user is None:
+            await self.hasher.verify(dto.password, self.dummy_hash)
+            raise InvalidCredentialsError()
+
+        valid, rehashed = await user.password.verify_and_rehash_async(dto.password, self.hasher)
+        if not valid:
+            raise InvalidCredentialsError()
+        if not user.is_active:
+            raise InactiveUserError()
+        if rehashed is not None:
+            # Параметры хешера изменились: пароль известен только сейчас
+            await self.user_repo.update_password_hash(user.id.value, rehashed.hash)
+
+        return self.tokens.issue_pair(
+            PrincipalDto(
+                user_id=user.id.value,
+                email=user.email.value,
+                is_superuser=user.is_superuser,
+            )
+        )
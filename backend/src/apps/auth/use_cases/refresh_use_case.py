@@ -0,0 +1,23 @@
+from src.apps.auth.dtos import PrincipalDto, TokenPairDto
+from src.apps.auth.itokens import ITokenService
+from src.apps.user.irepo import IUserRepository
+from src.shared.exceptions import InactiveUserError, InvalidTokenError
+
+
+class RefreshTokenUseCase:
+    def __init__(self, user_repo: IUserRepository, tokens: ITokenService):
+        self.user_repo = user_repo
+        self.tokens = tokens
+
+    async def execute(self, refresh_token: str) -> TokenPairDto:
+        user_id = self.tokens.decode_refresh(refresh_token)
+        # Раз в access_ttl, через кеш профиля: отключённый или удалённый
+        # пользователь не должен продлевать себе токены
+        user = await self.user_repo.get_output_by_id(user_id)
+        if user is None:
+            raise InvalidTokenError(message_to_extend={"reason": "user not found"})
+        if not user.is_active:
+            raise InactiveUserError()
+        return self.tokens.issue_pair(
+            PrincipalDto(user_id=user.id, email=user.email, is_superuser=user.is_superuser)
+        )
@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+
+class IOutbox(ABC):
+    """
+    Фоновые задачи, которые должны уйти в брокер только вместе с коммитом текущей
+    транзакции. Запись идёт в ту же сессию, что и у репозиториев запроса.
+    """
+
+    @abstractmethod
+    async def add(self, task_name: str, kwargs: dict) -> None:
+        raise NotImplementedError
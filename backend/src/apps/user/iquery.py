@@ -0,0 +1,38 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
+
+from src.domain.user.dtos import UserOutputDto
+
+
+class IUserQueryService(ABC):
+    """Read side: сразу отдаёт DTO, без сущностей и unit of work."""
+
+    @abstractmethod
+    async def get_by_id(self, user_id: UUID) -> UserOutputDto | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_many(self, user_ids: list[UUID]) -> list[UserOutputDto]:
+        """Найденные пользователи из user_ids одним запросом, порядок не гарантирован."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_email(self, email: str) -> UserOutputDto | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search(self, term: str, limit: int) -> list[UserOutputDto]:
+        """Подстрока в email, имени или фамилии; самые похожие первыми."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def list_page(
+        self,
+        limit: int,
+        cursor: tuple[datetime, UUID] | None = None,
+        is_active: bool | None = None,
+        is_superuser: bool | None = None,
+    ) -> list[UserOutputDto]:
+        """Страница по убыванию (created_at, id), строго после cursor."""
+        raise NotImplementedError
@@ -1,6 +1,8 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 
+from src.domain.user.dtos import UserOutputDto
 from src.domain.user.entity import UserEntity
 
 
@@ -9,10 +11,51 @@ class IUserRepository(ABC):
     async def save(self, user: UserEntity) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def create_if_absent(self, user: UserEntity) -> bool:
+        """
+        Вставляет пользователя одним запросом. False, если email (без учёта регистра)
+        уже занят: тогда ничего не записывается.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def update_password_hash(self, user_id: UUID, password_hash: str) -> None:
+        """
+        Перезаписывает только хеш пароля (пересчёт при входе). updated_at не меняется:
+        профиль пользователя остаётся прежним.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def save_many(self, users: list[UserEntity]) -> set[UUID]:
+        """Сохраняет пачку пользователей и возвращает id реально вставленных строк."""
+        raise NotImplementedError
+
     @abstractmethod
     async def get_by_id(self, user_id: UUID) -> UserEntity | None:
         raise NotImplementedError
 
+    @abstractmethod
+    async def get_output_by_id(self, user_id: UUID) -> UserOutputDto | None:
+        """Профиль для чтения (без хеша пароля); его можно кешировать."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_outputs_by_ids(self, user_ids: list[UUID]) -> dict[UUID, UserOutputDto]:
+        """Профили найденных пользователей по id; как get_output_by_id, но пачкой."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_updated_at(self, user_id: UUID) -> datetime | None:
+        """Время последнего изменения профиля (валидатор для ETag); None - нет пользователя."""
+        raise NotImplementedError
+
     @abstractmethod
     async def get_by_email(self, email: str) -> UserEntity | None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def email_exists(self, email: str) -> bool:
+        """Занят ли email (без учёта регистра); дешевле get_by_email."""
+        raise NotImplementedError
@@ -0,0 +1,17 @@
+from uuid import UUID
+
+from src.apps.user.irepo import IUserRepository
+from src.core.data_loader import DataLoader
+from src.domain.user.dtos import UserOutputDto
+
+MAX_LOAD_BATCH = 500  # id в одном запросе к кешу и БД
+
+
+class UserLoader(DataLoader[UUID, UserOutputDto]):
+    """
+    Профили пользователей в пределах одного HTTP-запроса (Scope.REQUEST): load()
+    из разных мест запроса уходят в IUserRepository.get_outputs_by_ids одной пачкой.
+    """
+
+    def __init__(self, user_repo: IUserRepository):
+        super().__init__(user_repo.get_outputs_by_ids, max_batch_size=MAX_LOAD_BATCH)
@@ -0,0 +1,135 @@
+import asyncio
+from collections.abc import AsyncIterable
+from uuid import UUID
+
+from src.apps.user.irepo import IUserRepository
+from src.base_exceptions import AppError
+from src.domain.user import PasswordHashVo
+from src.domain.user.dtos import (
+    UserImportReportDto,
+    UserImportRowDto,
+    UserImportRowErrorDto,
+    UserInputDto,
+)
+from src.domain.user.entity import UserEntity
+from src.domain.user.interfaces import IAsyncPasswordHasher
+from src.domain.user.mappers import UserDomainMapper
+from src.domain.user.value_objects import UserEmailVo, UserFirstNameVo, UserLastNameVo
+from src.shared.exceptions import PasswordHasherOverloadedError
+from src.shared.validation import validate_many
+
+IMPORT_BATCH_SIZE = 500
+HASH_CONCURRENCY = 16  # Сколько хеширований одного импорта одновременно отдаётся в пул
+MAX_REPORTED_ERRORS = 1000  # Отчёт не растёт бесконечно на полностью битом файле
+# Перегрузка пула хешера - не ошибка строки: ждём и повторяем, затем прерываем импорт
+HASH_OVERLOAD_RETRIES = 3
+HASH_OVERLOAD_BACKOFF = 0.5  # Секунды, удваиваются с каждой попыткой
+USER_EXISTS_ERROR = "user with this email already exists"
+# Поля, которые проверяются столбцами до хеширования пароля: (поле, VO, может ли быть None)
+VALIDATED_FIELDS = (
+    ("email", UserEmailVo, False),
+    ("first_name", UserFirstNameVo, True),
+    ("last_name", UserLastNameVo, True),
+)
+
+
+class UserBulkImportUseCase:
+    def __init__(self, user_repo: IUserRepository, hasher: IAsyncPasswordHasher):
+        self.user_repo = user_repo
+        self.hasher = hasher
+        self._hash_slots = asyncio.Semaphore(HASH_CONCURRENCY)
+
+    async def execute(self, rows: AsyncIterable[UserImportRowDto]) -> UserImportReportDto:
+        """Импортирует поток строк пачками по IMPORT_BATCH_SIZE, в памяти только одна пачка."""
+        report = UserImportReportDto()
+        batch: list[UserImportRowDto] = []
+        async for row in rows:
+            batch.append(row)
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                await self._import_batch(batch, report)
+                batch = []
+
+        if batch:
+            await self._import_batch(batch, report)
+        return report
+
+    async def _import_batch(
+        self, rows: list[UserImportRowDto], report: UserImportReportDto
+    ) -> None:
+        report.total += len(rows)
+
+        parsed = []
+        for row in rows:
+            if row.user is None:
+                self._add_error(report, row.line, row.error or "empty row")
+            else:
+                parsed.append(row)
+        candidates = self._validate(parsed, report)
+
+        results = await asyncio.gather(
+            *(self._build_entity(row.user) for row in candidates), return_exceptions=True
+        )
+
+        entities: dict[UUID, tuple[UserImportRowDto, UserEntity]] = {}
+        for row, result in zip(candidates, results, strict=True):
+            if isinstance(result, PasswordHasherOverloadedError):
+                # Прерываем импорт: предыдущие пачки уже записаны, клиент получит 503
+                # и повторит файл, а не отчёт о валидных строках как об ошибочных
+                raise result
+            if isinstance(result, AppError | ValueError):
+                self._add_error(report, row.line, str(result), row.user.email)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                entities[result.id.value] = (row, result)
+
+        inserted = await self.user_repo.save_many([entity for _, entity in entities.values()])
+        for user_id, (row, _) in entities.items():
+            if user_id in inserted:
+                report.created += 1
+            else:
+                self._add_error(report, row.line, USER_EXISTS_ERROR, row.user.email)
+
+    def _validate(
+        self, rows: list[UserImportRowDto], report: UserImportReportDto
+    ) -> list[UserImportRowDto]:
+        """
+        Отсекает строки с невалидными полями до хеширования: Argon2 на порядки дороже
+        проверки, а битая строка всё равно не будет вставлена.
+        """
+        codes_by_field = [
+            (
+                name,
+                validate_many(vo_cls, [getattr(row.user, name) for row in rows], optional=optional),
+            )
+            for name, vo_cls, optional in VALIDATED_FIELDS
+        ]
+        valid = []
+        for index, row in enumerate(rows):
+            errors = [f"{name}: {codes[index]}" for name, codes in codes_by_field if codes[index]]
+            if errors:
+                self._add_error(report, row.line, "; ".join(errors), row.user.email)
+            else:
+                valid.append(row)
+        return valid
+
+    async def _build_entity(self, dto: UserInputDto) -> UserEntity:
+        async with self._hash_slots:
+            password_vo = await self._hash_password(dto.password)
+        return UserDomainMapper.input_dto_to_entity(dto=dto, password_vo=password_vo)
+
+    async def _hash_password(self, plain: str) -> PasswordHashVo:
+        for attempt in range(HASH_OVERLOAD_RETRIES):
+            try:
+                return await PasswordHashVo.from_plain_async(plain=plain, hasher=self.hasher)
+            except PasswordHasherOverloadedError:
+                await asyncio.sleep(HASH_OVERLOAD_BACKOFF * 2**attempt)
+        return await PasswordHashVo.from_plain_async(plain=plain, hasher=self.hasher)
+
+    @staticmethod
+    def _add_error(
+        report: UserImportReportDto, line: int, error: str, email: str | None = None
+    ) -> None:
+        report.failed += 1
+        if len(report.errors) < MAX_REPORTED_ERRORS:
+            report.errors.append(UserImportRowErrorDto(line=line, error=error, email=email))
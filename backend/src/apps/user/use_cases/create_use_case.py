@@ -1,27 +1,25 @@
 from src.apps.user.irepo import IUserRepository
 from src.domain.user import PasswordHashVo
 from src.domain.user.dtos import UserInputDto, UserOutputDto
-from src.domain.user.interfaces import IPasswordHasher
+from src.domain.user.interfaces import IAsyncPasswordHasher
 from src.domain.user.mappers import UserDomainMapper
-from src.domain.user.value_objects import UserFirstNameVo
+from src.shared.exceptions import UserAlreadyExistsError
 
 
 class UserCreateUseCase:
-    def __init__(self, user_repo: IUserRepository, hasher: IPasswordHasher):
+    def __init__(self, user_repo: IUserRepository, hasher: IAsyncPasswordHasher):
         self.user_repo = user_repo
         self.hasher = hasher
 
-    # TODO: добавить обработку ошибок
     async def execute(self, dto: UserInputDto) -> UserOutputDto:
-        existing_user_entity = await self.user_repo.get_by_email(dto.email)
-        if existing_user_entity:
-            # TODO: Рейзить ошибку что пользак есть в БД
-            # raise UserAlreadyExistsError(dto.email)
-            # TODO: ВРЕМЕННО чтобы тип вернуть ошибку в поле first_name -> Удалить потом!!!
-            existing_user_entity.first_name = UserFirstNameVo("Email УЖЕ СУЩЕСТВУЕТ!!!")
-            return UserDomainMapper.entity_to_output_dto(existing_user_entity)
-
-        password_vo = PasswordHashVo.from_plain(plain=dto.password, hasher=self.hasher)
+        # Занятый email отсекается дешёвой проверкой по индексу до Argon2: повторная
+        # регистрация не тратит хеширование и место в очереди хешера
+        if await self.user_repo.email_exists(dto.email):
+            raise UserAlreadyExistsError(message_to_extend={"email": dto.email})
+        password_vo = await PasswordHashVo.from_plain_async(plain=dto.password, hasher=self.hasher)
         user_entity = UserDomainMapper.input_dto_to_entity(dto=dto, password_vo=password_vo)
-        await self.user_repo.save(user_entity)
+        # Между проверкой и вставкой email может занять параллельный запрос:
+        # INSERT ... ON CONFLICT остаётся защитой от гонки
+        if not await self.user_repo.create_if_absent(user_entity):
+            raise UserAlreadyExistsError(message_to_extend={"email": dto.email})
         return UserDomainMapper.entity_to_output_dto(user_entity)
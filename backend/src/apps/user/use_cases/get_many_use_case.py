@@ -0,0 +1,26 @@
+from uuid import UUID
+
+from src.apps.user.loader import UserLoader
+from src.domain.user.dtos import UserOutputDto
+
+
+class UserGetManyUseCase:
+    def __init__(self, user_loader: UserLoader):
+        self.user_loader = user_loader
+
+    async def execute(
+        self,
+        user_ids: list[UUID],
+        is_active: bool | None = None,
+        is_superuser: bool | None = None,
+    ) -> dict[UUID, UserOutputDto]:
+        """Найденные пользователи в порядке user_ids (повторы убираются)."""
+        unique_ids = list(dict.fromkeys(user_ids))
+        users = await self.user_loader.load_many(unique_ids)
+        return {
+            user_id: user
+            for user_id, user in zip(unique_ids, users, strict=True)
+            if user is not None
+            and (is_active is None or user.is_active == is_active)
+            and (is_superuser is None or user.is_superuser == is_superuser)
+        }
@@ -0,0 +1,14 @@
+from datetime import datetime
+from uuid import UUID
+
+from src.apps.user.irepo import IUserRepository
+
+
+class UserGetUpdatedAtUseCase:
+    """Валидатор профиля для условного GET: без загрузки самого профиля."""
+
+    def __init__(self, user_repo: IUserRepository):
+        self.user_repo = user_repo
+
+    async def execute(self, user_id: UUID) -> datetime | None:
+        return await self.user_repo.get_updated_at(user_id)
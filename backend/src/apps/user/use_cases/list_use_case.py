@@ -0,0 +1,31 @@
+from datetime import datetime
+from uuid import UUID
+
+from src.apps.user.iquery import IUserQueryService
+from src.domain.user.dtos import UserPageDto
+
+
+class UserListUseCase:
+    def __init__(self, user_queries: IUserQueryService):
+        self.user_queries = user_queries
+
+    async def execute(
+        self,
+        limit: int,
+        cursor: tuple[datetime, UUID] | None = None,
+        is_active: bool | None = None,
+        is_superuser: bool | None = None,
+    ) -> UserPageDto:
+        # Лишняя строка показывает, есть ли следующая страница, без отдельного COUNT
+        items = await self.user_queries.list_page(
+            limit=limit + 1, cursor=cursor, is_active=is_active, is_superuser=is_superuser
+        )
+        has_next = len(items) > limit
+        items = items[:limit]
+
+        next_cursor = None
+        if has_next:
+            last = items[-1]
+            next_cursor = (last.created_at, last.id)
+
+        return UserPageDto(items=items, next_cursor=next_cursor)
@@ -0,0 +1,10 @@
+from src.apps.user.iquery import IUserQueryService
+from src.domain.user.dtos import UserOutputDto
+
+
+class UserSearchUseCase:
+    def __init__(self, user_queries: IUserQueryService):
+        self.user_queries = user_queries
+
+    async def execute(self, term: str, limit: int) -> list[UserOutputDto]:
+        return await self.user_queries.search(term=term.strip(), limit=limit)
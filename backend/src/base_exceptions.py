@@ -6,11 +6,13 @@ class AppError(Exception):
     Base application-level exception to provide consistent error handling.
 
     Attributes:
+        CODE (str): Stable machine-readable error code.
         message (str): Human-readable error message.
         context (Exception | None): Optional exception that caused the current error.
 
     """
 
+    CODE = "app_error"
     DEFAULT_MESSAGE = "Application error occurred."
 
     def __init__(self, message: str | None = None, context: Exception | None = None) -> None:
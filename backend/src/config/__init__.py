@@ -1,7 +1,9 @@
-from src.config.db_settings import db_settings
-from src.config.server_settings import server_settings
+# Настройки создаются при первом вызове get_*_settings(), а не при импорте модуля:
+# процессу, которому не нужен SMTP или Redis, не нужны и их переменные окружения.
+from src.config.db_settings import get_db_settings
+from src.config.server_settings import get_server_settings
 
 __all__ = [
-    "db_settings",
-    "server_settings",
+    "get_db_settings",
+    "get_server_settings",
 ]
@@ -0,0 +1,55 @@
+from functools import cache
+from typing import Literal
+
+from pydantic import SecretStr, model_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+MIN_SECRET_KEY_LENGTH = 32
+
+
+class AuthSettings(BaseSettings):
+    # HS256 - общий секрет; EdDSA (Ed25519) - пара ключей PEM, нужен пакет cryptography
+    algorithm: Literal["HS256", "EdDSA"] = "HS256"
+    secret_key: SecretStr | None = None
+    private_key: SecretStr | None = None
+    public_key: str | None = None
+    issuer: str = "mir-cat"
+    access_ttl: int = 900  # Секунды жизни access-токена
+    refresh_ttl: int = 14 * 24 * 3600  # Секунды жизни refresh-токена
+    leeway: int = 10  # Допустимое расхождение часов между процессами, секунды
+
+    model_config = SettingsConfigDict(
+        env_prefix="auth_",
+        case_sensitive=False,
+        env_file="../../../.env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+    @model_validator(mode="after")
+    def check_keys(self) -> "AuthSettings":
+        if self.algorithm == "HS256":
+            secret = self.secret_key.get_secret_value() if self.secret_key else ""
+            if len(secret) < MIN_SECRET_KEY_LENGTH:
+                raise ValueError(
+                    f"AUTH_SECRET_KEY must be at least {MIN_SECRET_KEY_LENGTH} characters"
+                )
+        elif not (self.private_key and self.public_key):
+            raise ValueError("AUTH_PRIVATE_KEY and AUTH_PUBLIC_KEY are required for EdDSA")
+        return self
+
+    @property
+    def signing_key(self) -> str:
+        key = self.secret_key if self.algorithm == "HS256" else self.private_key
+        return key.get_secret_value()
+
+    @property
+    def verification_key(self) -> str:
+        if self.algorithm == "HS256":
+            return self.secret_key.get_secret_value()
+        return self.public_key
+
+
+@cache
+def get_auth_settings() -> AuthSettings:
+    return AuthSettings()
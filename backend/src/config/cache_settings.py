@@ -0,0 +1,22 @@
+from functools import cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class CacheSettings(BaseSettings):
+    enabled: bool = True
+    user_ttl: int = 300  # Секунды жизни закешированного профиля
+    user_negative_ttl: int = 30  # Секунды жизни записи "пользователя нет"
+
+    model_config = SettingsConfigDict(
+        env_prefix="cache_",
+        case_sensitive=False,
+        env_file="../../../.env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+
+@cache
+def get_cache_settings() -> CacheSettings:
+    return CacheSettings()
@@ -1,3 +1,4 @@
+from functools import cache
 from typing import ClassVar
 
 from pydantic import PostgresDsn, computed_field
@@ -15,6 +16,17 @@ class DBSettings(BaseSettings):
     DB_HOST: str
     DB_PORT: int
 
+    # Пул соединений и драйвер asyncpg
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30.0  # Секунды ожидания свободного соединения
+    DB_POOL_RECYCLE: int = 1800  # Секунды жизни соединения, -1 чтобы не пересоздавать
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = 100  # 0 для pgbouncer в transaction-режиме
+    DB_STATEMENT_TIMEOUT_MS: int = 0  # statement_timeout на сервере, 0 - без ограничения
+    # GET/HEAD/OPTIONS: True - BEGIN READ ONLY, False - autocommit без BEGIN/COMMIT
+    DB_READ_ONLY_TRANSACTIONS: bool = False
+
     @computed_field
     @property
     def SQLALCHEMY_DATABASE_URI(self) -> PostgresDsn:
@@ -56,6 +68,37 @@ class DBSettings(BaseSettings):
         )
         return uri.render_as_string(hide_password=False)
 
+    @property
+    def engine_options(self) -> dict:
+        """
+        Keyword arguments for create_async_engine built from the pool settings.
+        """
+        server_settings = {}
+        if self.DB_STATEMENT_TIMEOUT_MS:
+            server_settings["statement_timeout"] = str(self.DB_STATEMENT_TIMEOUT_MS)
+        return {
+            "pool_size": self.DB_POOL_SIZE,
+            "max_overflow": self.DB_MAX_OVERFLOW,
+            "pool_timeout": self.DB_POOL_TIMEOUT,
+            "pool_recycle": self.DB_POOL_RECYCLE,
+            "pool_pre_ping": self.DB_POOL_PRE_PING,
+            "connect_args": {
+                # Кеш prepared statements SQLAlchemy и внутренний кеш asyncpg
+                "prepared_statement_cache_size": self.DB_STATEMENT_CACHE_SIZE,
+                "statement_cache_size": self.DB_STATEMENT_CACHE_SIZE,
+                "server_settings": server_settings,
+            },
+        }
+
+    @property
+    def read_execution_options(self) -> dict:
+        """
+        Execution options of the engine used by sessions of read-only requests.
+        """
+        if self.DB_READ_ONLY_TRANSACTIONS:
+            return {"postgresql_readonly": True}
+        return {"isolation_level": "AUTOCOMMIT"}
+
     naming_convention: ClassVar[dict] = {
         "ix": "ix_%(column_0_label)s",
         "uq": "uq_%(table_name)s_%(column_0_N_name)s",
@@ -65,4 +108,6 @@ class DBSettings(BaseSettings):
     }
 
 
-db_settings = DBSettings()
+@cache
+def get_db_settings() -> DBSettings:
+    return DBSettings()
@@ -0,0 +1,29 @@
+from functools import cache
+from typing import Literal
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class HasherSettings(BaseSettings):
+    executor: Literal["thread", "process"] = "thread"  # argon2-cffi отпускает GIL
+    max_workers: int = 4
+    max_queue_size: int = 64  # Сколько хеширований может ждать свободного воркера
+    acquire_timeout: float = 5.0  # Секунды ожидания места в очереди до отказа
+
+    # Параметры Argon2. Хеши со старыми параметрами пересчитываются при следующем входе
+    argon2_time_cost: int = 3
+    argon2_memory_cost: int = 65536  # KiB
+    argon2_parallelism: int = 4
+
+    model_config = SettingsConfigDict(
+        env_prefix="hasher_",
+        case_sensitive=False,
+        env_file="../../../.env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+
+@cache
+def get_hasher_settings() -> HasherSettings:
+    return HasherSettings()
@@ -0,0 +1,22 @@
+from functools import cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class MetricsSettings(BaseSettings):
+    # HTTP-сервер /metrics в процессах taskiq worker; 0 - не поднимать
+    worker_port: int = 9100
+    worker_host: str = "0.0.0.0"
+
+    model_config = SettingsConfigDict(
+        env_prefix="metrics_",
+        case_sensitive=False,
+        env_file="../../../.env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+
+@cache
+def get_metrics_settings() -> MetricsSettings:
+    return MetricsSettings()
@@ -0,0 +1,26 @@
+from functools import cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class NotificationSettings(BaseSettings):
+    # Уведомления администратору копятся в Redis и уходят одним письмом за окно
+    digest_cron: str = "*/5 * * * *"  # Окно сводки: расписание задачи планировщика
+    digest_max_events: int = 200  # Столько событий - сводка сразу, не дожидаясь окна
+    digest_key: str = "notifications:admin_digest"
+    digest_claim_timeout: int = (
+        300  # Секунды, после которых пачка упавшей отправки вернётся в очередь
+    )
+
+    model_config = SettingsConfigDict(
+        env_prefix="notify_",
+        case_sensitive=False,
+        env_file="../../../.env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+
+@cache
+def get_notification_settings() -> NotificationSettings:
+    return NotificationSettings()
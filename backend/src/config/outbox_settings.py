@@ -0,0 +1,22 @@
+from functools import cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class OutboxSettings(BaseSettings):
+    batch_size: int = 500  # Строк за одну транзакцию реле и один pipeline XADD
+    poll_interval: float = 0.5  # Секунды между опросами, когда outbox пуст
+    max_backoff: float = 30.0  # Потолок паузы между попытками при ошибках БД или Redis
+
+    model_config = SettingsConfigDict(
+        env_prefix="outbox_",
+        case_sensitive=False,
+        env_file="../../../.env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+
+@cache
+def get_outbox_settings() -> OutboxSettings:
+    return OutboxSettings()
@@ -1,3 +1,5 @@
+from functools import cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -7,6 +9,7 @@ class RedisSettings(BaseSettings):
     db: int = 0
     username: str = "default"
     password: str | None = None
+    socket_timeout: float = 1.0  # Для клиента приложения (кеш), не для брокера taskiq
 
     model_config = SettingsConfigDict(
         env_prefix="redis_",
@@ -26,4 +29,6 @@ class RedisSettings(BaseSettings):
             return f"redis://{self.host}:{self.port}/{self.db}"
 
 
-redis_config = RedisSettings()
+@cache
+def get_redis_settings() -> RedisSettings:
+    return RedisSettings()
@@ -1,3 +1,7 @@
+import os
+from functools import cache
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -10,6 +14,29 @@ class ServerSettings(BaseSettings):
     RELOAD: bool = True  # False для программного запуска
     LOG_LEVEL: str = "info"  # info для production, debug для разработки
     USE_COLORS: bool = True
+    APP_ROLE: Literal["api", "worker", "scheduler", "relay"] = "api"  # Задаётся в compose
+    ADMIN_ENABLED: bool = True
+
+    # Production-запуск (python -m src.server), при RELOAD=True не используется
+    WORKERS: int = 0  # 0 - по числу доступных CPU
+    BACKLOG: int = 2048  # Очередь ещё не принятых соединений на сокете
+    KEEP_ALIVE: int = 75  # Дольше keepalive_timeout nginx, чтобы тот не писал в закрытое соединение
+    LIMIT_CONCURRENCY: int | None = None  # Соединений на воркер, сверх - 503
+    GRACEFUL_TIMEOUT: int = 30  # Секунды на завершение запросов после SIGTERM
+
+    @property
+    def mount_admin(self) -> bool:
+        """
+        SQLAdmin монтируется только в процессе API: воркеру он не нужен, а стоит сотни мс импорта.
+        """
+        return self.ADMIN_ENABLED and self.APP_ROLE == "api"
+
+    @property
+    def workers_count(self) -> int:
+        # process_cpu_count учитывает ограничение CPU affinity (taskset, cpuset контейнера)
+        return self.WORKERS or os.process_cpu_count() or 1
 
 
-server_settings = ServerSettings()
+@cache
+def get_server_settings() -> ServerSettings:
+    return ServerSettings()
@@ -1,3 +1,5 @@
+from functools import cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -6,6 +8,14 @@ class SMTPSettings(BaseSettings):
     port: int
     user: str
     password: str
+    start_tls: bool = True  # start_tls для порта 587; False для серверов без TLS
+    timeout: float = 10.0
+    email_to: str | None = None  # Адрес администратора для уведомлений (SMTP_EMAIL_TO)
+
+    # Пул соединений воркера taskiq
+    pool_size: int = 2  # Одновременных соединений на процесс воркера
+    pool_idle_timeout: float = 60.0  # Секунды простоя, после которых соединение переоткрывается
+    pool_max_messages: int = 100  # Писем через одно соединение до переподключения
 
     model_config = SettingsConfigDict(
         env_prefix="smtp_",
@@ -16,4 +26,6 @@ class SMTPSettings(BaseSettings):
     )
 
 
-smtp_config = SMTPSettings()
+@cache
+def get_smtp_settings() -> SMTPSettings:
+    return SMTPSettings()
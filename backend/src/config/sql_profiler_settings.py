@@ -0,0 +1,24 @@
+from functools import cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class SqlProfilerSettings(BaseSettings):
+    # Только для разработки: EXPLAIN ANALYZE повторно выполняет медленные SELECT
+    enabled: bool = False
+    slow_ms: float = 100.0  # Запросы дольше логируются вместе с планом
+    explain: bool = True
+    repeat_threshold: int = 5  # Столько одинаковых запросов за запрос - подозрение на N+1
+
+    model_config = SettingsConfigDict(
+        env_prefix="sql_profiler_",
+        case_sensitive=False,
+        env_file="../../../.env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+
+@cache
+def get_sql_profiler_settings() -> SqlProfilerSettings:
+    return SqlProfilerSettings()
@@ -0,0 +1,36 @@
+from functools import cache
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class TaskiqSettings(BaseSettings):
+    # RedisStreamBroker. Число одновременных задач и размер очереди prefetch процесса
+    # задаются флагами воркера: --max-async-tasks и --max-prefetch
+    queue_name: str = "taskiq"
+    xread_count: int = 10  # Сообщений за один XREADGROUP
+    xread_block: int = 2000  # Мс ожидания новых сообщений в XREADGROUP
+    idle_timeout: int = (
+        600_000  # Мс, после которых неподтверждённое сообщение забирает другой воркер
+    )
+    unacknowledged_batch_size: int = 100  # Сообщений за один XAUTOCLAIM
+    maxlen: int | None = None  # Приблизительный предел длины стрима (XADD MAXLEN ~)
+
+    # Лимиты задач (labels concurrency_limit / rate_limit), общие для всех процессов
+    limit_lease: float = 300.0  # Секунды, через которые слот упавшего воркера освобождается
+    limit_poll_interval: float = 0.1  # Секунды между попытками занять слот
+    limit_max_wait: float = 300.0  # Дольше ждать лимит нельзя: должно быть меньше idle_timeout
+
+    backlog_poll_interval: float = 15.0  # Секунды между опросами длины стрима и лага
+
+    model_config = SettingsConfigDict(
+        env_prefix="taskiq_",
+        case_sensitive=False,
+        env_file="../../../.env",
+        env_file_encoding="utf-8",
+        extra="ignore",
+    )
+
+
+@cache
+def get_taskiq_settings() -> TaskiqSettings:
+    return TaskiqSettings()
@@ -0,0 +1,151 @@
+"""
+Лимиты задач taskiq, общие для всех процессов воркера: состояние лежит в Redis.
+
+Объявляются labels задачи:
+
+    @broker.task(concurrency_limit=4, rate_limit="10/s", limit_group="smtp")
+
+concurrency_limit - не больше N одновременных выполнений, rate_limit - token bucket
+"N/s", "N/m" или "N/h" (запас - те же N). Задачи с одинаковым limit_group делят лимиты,
+по умолчанию группа - имя задачи.
+
+Задача ждёт лимит в pre_execute и всё это время занимает слот --max-async-tasks:
+когда все слоты ждут, воркер перестаёт забирать сообщения из стрима. Если лимит
+не получен за limit_max_wait, сообщение остаётся неподтверждённым, и стрим выдаст его
+снова через idle_timeout.
+"""
+
+import asyncio
+import logging
+import random
+from typing import Any
+
+from redis.asyncio import Redis
+from taskiq import TaskiqMessage, TaskiqMiddleware, TaskiqResult
+
+from src.config.taskiq_settings import TaskiqSettings
+from src.core.metrics import TASKIQ_LIMIT_TIMEOUTS, TASKIQ_LIMIT_WAIT
+
+logger = logging.getLogger(__name__)
+
+CONCURRENCY_LABEL = "concurrency_limit"
+RATE_LABEL = "rate_limit"
+GROUP_LABEL = "limit_group"
+KEY_PREFIX = "taskiq:limits"
+
+PERIODS = {"s": 1, "m": 60, "h": 3600}
+
+# Слоты - sorted set task_id -> срок аренды; просроченные слоты упавших воркеров
+# удаляются перед подсчётом. Время берётся у Redis, а не у воркеров
+ACQUIRE_SLOT = """
+local now = redis.call('TIME')
+now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now + tonumber(ARGV[2]), ARGV[3])
+redis.call('PEXPIRE', KEYS[1], math.ceil(tonumber(ARGV[2]) * 1000))
+return 1
+"""
+
+# Token bucket: возвращает 0, если токен взят, иначе секунды до следующего токена
+TAKE_TOKEN = """
+local now = redis.call('TIME')
+now = tonumber(now[1]) + tonumber(now[2]) / 1000000
+local rate = tonumber(ARGV[1])
+local burst = tonumber(ARGV[2])
+local state = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local tokens = tonumber(state[1]) or burst
+local ts = tonumber(state[2]) or now
+tokens = math.min(burst, tokens + math.max(0, now - ts) * rate)
+if tokens < 1 then
+    return tostring((1 - tokens) / rate)
+end
+redis.call('HSET', KEYS[1], 'tokens', tokens - 1, 'ts', now)
+redis.call('PEXPIRE', KEYS[1], math.ceil(burst / rate * 1000) + 1000)
+return '0'
+"""
+
+
+class TaskLimitTimeoutError(Exception):
+    def __init__(self, task_name: str, waited: float) -> None:
+        super().__init__(f"Task {task_name} did not get its limit in {waited:.1f}s")
+
+
+def parse_rate(value: str) -> tuple[float, float]:
+    """'10/s' -> (токенов в секунду, размер запаса)."""
+    count, _, period = value.partition("/")
+    if period not in PERIODS or int(count) <= 0:
+        raise ValueError(f"Invalid rate_limit {value!r}, expected 'N/s', 'N/m' or 'N/h'")
+    return int(count) / PERIODS[period], int(count)
+
+
+class TaskLimitsMiddleware(TaskiqMiddleware):
+    def __init__(self, config: TaskiqSettings) -> None:
+        super().__init__()
+        self._config = config
+        self._redis: Redis | None = None
+
+    def startup(self) -> None:
+        if not self.broker.is_worker_process:
+            return
+        # Клиент на пуле брокера: отдельные соединения к тому же Redis не нужны
+        self._redis = Redis(connection_pool=self.broker.connection_pool)
+        self._acquire_slot = self._redis.register_script(ACQUIRE_SLOT)
+        self._take_token = self._redis.register_script(TAKE_TOKEN)
+
+    def _limits(self, task_name: str) -> tuple[str, int | None, str | None]:
+        task = self.broker.find_task(task_name)
+        labels = task.labels if task is not None else {}
+        group = labels.get(GROUP_LABEL, task_name)
+        return group, labels.get(CONCURRENCY_LABEL), labels.get(RATE_LABEL)
+
+    async def pre_execute(self, message: TaskiqMessage) -> TaskiqMessage:
+        group, concurrency, rate = self._limits(message.task_name)
+        if self._redis is None or (concurrency is None and rate is None):
+            return message
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        deadline = started + self._config.limit_max_wait
+        slot = f"{KEY_PREFIX}:{group}:slots"
+        holds_slot = False
+        try:
+            while concurrency is not None and not holds_slot:
+                holds_slot = bool(
+                    await self._acquire_slot(
+                        keys=[slot],
+                        args=[concurrency, self._config.limit_lease, message.task_id],
+                    )
+                )
+                if not holds_slot:
+                    await self._wait(message.task_name, deadline, self._config.limit_poll_interval)
+            if rate is not None:
+                tokens_per_second, burst = parse_rate(rate)
+                while delay := float(
+                    await self._take_token(
+                        keys=[f"{KEY_PREFIX}:{group}:bucket"], args=[tokens_per_second, burst]
+                    )
+                ):
+                    await self._wait(message.task_name, deadline, delay)
+        except BaseException:
+            if holds_slot:
+                await self._redis.zrem(slot, message.task_id)
+            raise
+        TASKIQ_LIMIT_WAIT.labels(group).observe(loop.time() - started)
+        return message
+
+    async def _wait(self, task_name: str, deadline: float, delay: float) -> None:
+        now = asyncio.get_running_loop().time()
+        if now >= deadline:
+            TASKIQ_LIMIT_TIMEOUTS.labels(task_name).inc()
+            logger.warning("Task %s is deferred: limits are busy", task_name)
+            raise TaskLimitTimeoutError(task_name, self._config.limit_max_wait)
+        # Джиттер разводит воркеры, одновременно ждущие одного слота
+        await asyncio.sleep(min(delay * random.uniform(1.0, 1.5), deadline - now))
+
+    async def post_execute(self, message: TaskiqMessage, result: TaskiqResult[Any]) -> None:
+        group, concurrency, _ = self._limits(message.task_name)
+        if self._redis is not None and concurrency is not None:
+            await self._redis.zrem(f"{KEY_PREFIX}:{group}:slots", message.task_id)
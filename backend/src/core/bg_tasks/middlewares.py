@@ -0,0 +1,113 @@
+import asyncio
+import logging
+import time
+from typing import Any
+
+from prometheus_client import start_http_server
+from redis.asyncio import Redis
+from taskiq import TaskiqMessage, TaskiqMiddleware, TaskiqResult
+
+from src.config.metrics_settings import MetricsSettings
+from src.config.taskiq_settings import TaskiqSettings
+from src.core.metrics import (
+    TASKIQ_CONSUMER_LAG,
+    TASKIQ_CONSUMER_PENDING,
+    TASKIQ_STREAM_LENGTH,
+    TASKIQ_TASK_DURATION,
+    TASKIQ_TASK_ENQUEUE_DURATION,
+    TASKIQ_TASK_QUEUE_WAIT,
+    metrics_registry,
+)
+
+logger = logging.getLogger(__name__)
+
+# Wall-clock время постановки в очередь: по нему считаются и kick, и ожидание в очереди
+ENQUEUED_AT_LABEL = "enqueued_at"
+
+
+class TaskMetricsMiddleware(TaskiqMiddleware):
+    """
+    Метрики задач: kick в брокер (на стороне отправителя), ожидание в очереди
+    и выполнение (в воркере). Метка task_name ограничена набором задач брокера.
+    """
+
+    def __init__(self, config: MetricsSettings) -> None:
+        super().__init__()
+        self._config = config
+
+    def startup(self) -> None:
+        # Процессы приложения отдают метрики через /metrics FastAPI, воркеры - отдельным портом
+        if not self.broker.is_worker_process or not self._config.worker_port:
+            return
+        try:
+            start_http_server(
+                port=self._config.worker_port,
+                addr=self._config.worker_host,
+                registry=metrics_registry(),
+            )
+        except OSError as e:
+            # При --workers N порт занимает первый процесс; остальные пишут в общий
+            # PROMETHEUS_MULTIPROC_DIR, и он отдаёт метрики всех
+            logger.debug("Worker metrics server is not started: %s", e)
+
+    def pre_send(self, message: TaskiqMessage) -> TaskiqMessage:
+        message.labels[ENQUEUED_AT_LABEL] = time.time()
+        return message
+
+    def post_send(self, message: TaskiqMessage) -> None:
+        TASKIQ_TASK_ENQUEUE_DURATION.labels(message.task_name).observe(
+            time.time() - float(message.labels[ENQUEUED_AT_LABEL])
+        )
+
+    def pre_execute(self, message: TaskiqMessage) -> TaskiqMessage:
+        enqueued_at = message.labels.get(ENQUEUED_AT_LABEL)
+        if enqueued_at is not None:
+            TASKIQ_TASK_QUEUE_WAIT.labels(message.task_name).observe(
+                max(time.time() - float(enqueued_at), 0.0)
+            )
+        return message
+
+    def post_execute(self, message: TaskiqMessage, result: TaskiqResult[Any]) -> None:
+        status = "error" if result.is_err else "ok"
+        TASKIQ_TASK_DURATION.labels(message.task_name, status).observe(result.execution_time)
+
+
+class StreamBacklogMiddleware(TaskiqMiddleware):
+    """
+    Длина стрима брокера и лаг consumer group - по ним масштабируется число воркеров.
+
+    lag - сообщения, ещё не выданные ни одному воркеру, pending - выданные и не
+    подтверждённые (выполняются, ждут лимитов или потеряны упавшим воркером).
+    """
+
+    def __init__(self, config: TaskiqSettings) -> None:
+        super().__init__()
+        self._config = config
+        self._poller: asyncio.Task | None = None
+
+    def startup(self) -> None:
+        if not self.broker.is_worker_process:
+            return
+        self._poller = asyncio.create_task(self._poll())
+
+    async def shutdown(self) -> None:
+        if self._poller is not None:
+            self._poller.cancel()
+
+    async def _poll(self) -> None:
+        queue = self.broker.queue_name
+        group = self.broker.consumer_group_name
+        async with Redis(connection_pool=self.broker.connection_pool) as redis:
+            while True:
+                try:
+                    TASKIQ_STREAM_LENGTH.labels(queue).set(await redis.xlen(queue))
+                    for info in await redis.xinfo_groups(queue):
+                        if info["name"] not in (group, group.encode()):
+                            continue
+                        TASKIQ_CONSUMER_PENDING.labels(queue).set(info["pending"])
+                        # lag есть в XINFO GROUPS с Redis 7; None - Redis не может его посчитать
+                        if info.get("lag") is not None:
+                            TASKIQ_CONSUMER_LAG.labels(queue).set(info["lag"])
+                except Exception as e:
+                    logger.debug("Stream backlog is not collected: %s", e)
+                await asyncio.sleep(self._config.backlog_poll_interval)
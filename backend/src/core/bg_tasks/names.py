@@ -0,0 +1,9 @@
+"""
+Имена задач для тех, кто ставит их через outbox: API не импортирует модуль задач
+(и брокер вместе с ним) только ради task_name.
+
+Значения совпадают с именами по умолчанию ("модуль:функция"), под которыми задачи
+уже записаны в outbox.
+"""
+
+NOTIFY_ADMIN_TASK = "src.core.bg_tasks.tasks:notify_admin_task"
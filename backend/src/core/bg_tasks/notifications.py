@@ -0,0 +1,96 @@
+from collections.abc import Awaitable, Callable
+from uuid import uuid4
+
+from redis.asyncio import Redis
+
+from src.config.notification_settings import NotificationSettings
+from src.core.metrics import NOTIFICATION_DIGEST_SIZE
+
+# Забирает голову очереди в ключ обработки и записывает срок аренды в sorted set.
+# Пачку получает ровно один flush, параллельные сводки берут следующие пачки
+CLAIM_BATCH = """
+local events = redis.call('LRANGE', KEYS[1], 0, tonumber(ARGV[1]) - 1)
+if #events == 0 then
+    return events
+end
+redis.call('LTRIM', KEYS[1], #events, -1)
+redis.call('RPUSH', KEYS[2], unpack(events))
+local now = redis.call('TIME')
+redis.call('ZADD', KEYS[3], tonumber(now[1]) + tonumber(ARGV[2]), KEYS[2])
+return events
+"""
+
+# Возвращает пачку в голову очереди в исходном порядке. ZREM защищает от двойного
+# возврата, если пачку одновременно возвращают отправитель и сборщик просроченных
+REQUEUE_BATCH = """
+if redis.call('ZREM', KEYS[3], KEYS[2]) == 0 then
+    return 0
+end
+local events = redis.call('LRANGE', KEYS[2], 0, -1)
+for i = #events, 1, -1 do
+    redis.call('LPUSH', KEYS[1], events[i])
+end
+redis.call('DEL', KEYS[2])
+return #events
+"""
+
+
+class NotificationDigest:
+    """
+    Очередь событий для сводного письма: Redis-список, общий для всех процессов воркера.
+
+    flush атомарно забирает пачку из головы списка в собственный ключ обработки и
+    удаляет его только после отправки, если письмо не ушло - пачка возвращается в
+    голову очереди. Пачки упавшего воркера возвращаются следующей сводкой, когда
+    истечёт digest_claim_timeout. Новые события добавляются в хвост (RPUSH).
+    """
+
+    def __init__(self, redis: Redis, config: NotificationSettings) -> None:
+        self._redis = redis
+        self._config = config
+        self._claims_key = f"{config.digest_key}:claims"
+        self._claim_batch = redis.register_script(CLAIM_BATCH)
+        self._requeue_batch = redis.register_script(REQUEUE_BATCH)
+
+    async def push(self, text: str) -> int:
+        """Добавляет событие и возвращает длину очереди."""
+        return await self._redis.rpush(self._config.digest_key, text)
+
+    def is_full(self, size: int) -> bool:
+        # Каждое кратное порогу событие запускает внеочередную сводку: пока она
+        # отправляет пачку, следующая сводка заберёт уже другие события
+        return size % self._config.digest_max_events == 0
+
+    async def flush(self, send: Callable[[list[str]], Awaitable[None]]) -> int:
+        """Отправляет накопленное пачками по digest_max_events, возвращает число событий."""
+        await self._requeue_expired()
+        batch_size = self._config.digest_max_events
+        sent = 0
+        while True:
+            processing_key = f"{self._config.digest_key}:processing:{uuid4().hex}"
+            keys = [self._config.digest_key, processing_key, self._claims_key]
+            events = await self._claim_batch(
+                keys=keys, args=[batch_size, self._config.digest_claim_timeout]
+            )
+            if not events:
+                break
+            try:
+                await send([event.decode() for event in events])
+            except BaseException:
+                await self._requeue_batch(keys=keys)
+                raise
+            async with self._redis.pipeline(transaction=True) as pipe:
+                await pipe.zrem(self._claims_key, processing_key).delete(processing_key).execute()
+            NOTIFICATION_DIGEST_SIZE.observe(len(events))
+            sent += len(events)
+            if len(events) < batch_size:
+                break
+        return sent
+
+    async def _requeue_expired(self) -> None:
+        now, _ = await self._redis.time()
+        expired = await self._redis.zrangebyscore(self._claims_key, "-inf", now)
+        for processing_key in expired:
+            await self._requeue_batch(
+                keys=[self._config.digest_key, processing_key.decode(), self._claims_key]
+            )
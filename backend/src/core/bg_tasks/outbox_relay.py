@@ -0,0 +1,171 @@
+"""
+Реле outbox: переносит задачи из таблицы outbox в RedisStreamBroker.
+
+    python -m src.core.bg_tasks.outbox_relay
+
+Пачка строк блокируется (FOR UPDATE SKIP LOCKED), уходит в Redis одним pipeline XADD
+и удаляется в той же транзакции. Если процесс упадёт после XADD, но до COMMIT,
+строки отправятся снова: доставка at-least-once, task_id сообщения при этом тот же.
+"""
+
+import asyncio
+import logging
+import signal
+from datetime import UTC, datetime
+
+from prometheus_client import start_http_server
+from redis.asyncio import Redis
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from taskiq import AsyncBroker, TaskiqMessage, TaskiqMiddleware
+from taskiq.labels import prepare_label
+from taskiq.utils import maybe_awaitable
+from taskiq_redis import RedisStreamBroker
+
+from src.config.metrics_settings import get_metrics_settings
+from src.config.outbox_settings import OutboxSettings, get_outbox_settings
+from src.config.server_settings import get_server_settings
+from src.core.bg_tasks import tasks  # noqa: F401 - регистрирует задачи и их labels в брокере
+from src.core.bg_tasks.redis_broker import broker
+from src.core.metrics import (
+    OUTBOX_LAG,
+    OUTBOX_OLDEST_PENDING,
+    OUTBOX_PUBLISHED,
+    OUTBOX_RELAY_ERRORS,
+    metrics_registry,
+)
+from src.data_access.models import OutboxModel
+from src.data_access.repositories.outbox_repo import OutboxRepository
+from src.provides import container_factory
+
+logger = logging.getLogger(__name__)
+
+
+class OutboxRelay:
+    def __init__(
+        self,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        broker: RedisStreamBroker,
+        config: OutboxSettings,
+    ) -> None:
+        self._sessionmaker = sessionmaker
+        self._broker = broker
+        self._config = config
+
+    async def run(self, stop: asyncio.Event) -> None:
+        backoff = self._config.poll_interval
+        while not stop.is_set():
+            try:
+                published = await self.drain_once()
+            except Exception:
+                OUTBOX_RELAY_ERRORS.inc()
+                logger.exception("Outbox relay iteration failed, retrying in %.1fs", backoff)
+                await self._sleep(stop, backoff)
+                backoff = min(backoff * 2, self._config.max_backoff)
+                continue
+            backoff = self._config.poll_interval
+            # Полная пачка - скорее всего, есть ещё: следующая сразу, без паузы
+            if published < self._config.batch_size:
+                await self._sleep(stop, self._config.poll_interval)
+
+    async def drain_once(self) -> int:
+        async with self._sessionmaker() as session, session.begin():
+            outbox = OutboxRepository(session)
+            rows = await outbox.lock_batch(self._config.batch_size)
+            if rows:
+                await self._publish(rows)
+                await outbox.delete([row.id for row in rows])
+            oldest = await outbox.oldest_created_at()
+
+        now = datetime.now(UTC)
+        for row in rows:
+            OUTBOX_LAG.observe((now - row.created_at).total_seconds())
+        OUTBOX_PUBLISHED.inc(len(rows))
+        OUTBOX_OLDEST_PENDING.set((now - oldest).total_seconds() if oldest else 0)
+        return len(rows)
+
+    async def _publish(self, rows: list[OutboxModel]) -> None:
+        messages = [await self._prepare(row) for row in rows]
+        async with Redis(connection_pool=self._broker.connection_pool) as redis:
+            pipeline = redis.pipeline(transaction=False)
+            for message in messages:
+                broker_message = self._broker.formatter.dumps(message)
+                pipeline.xadd(
+                    broker_message.labels.get("queue_name") or self._broker.queue_name,
+                    {b"data": broker_message.message},
+                    maxlen=self._broker.maxlen,
+                    approximate=self._broker.approximate,
+                )
+            await pipeline.execute()
+        for message in messages:
+            await _run_middlewares(self._broker, "post_send", message)
+
+    async def _prepare(self, row: OutboxModel) -> TaskiqMessage:
+        """Сообщение, как его собрал бы task.kiq(**kwargs), с task_id строки outbox."""
+        task = self._broker.find_task(row.task_name)
+        labels, labels_types = {}, {}
+        for name, value in (task.labels if task else {}).items():
+            labels[name], labels_types[name] = prepare_label(value)
+        message = TaskiqMessage(
+            task_id=str(row.task_id),
+            task_name=row.task_name,
+            labels=labels,
+            labels_types=labels_types,
+            args=[],
+            kwargs=row.kwargs,
+        )
+        return await _run_middlewares(self._broker, "pre_send", message)
+
+    @staticmethod
+    async def _sleep(stop: asyncio.Event, seconds: float) -> None:
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=seconds)
+        except TimeoutError:
+            pass
+
+
+async def _run_middlewares(broker: AsyncBroker, hook: str, message: TaskiqMessage) -> TaskiqMessage:
+    # Тот же порядок, что в AsyncKicker.kiq: только переопределённые хуки
+    for middleware in broker.middlewares:
+        if getattr(middleware.__class__, hook) is getattr(TaskiqMiddleware, hook):
+            continue
+        result = await maybe_awaitable(getattr(middleware, hook)(message))
+        if isinstance(result, TaskiqMessage):
+            message = result
+    return message
+
+
+async def run_relay() -> None:
+    container = container_factory()
+    engine = await container.get(AsyncEngine)
+    sessionmaker = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+    metrics_config = get_metrics_settings()
+    if metrics_config.worker_port:
+        start_http_server(
+            port=metrics_config.worker_port,
+            addr=metrics_config.worker_host,
+            registry=metrics_registry(),
+        )
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, stop.set)
+
+    await broker.startup()
+    try:
+        await OutboxRelay(sessionmaker, broker, get_outbox_settings()).run(stop)
+    finally:
+        await broker.shutdown()
+        await container.close()
+
+
+def main() -> None:
+    logging.basicConfig(
+        level=getattr(logging, get_server_settings().LOG_LEVEL.upper()),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    asyncio.run(run_relay())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,34 @@
 import taskiq_fastapi
-from taskiq import TaskiqScheduler
-from taskiq.schedule_sources import LabelScheduleSource
 from taskiq_redis import RedisAsyncResultBackend, RedisStreamBroker
 
-from src.config.redis_settings import redis_config
+from src.config.metrics_settings import get_metrics_settings
+from src.config.redis_settings import get_redis_settings
+from src.config.taskiq_settings import get_taskiq_settings
+from src.core.bg_tasks.limits import TaskLimitsMiddleware
+from src.core.bg_tasks.middlewares import StreamBacklogMiddleware, TaskMetricsMiddleware
 
 result_backend = RedisAsyncResultBackend(
-    redis_url=redis_config.redis_url,
+    redis_url=get_redis_settings().redis_url,
 )
 
-broker = RedisStreamBroker(
-    url=redis_config.redis_url,
-).with_result_backend(result_backend)
-
-scheduler = TaskiqScheduler(broker=broker, sources=[LabelScheduleSource(broker)])
+broker = (
+    RedisStreamBroker(
+        url=get_redis_settings().redis_url,
+        queue_name=get_taskiq_settings().queue_name,
+        xread_count=get_taskiq_settings().xread_count,
+        xread_block=get_taskiq_settings().xread_block,
+        idle_timeout=get_taskiq_settings().idle_timeout,
+        unacknowledged_batch_size=get_taskiq_settings().unacknowledged_batch_size,
+        maxlen=get_taskiq_settings().maxlen,
+    )
+    .with_result_backend(result_backend)
+    .with_middlewares(
+        # Лимиты первыми: ожидание лимита попадает в taskiq_task_queue_wait_seconds,
+        # а не во время выполнения задачи
+        TaskLimitsMiddleware(get_taskiq_settings()),
+        TaskMetricsMiddleware(get_metrics_settings()),
+        StreamBacklogMiddleware(get_taskiq_settings()),
+    )
+)
 
 taskiq_fastapi.init(broker, "src.main:create_app")
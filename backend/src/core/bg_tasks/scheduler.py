@@ -0,0 +1,7 @@
+from taskiq import TaskiqScheduler
+from taskiq.schedule_sources import LabelScheduleSource
+
+from src.core.bg_tasks.redis_broker import broker
+
+# Отдельный модуль: API и воркер импортируют брокер, но планировщик им не нужен
+scheduler = TaskiqScheduler(broker=broker, sources=[LabelScheduleSource(broker)])
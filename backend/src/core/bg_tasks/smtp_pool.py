@@ -0,0 +1,124 @@
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from email.message import EmailMessage
+
+import aiosmtplib
+
+from src.config.smtp_settings import SMTPSettings
+from src.core.metrics import SMTP_SEND_DURATION
+
+logger = logging.getLogger(__name__)
+
+# Ошибки, после которых соединение считается мёртвым и письмо повторяется на новом.
+# SMTPServerDisconnected - подкласс ConnectionError
+_RECONNECT_ERRORS = (aiosmtplib.SMTPTimeoutError, ConnectionError)
+# Сервер ответил отказом, но соединение живое: aiosmtplib уже сделал RSET
+_RESPONSE_ERRORS = (aiosmtplib.SMTPResponseException, aiosmtplib.SMTPRecipientsRefused)
+
+
+@dataclass
+class _PooledConnection:
+    client: aiosmtplib.SMTP
+    last_used: float = field(default_factory=time.monotonic)
+    sent: int = 0
+
+
+class SMTPConnectionPool:
+    """
+    Пул авторизованных SMTP-соединений одного процесса воркера.
+
+    Соединение открывается (TCP + STARTTLS + LOGIN) один раз и переиспользуется.
+    Оно переоткрывается, если простояло дольше pool_idle_timeout, отправило
+    pool_max_messages писем или сервер его закрыл.
+    """
+
+    def __init__(self, config: SMTPSettings) -> None:
+        self._config = config
+        self._idle: list[_PooledConnection] = []
+        self._slots = asyncio.Semaphore(config.pool_size)
+        self._closing: set[asyncio.Task] = set()
+
+    async def send_message(self, message: EmailMessage) -> None:
+        started = time.perf_counter()
+        result = "error"
+        try:
+            await self._send_message(message)
+            result = "ok"
+        finally:
+            SMTP_SEND_DURATION.labels(result).observe(time.perf_counter() - started)
+
+    async def _send_message(self, message: EmailMessage) -> None:
+        async with self._slots:
+            connection = await self._acquire()
+            try:
+                await connection.client.send_message(message)
+            except _RECONNECT_ERRORS as e:
+                logger.warning("SMTP connection lost, reconnecting: %s", e)
+                await self._discard(connection)
+                connection = await self._connect()
+                try:
+                    await connection.client.send_message(message)
+                except BaseException:
+                    await self._discard(connection)
+                    raise
+            except _RESPONSE_ERRORS:
+                self._release(connection)
+                raise
+            except BaseException:
+                await self._discard(connection)
+                raise
+
+            connection.sent += 1
+            self._release(connection)
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(self._discard(connection) for connection in idle), *self._closing)
+
+    async def _acquire(self) -> _PooledConnection:
+        # LIFO: берём самое свежее соединение, старые скорее истекут по простою
+        while self._idle:
+            connection = self._idle.pop()
+            if self._is_usable(connection):
+                return connection
+            await self._discard(connection)
+        return await self._connect()
+
+    def _release(self, connection: _PooledConnection) -> None:
+        connection.last_used = time.monotonic()
+        if connection.sent >= self._config.pool_max_messages:
+            # Закрываем в фоне, чтобы не держать слот пула ради QUIT
+            task = asyncio.create_task(self._discard(connection))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+            return
+        self._idle.append(connection)
+
+    def _is_usable(self, connection: _PooledConnection) -> bool:
+        idle_for = time.monotonic() - connection.last_used
+        return connection.client.is_connected and idle_for < self._config.pool_idle_timeout
+
+    async def _connect(self) -> _PooledConnection:
+        client = aiosmtplib.SMTP(
+            hostname=self._config.host,
+            port=self._config.port,
+            start_tls=self._config.start_tls,
+            timeout=self._config.timeout,
+        )
+        await client.connect()
+        try:
+            await client.login(self._config.user, self._config.password)
+        except BaseException:
+            client.close()
+            raise
+        return _PooledConnection(client=client)
+
+    @staticmethod
+    async def _discard(connection: _PooledConnection) -> None:
+        try:
+            if connection.client.is_connected:
+                await connection.client.quit()
+        except (aiosmtplib.SMTPException, OSError):
+            connection.client.close()
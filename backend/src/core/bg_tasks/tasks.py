@@ -1,9 +1,44 @@
 # import os
 from email.message import EmailMessage
 
-from src.config.smtp_settings import smtp_config
+from redis.asyncio import Redis
+from taskiq import TaskiqDepends, TaskiqEvents, TaskiqState
+
+from src.config.notification_settings import get_notification_settings
+from src.config.smtp_settings import get_smtp_settings
+from src.core.bg_tasks.names import NOTIFY_ADMIN_TASK
+from src.core.bg_tasks.notifications import NotificationDigest
 from src.core.bg_tasks.redis_broker import broker
-from src.core.bg_tasks.utils import connect_smtp_and_send_email
+from src.core.bg_tasks.smtp_pool import SMTPConnectionPool
+from src.core.metrics import NOTIFICATIONS
+
+# Общие для всех процессов воркера лимиты задач, которые ходят в SMTP (см. limits.py)
+SMTP_LIMITS = {"limit_group": "smtp", "concurrency_limit": 4, "rate_limit": "10/s"}
+
+
+@broker.on_event(TaskiqEvents.WORKER_STARTUP)
+async def open_smtp_pool(state: TaskiqState) -> None:
+    """Свой пул SMTP-соединений в каждом процессе воркера"""
+    state.smtp_pool = SMTPConnectionPool(get_smtp_settings())
+    # Очередь сводки живёт в том же Redis, что и брокер: берём его пул соединений
+    state.digest = NotificationDigest(
+        Redis(connection_pool=broker.connection_pool), get_notification_settings()
+    )
+
+
+@broker.on_event(TaskiqEvents.WORKER_SHUTDOWN)
+async def close_smtp_pool(state: TaskiqState) -> None:
+    await state.smtp_pool.close()
+
+
+def build_message(subject: str, data: str, email_to: list[str]) -> EmailMessage:
+    message = EmailMessage()
+    message["Subject"] = subject
+    message["From"] = get_smtp_settings().user
+    message["To"] = email_to
+    message.set_content(data)
+    return message
+
 
 # Оставлен как пример периодик задачи
 # @broker.task(schedule=[{"cron": "*/1 * * * *"}])  # Каждые 1 минут
@@ -15,14 +50,14 @@ from src.core.bg_tasks.utils import connect_smtp_and_send_email
 #     return "Scheduled task completed"
 
 
-@broker.task
-async def send_email_task(data: str, email_to: list[str]) -> None:
-    message = EmailMessage()
-    message["Subject"] = "subject"
-    message["From"] = smtp_config.user
-    message["To"] = email_to
-
-    message.set_content(data)
+@broker.task(**SMTP_LIMITS)
+async def send_email_task(
+    data: str,
+    email_to: list[str],
+    subject: str = "subject",
+    state: TaskiqState = TaskiqDepends(),
+) -> None:
+    message = build_message(subject, data, email_to)
 
     # Оставлен как пример добавления HTML-контент в письмо
     # message.set_content(data, subtype='html')  # Устанавливаем HTML-контент
@@ -36,8 +71,49 @@ async def send_email_task(data: str, email_to: list[str]) -> None:
     #                        filename=("utf-8", "", f"{filename}"))
 
     try:
-        await connect_smtp_and_send_email(smtp_config, message)
+        await state.smtp_pool.send_message(message)
     except Exception as e:
         print(e)
 
     print("sent email")
+
+
+@broker.task(task_name=NOTIFY_ADMIN_TASK)
+async def notify_admin_task(
+    text: str,
+    urgent: bool = False,
+    state: TaskiqState = TaskiqDepends(),
+) -> None:
+    """
+    Уведомление администратору (SMTP_EMAIL_TO).
+
+    Обычные события копятся и уходят одной сводкой по расписанию flush_admin_digest_task
+    или сразу, как только их набралось NOTIFY_DIGEST_MAX_EVENTS. urgent=True - отдельное
+    письмо немедленно, мимо сводки, но через send_email_task и его SMTP_LIMITS.
+    """
+    email_to = get_smtp_settings().email_to
+    if not email_to:
+        return
+    if urgent:
+        NOTIFICATIONS.labels("immediate").inc()
+        await send_email_task.kiq(data=text, email_to=[email_to], subject="Уведомление")
+        return
+    NOTIFICATIONS.labels("digest").inc()
+    size = await state.digest.push(text)
+    if state.digest.is_full(size):
+        await flush_admin_digest_task.kiq()
+
+
+@broker.task(schedule=[{"cron": get_notification_settings().digest_cron}], **SMTP_LIMITS)
+async def flush_admin_digest_task(state: TaskiqState = TaskiqDepends()) -> int:
+    """Отправляет накопленные уведомления: одно письмо на NOTIFY_DIGEST_MAX_EVENTS событий."""
+    email_to = get_smtp_settings().email_to
+    if not email_to:
+        return 0
+
+    async def send(events: list[str]) -> None:
+        data = "\n".join(events)
+        subject = f"Сводка уведомлений: {len(events)}"
+        await state.smtp_pool.send_message(build_message(subject, data, [email_to]))
+
+    return await state.digest.flush(send)
@@ -11,8 +11,8 @@ async def connect_smtp_and_send_email(smtp_config: SMTPSettings, message: EmailM
         async with aiosmtplib.SMTP(
             hostname=smtp_config.host,
             port=smtp_config.port,
-            start_tls=True,  # use_tls=True (порт 465) или start_tls=True (порт 587)
-            timeout=10,  # Добавляем таймаут
+            start_tls=smtp_config.start_tls,  # use_tls=True (порт 465) или start_tls (порт 587)
+            timeout=smtp_config.timeout,
         ) as server:
             await server.login(smtp_config.user, smtp_config.password)
             await server.send_message(message)
@@ -0,0 +1,22 @@
+"""
+Запуск воркера taskiq с очисткой каталога метрик:
+
+    python -m src.core.bg_tasks.worker --fs-discover src.core.bg_tasks.redis_broker:broker ...
+
+Аргументы передаются `taskiq worker` как есть. Процесс заменяется taskiq (exec),
+поэтому сигналы и код выхода те же, что при прямом запуске.
+"""
+
+import os
+import sys
+
+from src.core.metrics_dir import clear_multiproc_dir
+
+
+def main() -> None:
+    clear_multiproc_dir()
+    os.execvp("taskiq", ["taskiq", "worker", *sys.argv[1:]])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+
+
+class DataLoader[K: Hashable, V]:
+    """
+    Склеивает load() одного запроса в пакетные вызовы batch_fn.
+
+    Ключи, запрошенные до следующего шага event loop (например, из asyncio.gather),
+    уходят одним вызовом batch_fn, пачками не больше max_batch_size. Результаты
+    запоминаются: повторный load того же ключа не идёт в хранилище. Пакеты выполняются
+    по одному, поэтому batch_fn может использовать общую AsyncSession запроса.
+    Живёт не дольше запроса: кеш не сбрасывается при записи.
+    """
+
+    def __init__(
+        self, batch_fn: Callable[[list[K]], Awaitable[Mapping[K, V]]], max_batch_size: int
+    ) -> None:
+        self._batch_fn = batch_fn
+        self._max_batch_size = max_batch_size
+        self._results: dict[K, asyncio.Future[V | None]] = {}
+        self._queue: list[K] = []
+        self._lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    async def load(self, key: K) -> V | None:
+        """Значение по ключу или None, если batch_fn его не вернул."""
+        future = self._results.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._results[key] = future
+            if not self._queue:
+                asyncio.get_running_loop().call_soon(self._dispatch)
+            self._queue.append(key)
+        return await asyncio.shield(future)
+
+    async def load_many(self, keys: Iterable[K]) -> list[V | None]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def _dispatch(self) -> None:
+        keys, self._queue = self._queue, []
+        for start in range(0, len(keys), self._max_batch_size):
+            batch = keys[start : start + self._max_batch_size]
+            task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, keys: list[K]) -> None:
+        try:
+            async with self._lock:
+                values = await self._batch_fn(keys)
+        except Exception as e:
+            # Ошибку не запоминаем: следующий load тех же ключей повторит запрос
+            for key in keys:
+                future = self._results.pop(key)
+                future.set_exception(e)
+                future.exception()  # Без ожидающих не будет "exception was never retrieved"
+            return
+        except BaseException:
+            for key in keys:
+                self._results.pop(key).cancel()
+            raise
+        for key in keys:
+            self._results[key].set_result(values.get(key))
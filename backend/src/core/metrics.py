@@ -0,0 +1,182 @@
+import os
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    multiprocess,
+)
+
+# Несколько процессов (taskiq worker --workers N, python -m src.server) пишут метрики
+# в общий каталог, каталог должен существовать до создания первой метрики
+MULTIPROC_DIR = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+if MULTIPROC_DIR:
+    os.makedirs(MULTIPROC_DIR, exist_ok=True)
+
+PASSWORD_HASHER_QUEUE_DEPTH = Gauge(
+    "password_hasher_queue_depth",
+    "Password hashing jobs accepted by the pool and not finished yet",
+    multiprocess_mode="livesum",
+)
+PASSWORD_HASHER_DURATION = Histogram(
+    "password_hasher_duration_seconds",
+    "Time from submitting a password hashing job to getting its result",
+    ["operation"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+PASSWORD_HASHER_REJECTED = Counter(
+    "password_hasher_rejected_total",
+    "Password hashing jobs rejected because the queue was full",
+    ["operation"],
+)
+
+USER_CACHE_HITS = Counter("user_cache_hits_total", "User profile cache hits, negative included")
+USER_CACHE_MISSES = Counter("user_cache_misses_total", "User profile cache misses")
+USER_CACHE_COALESCED = Counter(
+    "user_cache_coalesced_total",
+    "Cache misses served by another in-flight query for the same user",
+)
+USER_CACHE_ERRORS = Counter(
+    "user_cache_errors_total", "Redis errors in the user profile cache", ["operation"]
+)
+
+# livesum: в multiprocess-режиме - сумма по живым процессам, то есть по всему узлу
+DB_POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Configured size of the SQLAlchemy connection pool",
+    multiprocess_mode="livesum",
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out of the pool",
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow", "Connections opened above pool_size", multiprocess_mode="livesum"
+)
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the pool",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0),
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total", "Checkouts that failed with a pool timeout"
+)
+
+DB_STATEMENT_DURATION = Histogram(
+    "db_statement_duration_seconds",
+    "SQL statement execution time measured by engine events",
+    ["operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0),
+)
+DB_STATEMENT_ERRORS = Counter(
+    "db_statement_errors_total", "SQL statements that raised an error", ["operation"]
+)
+
+HTTP_REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being processed",
+    multiprocess_mode="livesum",
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+TASKIQ_TASK_ENQUEUE_DURATION = Histogram(
+    "taskiq_task_enqueue_seconds",
+    "Time to put a task message on the broker",
+    ["task_name"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+)
+TASKIQ_TASK_QUEUE_WAIT = Histogram(
+    "taskiq_task_queue_wait_seconds",
+    "Time from enqueue to the start of execution",
+    ["task_name"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+TASKIQ_TASK_DURATION = Histogram(
+    "taskiq_task_duration_seconds",
+    "Task execution time",
+    ["task_name", "status"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0),
+)
+
+TASKIQ_LIMIT_WAIT = Histogram(
+    "taskiq_limit_wait_seconds",
+    "Time a task waited for its concurrency slot and rate limit token",
+    ["limit_group"],
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+TASKIQ_LIMIT_TIMEOUTS = Counter(
+    "taskiq_limit_timeouts_total",
+    "Tasks left unacknowledged for redelivery after waiting too long for their limits",
+    ["task_name"],
+)
+# Опрашивает каждый процесс воркера; значение одно на стрим, берём последнее
+TASKIQ_STREAM_LENGTH = Gauge(
+    "taskiq_stream_length",
+    "Messages in the broker stream (XLEN), trimmed by maxlen only",
+    ["queue"],
+    multiprocess_mode="livemostrecent",
+)
+TASKIQ_CONSUMER_LAG = Gauge(
+    "taskiq_consumer_lag",
+    "Messages in the stream not yet delivered to the consumer group",
+    ["queue"],
+    multiprocess_mode="livemostrecent",
+)
+TASKIQ_CONSUMER_PENDING = Gauge(
+    "taskiq_consumer_pending",
+    "Messages delivered to workers and not acknowledged yet",
+    ["queue"],
+    multiprocess_mode="livemostrecent",
+)
+
+OUTBOX_PUBLISHED = Counter("outbox_published_total", "Outbox rows published to the broker")
+OUTBOX_LAG = Histogram(
+    "outbox_lag_seconds",
+    "Time from the outbox row insert to its publication to the broker",
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0),
+)
+OUTBOX_OLDEST_PENDING = Gauge(
+    "outbox_oldest_pending_seconds",
+    "Age of the oldest unpublished outbox row, 0 when the outbox is empty",
+    multiprocess_mode="max",
+)
+OUTBOX_RELAY_ERRORS = Counter(
+    "outbox_relay_errors_total", "Relay iterations failed on the database or the broker"
+)
+
+NOTIFICATIONS = Counter("notifications_total", "Admin notifications by delivery mode", ["delivery"])
+NOTIFICATION_DIGEST_SIZE = Histogram(
+    "notification_digest_size",
+    "Events coalesced into one digest email",
+    buckets=(1, 5, 10, 25, 50, 100, 200, 500, 1000),
+)
+
+SMTP_SEND_DURATION = Histogram(
+    "smtp_send_duration_seconds",
+    "Time to send one email, including waiting for a pooled connection",
+    ["result"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+
+
+def metrics_registry() -> CollectorRegistry:
+    """Реестр для экспорта: в multiprocess-режиме собирает метрики всех процессов."""
+    if not MULTIPROC_DIR:
+        return REGISTRY
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def mark_process_dead() -> None:
+    """Убирает livesum-gauges завершающегося процесса из общего каталога."""
+    if MULTIPROC_DIR:
+        multiprocess.mark_process_dead(os.getpid())
@@ -0,0 +1,18 @@
+import os
+from pathlib import Path
+
+
+def clear_multiproc_dir() -> None:
+    """
+    Файлы метрик прошлого запуска с чужими pid попали бы в /metrics.
+
+    Вызывается в родительском процессе до запуска дочерних (uvicorn, taskiq worker):
+    модуль не импортирует src.core.metrics, чтобы до очистки не создать свои файлы.
+    """
+    multiproc_dir = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if not multiproc_dir:
+        return
+    path = Path(multiproc_dir)
+    path.mkdir(parents=True, exist_ok=True)
+    for file in path.glob("*.db"):
+        file.unlink()
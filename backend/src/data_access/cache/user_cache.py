@@ -0,0 +1,176 @@
+import json
+import logging
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import datetime
+from uuid import UUID
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from src.config.cache_settings import CacheSettings
+from src.core.metrics import (
+    USER_CACHE_COALESCED,
+    USER_CACHE_ERRORS,
+    USER_CACHE_HITS,
+    USER_CACHE_MISSES,
+)
+from src.core.single_flight import SingleFlight
+from src.domain.user.dtos import UserOutputDto
+
+logger = logging.getLogger(__name__)
+
+NEGATIVE_ENTRY = b"null"
+
+
+class UserCache:
+    """
+    Read-through кеш UserOutputDto в Redis.
+    Недоступный Redis не ломает чтение: запрос уходит в БД, ошибка попадает в метрики.
+    """
+
+    KEY_PREFIX = "user:profile:"
+
+    def __init__(self, redis: Redis, config: CacheSettings) -> None:
+        self._redis = redis
+        self._ttl = config.user_ttl
+        self._negative_ttl = config.user_negative_ttl
+        self._single_flight = SingleFlight()
+
+    async def get_or_load(
+        self, user_id: UUID, loader: Callable[[], Awaitable[UserOutputDto | None]]
+    ) -> UserOutputDto | None:
+        key = self._key(user_id)
+        try:
+            cached = await self._redis.get(key)
+        except RedisError as e:
+            USER_CACHE_ERRORS.labels("get").inc()
+            logger.warning("User cache get failed: %s", e)
+            cached = None
+
+        if cached is not None:
+            USER_CACHE_HITS.inc()
+            return self._loads(cached)
+
+        USER_CACHE_MISSES.inc()
+        dto, shared = await self._single_flight.do(key, lambda: self._load(key, loader))
+        if shared:
+            USER_CACHE_COALESCED.inc()
+        return dto
+
+    async def get_many_or_load(
+        self,
+        user_ids: list[UUID],
+        loader: Callable[[list[UUID]], Awaitable[dict[UUID, UserOutputDto]]],
+    ) -> dict[UUID, UserOutputDto]:
+        """
+        MGET всех ключей, промахи - одним вызовом loader; отсутствующие в БД id
+        кешируются как негативные записи. Без single flight: его даёт get_or_load.
+        """
+        try:
+            cached = await self._redis.mget([self._key(user_id) for user_id in user_ids])
+        except RedisError as e:
+            USER_CACHE_ERRORS.labels("get").inc()
+            logger.warning("User cache get failed: %s", e)
+            cached = [None] * len(user_ids)
+
+        found: dict[UUID, UserOutputDto] = {}
+        missing: list[UUID] = []
+        for user_id, raw in zip(user_ids, cached, strict=True):
+            if raw is None:
+                missing.append(user_id)
+            elif (dto := self._loads(raw)) is not None:
+                found[user_id] = dto
+        USER_CACHE_HITS.inc(len(user_ids) - len(missing))
+        if not missing:
+            return found
+
+        USER_CACHE_MISSES.inc(len(missing))
+        loaded = await loader(missing)
+        found.update(loaded)
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for user_id in missing:
+                    dto = loaded.get(user_id)
+                    if dto is None:
+                        pipe.set(self._key(user_id), NEGATIVE_ENTRY, ex=self._negative_ttl)
+                    else:
+                        pipe.set(self._key(user_id), self._dumps(dto), ex=self._ttl)
+                await pipe.execute()
+        except RedisError as e:
+            USER_CACHE_ERRORS.labels("set").inc()
+            logger.warning("User cache set failed: %s", e)
+        return found
+
+    async def peek(self, user_id: UUID) -> tuple[bool, UserOutputDto | None]:
+        """
+        Только чтение кеша, без загрузки из БД: (есть ли запись, профиль).
+        Ошибка Redis - то же, что промах.
+        """
+        try:
+            cached = await self._redis.get(self._key(user_id))
+        except RedisError as e:
+            USER_CACHE_ERRORS.labels("get").inc()
+            logger.warning("User cache get failed: %s", e)
+            return False, None
+        if cached is None:
+            return False, None
+        USER_CACHE_HITS.inc()
+        return True, self._loads(cached)
+
+    async def invalidate(self, user_ids: Iterable[UUID]) -> None:
+        keys = [self._key(user_id) for user_id in user_ids]
+        if not keys:
+            return
+        try:
+            await self._redis.delete(*keys)
+        except RedisError as e:
+            USER_CACHE_ERRORS.labels("delete").inc()
+            logger.warning("User cache invalidation failed: %s", e)
+
+    async def _load(
+        self, key: str, loader: Callable[[], Awaitable[UserOutputDto | None]]
+    ) -> UserOutputDto | None:
+        dto = await loader()
+        try:
+            if dto is None:
+                await self._redis.set(key, NEGATIVE_ENTRY, ex=self._negative_ttl)
+            else:
+                await self._redis.set(key, self._dumps(dto), ex=self._ttl)
+        except RedisError as e:
+            USER_CACHE_ERRORS.labels("set").inc()
+            logger.warning("User cache set failed: %s", e)
+        return dto
+
+    def _key(self, user_id: UUID) -> str:
+        return f"{self.KEY_PREFIX}{user_id}"
+
+    @staticmethod
+    def _dumps(dto: UserOutputDto) -> bytes:
+        return json.dumps(
+            {
+                "id": str(dto.id),
+                "email": dto.email,
+                "created_at": dto.created_at.isoformat() if dto.created_at else None,
+                "updated_at": dto.updated_at.isoformat() if dto.updated_at else None,
+                "first_name": dto.first_name,
+                "last_name": dto.last_name,
+                "is_superuser": dto.is_superuser,
+                "is_active": dto.is_active,
+            }
+        ).encode()
+
+    @staticmethod
+    def _loads(raw: bytes) -> UserOutputDto | None:
+        data = json.loads(raw)
+        if data is None:
+            return None
+        return UserOutputDto(
+            id=UUID(data["id"]),
+            email=data["email"],
+            created_at=datetime.fromisoformat(data["created_at"]) if data["created_at"] else None,
+            updated_at=datetime.fromisoformat(data["updated_at"]) if data["updated_at"] else None,
+            first_name=data["first_name"],
+            last_name=data["last_name"],
+            is_superuser=data["is_superuser"],
+            is_active=data["is_active"],
+        )
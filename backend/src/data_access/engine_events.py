@@ -0,0 +1,42 @@
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.core.metrics import DB_STATEMENT_DURATION, DB_STATEMENT_ERRORS
+
+# Метка operation - первое слово SQL; всё остальное попадает в OTHER
+STATEMENT_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH", "CREATE", "TRUNCATE"}
+_STARTED_KEY = "statement_started"
+
+
+def statement_operation(statement: str) -> str:
+    words = statement.split(None, 1)
+    operation = words[0].upper() if words else ""
+    return operation if operation in STATEMENT_OPERATIONS else "OTHER"
+
+
+def bind_statement_metrics(engine: AsyncEngine) -> None:
+    """
+    Время каждого SQL-запроса через события before/after_cursor_execute.
+    COPY через драйвер asyncpg (save_many) мимо курсора SQLAlchemy не проходит.
+    """
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn: Connection, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn: Connection, cursor, statement, parameters, context, executemany) -> None:
+        started = conn.info[_STARTED_KEY].pop()
+        DB_STATEMENT_DURATION.labels(statement_operation(statement)).observe(
+            time.perf_counter() - started
+        )
+
+    @event.listens_for(sync_engine, "handle_error")
+    def _error(context: ExceptionContext) -> None:
+        if context.connection is not None and context.connection.info.get(_STARTED_KEY):
+            context.connection.info[_STARTED_KEY].pop()
+        DB_STATEMENT_ERRORS.labels(statement_operation(context.statement or "")).inc()
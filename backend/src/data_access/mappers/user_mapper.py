@@ -26,16 +26,32 @@ class UserModelMapper:
             updated_at=entity.updated_at.value,
         )
 
+    @staticmethod
+    def entity_to_record(entity: UserEntity) -> tuple:
+        """Кортеж в порядке колонок COPY (см. UserRepository.save_many)."""
+        return (
+            entity.id.value,
+            entity.email.value,
+            entity.password.value,
+            entity.first_name.value if entity.first_name else None,
+            entity.last_name.value if entity.last_name else None,
+            entity.is_superuser,
+            entity.is_active,
+            entity.created_at.value,
+            entity.updated_at.value,
+        )
+
     @staticmethod
     def model_to_entity(model: UserModel) -> UserEntity:
-        return UserEntity(
-            id_=UserIdVo(model.id),
-            email=UserEmailVo(model.email),
-            password=PasswordHashVo.from_hash(model.password),
-            first_name=UserFirstNameVo(model.first_name) if model.first_name else None,
-            last_name=UserLastNameVo(model.first_name) if model.first_name else None,
+        # Строки из БД уже валидны: собираем VO и сущность без повторных проверок
+        return UserEntity.from_trusted(
+            id_=UserIdVo.from_trusted(model.id),
+            email=UserEmailVo.from_trusted(model.email),
+            password=PasswordHashVo.from_trusted(model.password),
+            first_name=UserFirstNameVo.from_trusted(model.first_name) if model.first_name else None,
+            last_name=UserLastNameVo.from_trusted(model.last_name) if model.last_name else None,
             is_superuser=model.is_superuser,
             is_active=model.is_active,
-            created_at=UserCreatedAtVo(model.created_at),
-            updated_at=UserUpdatedAtVo(model.updated_at),
+            created_at=UserCreatedAtVo.from_trusted(model.created_at),
+            updated_at=UserUpdatedAtVo.from_trusted(model.updated_at),
         )
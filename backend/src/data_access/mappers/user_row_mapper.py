@@ -0,0 +1,22 @@
+from sqlalchemy import Row
+
+from src.data_access.models import UserModel
+from src.domain.user.dtos import UserOutputDto
+
+# Колонки, которых достаточно для UserOutputDto; порядок совпадает с row_to_output_dto
+USER_OUTPUT_COLUMNS = (
+    UserModel.id,
+    UserModel.email,
+    UserModel.created_at,
+    UserModel.updated_at,
+    UserModel.first_name,
+    UserModel.last_name,
+    UserModel.is_superuser,
+    UserModel.is_active,
+)
+
+
+class UserRowMapper:
+    @staticmethod
+    def row_to_output_dto(row: Row) -> UserOutputDto:
+        return UserOutputDto(*row)
@@ -1,7 +1,9 @@
 from src.data_access.models.base import Base
+from src.data_access.models.outbox import OutboxModel
 from src.data_access.models.user import UserModel
 
 __all__ = [
     "Base",
+    "OutboxModel",
     "UserModel",
 ]
@@ -1,10 +1,10 @@
 from sqlalchemy import MetaData
 from sqlalchemy.orm import DeclarativeBase
 
-from src.config.db_settings import db_settings as db
+from src.config.db_settings import DBSettings
 
 
 class Base(DeclarativeBase):
     __abstract__ = True
 
-    metadata = MetaData(naming_convention=db.naming_convention)
+    metadata = MetaData(naming_convention=DBSettings.naming_convention)
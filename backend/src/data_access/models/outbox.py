@@ -0,0 +1,28 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import TIMESTAMP, BigInteger, Identity, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PostgreSQLUUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.data_access.models.base import Base
+
+
+class OutboxModel(Base):
+    """
+    Задачи taskiq, записанные в той же транзакции, что и изменения, которые их породили.
+    Реле отправляет строки в брокер и удаляет их.
+    """
+
+    __tablename__ = "outbox"
+
+    # Монотонный id задаёт порядок отправки и дешёвую выборку самой старой строки по PK
+    id: Mapped[int] = mapped_column(BigInteger, Identity(), primary_key=True)
+    # task_id сообщения taskiq: при повторной отправке (at-least-once) он тот же
+    task_id: Mapped[UUID] = mapped_column(PostgreSQLUUID(as_uuid=True), nullable=False)
+    task_name: Mapped[str] = mapped_column(String(255), nullable=False)
+    kwargs: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        TIMESTAMP(timezone=True), server_default=func.now(), nullable=False
+    )
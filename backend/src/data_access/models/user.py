@@ -1,4 +1,4 @@
-from sqlalchemy import Boolean
+from sqlalchemy import Boolean, Computed, Index, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.data_access.models import Base
@@ -7,10 +7,43 @@ from src.data_access.models.mixins import DatetimeFieldsMixin, UUIDPkMixin
 
 class UserModel(Base, DatetimeFieldsMixin, UUIDPkMixin):
     __tablename__ = "users"
+    __table_args__ = (
+        Index("ix_users_created_at_id", "created_at", "id"),
+        # Страницы списка с редкими фильтрами: диапазон по своему индексу, а не обход
+        # ix_users_created_at_id с отбрасыванием почти всех строк
+        Index(
+            "ix_users_superusers_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("is_superuser"),
+        ),
+        Index(
+            "ix_users_inactive_created_at_id",
+            "created_at",
+            "id",
+            postgresql_where=text("NOT is_active"),
+        ),
+        Index("ix_users_email_normalized", "email_normalized", unique=True),
+        # pg_trgm: ILIKE '%term%' по этим колонкам идёт через индекс, а не seq scan;
+        # GiST, а не GIN, ещё и отдаёт строки по близости (ORDER BY column <-> term)
+        *(
+            Index(
+                f"ix_users_{column}_trgm_gist",
+                column,
+                postgresql_using="gist",
+                postgresql_ops={column: "gist_trgm_ops"},
+            )
+            for column in ("email", "first_name", "last_name")
+        ),
+    )
 
     first_name: Mapped[str] = mapped_column(nullable=True)
     last_name: Mapped[str] = mapped_column(nullable=True)
-    email: Mapped[str] = mapped_column(unique=True, nullable=False)
+    email: Mapped[str] = mapped_column(nullable=False)
+    # Email в нижнем регистре считает сама БД; уникальность email проверяется по нему
+    email_normalized: Mapped[str] = mapped_column(
+        Computed("lower(email)", persisted=True), nullable=False
+    )
     password: Mapped[str] = mapped_column(nullable=False)
     is_superuser: Mapped[bool] = mapped_column(Boolean, default=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
@@ -0,0 +1,71 @@
+import time
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
+
+from src.core.metrics import (
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_TIMEOUTS,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_POOL_OVERFLOW,
+    DB_POOL_SIZE,
+    MULTIPROC_DIR,
+)
+
+
+class InstrumentedAsyncAdaptedQueuePool(AsyncAdaptedQueuePool):
+    """Пул asyncpg по умолчанию, который замеряет ожидание свободного соединения."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            DB_POOL_CHECKOUT_TIMEOUTS.inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+
+
+def bind_pool_metrics(engine: AsyncEngine) -> None:
+    """
+    Gauges читают состояние пула в момент сбора метрик.
+    Пул берётся через engine, потому что engine.dispose() заменяет его новым.
+    """
+    if MULTIPROC_DIR:
+        _bind_pool_events(engine)
+        return
+    DB_POOL_SIZE.set_function(lambda: engine.pool.size())
+    DB_POOL_CHECKED_OUT.set_function(lambda: engine.pool.checkedout())
+    DB_POOL_OVERFLOW.set_function(lambda: max(engine.pool.overflow(), 0))
+
+
+def _bind_pool_events(engine: AsyncEngine) -> None:
+    """
+    set_function не пишет в PROMETHEUS_MULTIPROC_DIR, и /metrics другого процесса
+    его не увидит. Поэтому счётчик выданных соединений ведётся по событиям пула:
+    checkin срабатывает до возврата соединения, и сам пул в этот момент ещё не обновлён.
+    """
+    size = engine.pool.size()
+    checked_out = 0
+
+    def publish() -> None:
+        DB_POOL_CHECKED_OUT.set(checked_out)
+        # Соединения сверх pool_size закрываются при возврате, поэтому все они выданы
+        DB_POOL_OVERFLOW.set(max(checked_out - size, 0))
+
+    def on_checkout(*_) -> None:
+        nonlocal checked_out
+        checked_out += 1
+        publish()
+
+    def on_checkin(*_) -> None:
+        nonlocal checked_out
+        checked_out -= 1
+        publish()
+
+    DB_POOL_SIZE.set(size)
+    event.listen(engine.sync_engine, "checkout", on_checkout)
+    event.listen(engine.sync_engine, "checkin", on_checkin)
@@ -0,0 +1,133 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    any_,
+    bindparam,
+    case,
+    func,
+    or_,
+    select,
+    tuple_,
+    union,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PostgreSQLUUID
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.user.iquery import IUserQueryService
+from src.data_access.mappers.user_row_mapper import USER_OUTPUT_COLUMNS, UserRowMapper
+from src.data_access.models import UserModel
+from src.domain.user.dtos import UserOutputDto
+
+# Колонки с GiST trgm-индексами (ix_users_*_trgm_gist)
+SEARCH_COLUMNS = (UserModel.email, UserModel.first_name, UserModel.last_name)
+# Сколько ближайших совпадений брать по каждой колонке: частый терм вроде "mail"
+# совпадает с половиной таблицы, а similarity() считается для каждого кандидата
+SEARCH_CANDIDATES = 500
+
+
+def _contains(column: ColumnElement[str], term: str) -> ColumnElement[bool]:
+    """column ILIKE '%term%'; без cast(), иначе индекс не используется."""
+    escaped = term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return column.ilike(f"%{escaped}%")
+
+
+def search_condition(term: str) -> ColumnElement[bool]:
+    """ILIKE '%term%' хотя бы по одной из SEARCH_COLUMNS."""
+    return or_(*(_contains(column, term) for column in SEARCH_COLUMNS))
+
+
+def search_rank(term: str) -> ColumnElement[float]:
+    # Лучшая similarity среди совпавших колонок; greatest() в Postgres пропускает NULL,
+    # поэтому несовпавшие колонки и пустые имена не мешают
+    return func.greatest(
+        *(
+            case((_contains(column, term), func.similarity(column, term)))
+            for column in SEARCH_COLUMNS
+        )
+    )
+
+
+class UserQueryService(IUserQueryService):
+    """
+    Core select() только нужных колонок: без хеша пароля, ORM-объектов и identity map.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self._session = session
+        self.model = UserModel
+
+    async def get_by_id(self, user_id: UUID) -> UserOutputDto | None:
+        return await self._fetch_one(self._select().where(self.model.id == user_id))
+
+    async def get_many(self, user_ids: list[UUID]) -> list[UserOutputDto]:
+        # id = ANY($1): один параметр-массив вместо IN с параметром на каждый id,
+        # текст запроса не зависит от числа id и подготавливается один раз
+        ids = bindparam("user_ids", user_ids, type_=ARRAY(PostgreSQLUUID(as_uuid=True)))
+        result = await self._session.execute(self._select().where(self.model.id == any_(ids)))
+        return [UserRowMapper.row_to_output_dto(row) for row in result]
+
+    async def get_by_email(self, email: str) -> UserOutputDto | None:
+        query = self._select().where(self.model.email_normalized == email.lower())
+        return await self._fetch_one(query)
+
+    async def search(self, term: str, limit: int) -> list[UserOutputDto]:
+        # По каждой колонке - SEARCH_CANDIDATES ближайших совпадений: ILIKE и ORDER BY
+        # col <-> term идут по GiST-индексу колонки. Ранг строки - similarity одной из
+        # её совпавших колонок, поэтому первые limit <= SEARCH_CANDIDATES строк общего
+        # ранжирования всегда среди кандидатов
+        candidates = union(
+            *(
+                select(self.model.id)
+                .where(_contains(column, term))
+                .order_by(column.op("<->")(term))
+                .limit(SEARCH_CANDIDATES)
+                for column in SEARCH_COLUMNS
+            )
+        ).subquery()
+        query = (
+            self._select()
+            .join(candidates, candidates.c.id == self.model.id)
+            .order_by(search_rank(term).desc(), self.model.id)
+            .limit(limit)
+        )
+        result = await self._session.execute(query)
+        return [UserRowMapper.row_to_output_dto(row) for row in result]
+
+    async def list_page(
+        self,
+        limit: int,
+        cursor: tuple[datetime, UUID] | None = None,
+        is_active: bool | None = None,
+        is_superuser: bool | None = None,
+    ) -> list[UserOutputDto]:
+        # Keyset по индексу ix_users_created_at_id: одно сканирование диапазона без OFFSET
+        query = (
+            self._select().order_by(self.model.created_at.desc(), self.model.id.desc()).limit(limit)
+        )
+        if cursor is not None:
+            query = query.where(tuple_(self.model.created_at, self.model.id) < cursor)
+        # Фильтры - литералы, а не $1: иначе generic-план не докажет условие частичного
+        # индекса. Редкие значения (is_superuser, not is_active) идут по частичным
+        # индексам, частые - по ix_users_created_at_id, где подходит почти каждая строка
+        if is_active is not None:
+            query = query.where(self.model.is_active if is_active else ~self.model.is_active)
+        if is_superuser is not None:
+            query = query.where(
+                self.model.is_superuser if is_superuser else ~self.model.is_superuser
+            )
+
+        result = await self._session.execute(query)
+        return [UserRowMapper.row_to_output_dto(row) for row in result]
+
+    @staticmethod
+    def _select() -> Select:
+        return select(*USER_OUTPUT_COLUMNS)
+
+    async def _fetch_one(self, query: Select) -> UserOutputDto | None:
+        result = await self._session.execute(query)
+        row = result.one_or_none()
+        return UserRowMapper.row_to_output_dto(row) if row else None
@@ -0,0 +1,81 @@
+from collections.abc import Iterable
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.user.irepo import IUserRepository
+from src.data_access.cache.user_cache import UserCache
+from src.data_access.session import after_commit
+from src.domain.user.dtos import UserOutputDto
+from src.domain.user.entity import UserEntity
+
+# id пользователей, записанных в этой сессии: кеш сбрасывается после её COMMIT
+PENDING_INVALIDATIONS = "user_cache_invalidate"
+
+
+class CachedUserRepository(IUserRepository):
+    """
+    Декоратор репозитория: get_output_by_id, get_outputs_by_ids и get_updated_at читают
+    через UserCache, записи сбрасывают кеш после COMMIT сессии, остальное делегируется
+    как есть.
+    """
+
+    def __init__(self, repo: IUserRepository, cache: UserCache, session: AsyncSession):
+        self._repo = repo
+        self._cache = cache
+        self._session = session
+
+    async def save(self, user: UserEntity) -> None:
+        await self._repo.save(user)
+        self._invalidate_after_commit([user.id.value])
+
+    async def create_if_absent(self, user: UserEntity) -> bool:
+        created = await self._repo.create_if_absent(user)
+        if created:
+            self._invalidate_after_commit([user.id.value])
+        return created
+
+    async def update_password_hash(self, user_id: UUID, password_hash: str) -> None:
+        # Хеша пароля нет в кешируемом профиле, сбрасывать нечего
+        await self._repo.update_password_hash(user_id, password_hash)
+
+    async def save_many(self, users: list[UserEntity]) -> set[UUID]:
+        inserted = await self._repo.save_many(users)
+        # Сбрасываем и негативные записи для только что созданных id
+        self._invalidate_after_commit(inserted)
+        return inserted
+
+    async def get_by_id(self, user_id: UUID) -> UserEntity | None:
+        return await self._repo.get_by_id(user_id)
+
+    async def get_output_by_id(self, user_id: UUID) -> UserOutputDto | None:
+        return await self._cache.get_or_load(user_id, lambda: self._repo.get_output_by_id(user_id))
+
+    async def get_outputs_by_ids(self, user_ids: list[UUID]) -> dict[UUID, UserOutputDto]:
+        if len(user_ids) == 1:
+            # Один id - через single flight get_or_load, как отдельный GET
+            dto = await self.get_output_by_id(user_ids[0])
+            return {dto.id: dto} if dto else {}
+        return await self._cache.get_many_or_load(user_ids, self._repo.get_outputs_by_ids)
+
+    async def get_updated_at(self, user_id: UUID) -> datetime | None:
+        # Профиль в кеше - тот же, что отдаст get_output_by_id; промах кеш не заполняет
+        found, dto = await self._cache.peek(user_id)
+        if found:
+            return dto.updated_at if dto else None
+        return await self._repo.get_updated_at(user_id)
+
+    async def get_by_email(self, email: str) -> UserEntity | None:
+        return await self._repo.get_by_email(email)
+
+    async def email_exists(self, email: str) -> bool:
+        return await self._repo.email_exists(email)
+
+    def _invalidate_after_commit(self, user_ids: Iterable[UUID]) -> None:
+        # Сброс до COMMIT не помогает: параллельное чтение вернёт в кеш старую строку
+        pending = self._session.info.get(PENDING_INVALIDATIONS)
+        if pending is None:
+            pending = self._session.info[PENDING_INVALIDATIONS] = set()
+            after_commit(self._session, lambda: self._cache.invalidate(pending))
+        pending.update(user_ids)
@@ -0,0 +1,39 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.apps.outbox.ioutbox import IOutbox
+from src.data_access.models import OutboxModel
+
+
+class OutboxRepository(IOutbox):
+    def __init__(self, session: AsyncSession):
+        self._session = session
+        self.model = OutboxModel
+
+    async def add(self, task_name: str, kwargs: dict) -> None:
+        self._session.add(self.model(task_id=uuid.uuid4(), task_name=task_name, kwargs=kwargs))
+
+    async def lock_batch(self, limit: int) -> list[OutboxModel]:
+        """
+        Самые старые строки, заблокированные до конца транзакции. SKIP LOCKED позволяет
+        запускать несколько реле: каждое берёт свою пачку.
+        """
+        query = (
+            select(self.model)
+            .order_by(self.model.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self._session.execute(query)
+        return list(result.scalars().all())
+
+    async def delete(self, ids: list[int]) -> None:
+        await self._session.execute(delete(self.model).where(self.model.id.in_(ids)))
+
+    async def oldest_created_at(self) -> datetime | None:
+        query = select(self.model.created_at).order_by(self.model.id).limit(1)
+        result = await self._session.execute(query)
+        return result.scalar_one_or_none()
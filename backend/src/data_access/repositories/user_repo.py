@@ -1,24 +1,93 @@
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import exists, select, text, update
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.apps.user.irepo import IUserRepository
 from src.data_access.mappers.user_mapper import UserModelMapper
 from src.data_access.models import UserModel
+from src.data_access.queries.user_queries import UserQueryService
+from src.domain.user.dtos import UserOutputDto
 from src.domain.user.entity import UserEntity
 
+# Порядок колонок UserModelMapper.entity_to_record (save_many, create_if_absent)
+_COPY_COLUMNS = (
+    "id",
+    "email",
+    "password",
+    "first_name",
+    "last_name",
+    "is_superuser",
+    "is_active",
+    "created_at",
+    "updated_at",
+)
+_IMPORT_TABLE = "users_import"
+
 
 class UserRepository(IUserRepository):
     def __init__(self, session: AsyncSession):
         self._session = session
         self.model = UserModel
+        self._queries = UserQueryService(session)
 
     # TODO: добавить обработку ошибок
     async def save(self, user: UserEntity) -> None:
         user_model = UserModelMapper.entity_to_model(user)
         self._session.add(user_model)
 
+    async def create_if_absent(self, user: UserEntity) -> bool:
+        query = (
+            insert(self.model)
+            .values(dict(zip(_COPY_COLUMNS, UserModelMapper.entity_to_record(user), strict=True)))
+            .on_conflict_do_nothing(index_elements=[self.model.email_normalized])
+            .returning(self.model.id)
+        )
+        result = await self._session.execute(query)
+        return result.scalar_one_or_none() is not None
+
+    async def update_password_hash(self, user_id: UUID, password_hash: str) -> None:
+        query = update(self.model).where(self.model.id == user_id).values(password=password_hash)
+        await self._session.execute(query)
+
+    async def save_many(self, users: list[UserEntity]) -> set[UUID]:
+        """
+        COPY пачки во временную таблицу и перенос в users одним INSERT ... SELECT.
+        Строки, нарушающие уникальность (email, id), пропускаются ON CONFLICT DO NOTHING.
+        """
+        if not users:
+            return set()
+
+        # Первый execute через SQLAlchemy открывает транзакцию, в которой пойдёт COPY
+        await self._session.execute(
+            text(
+                f"CREATE TEMP TABLE IF NOT EXISTS {_IMPORT_TABLE} "
+                f"(LIKE {self.model.__tablename__} INCLUDING DEFAULTS INCLUDING GENERATED) "
+                f"ON COMMIT DROP"
+            )
+        )
+        await self._session.execute(text(f"TRUNCATE {_IMPORT_TABLE}"))
+
+        connection = await self._session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            _IMPORT_TABLE,
+            records=[UserModelMapper.entity_to_record(user) for user in users],
+            columns=_COPY_COLUMNS,
+        )
+
+        columns = ", ".join(_COPY_COLUMNS)
+        result = await self._session.execute(
+            text(
+                f"INSERT INTO {self.model.__tablename__} ({columns}) "
+                f"SELECT {columns} FROM {_IMPORT_TABLE} "
+                f"ON CONFLICT DO NOTHING RETURNING id"
+            )
+        )
+        return set(result.scalars().all())
+
     # TODO: добавить обработку ошибок
     async def get_by_id(self, user_id: UUID) -> UserEntity | None:
         query = select(self.model).where(self.model.id == user_id)
@@ -26,8 +95,24 @@ class UserRepository(IUserRepository):
         sql_user = result.scalar_one_or_none()
         return UserModelMapper.model_to_entity(sql_user) if sql_user else None
 
+    async def get_output_by_id(self, user_id: UUID) -> UserOutputDto | None:
+        return await self._queries.get_by_id(user_id)
+
+    async def get_outputs_by_ids(self, user_ids: list[UUID]) -> dict[UUID, UserOutputDto]:
+        return {dto.id: dto for dto in await self._queries.get_many(user_ids)}
+
+    async def get_updated_at(self, user_id: UUID) -> datetime | None:
+        # Одна колонка по первичному ключу: без маппинга строки в DTO или сущность
+        query = select(self.model.updated_at).where(self.model.id == user_id)
+        return (await self._session.execute(query)).scalar_one_or_none()
+
     async def get_by_email(self, email: str) -> UserEntity | None:
-        query = select(self.model).where(self.model.email == email.lower())
+        query = select(self.model).where(self.model.email_normalized == email.lower())
         result = await self._session.execute(query)
         sql_user = result.scalar_one_or_none()
         return UserModelMapper.model_to_entity(sql_user) if sql_user else None
+
+    async def email_exists(self, email: str) -> bool:
+        # EXISTS по уникальному ix_users_email_normalized: без выборки и маппинга строки
+        query = select(exists().where(self.model.email_normalized == email.lower()))
+        return (await self._session.execute(query)).scalar_one()
@@ -1,14 +1,113 @@
+import asyncio
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import TypeVar
+
 from pwdlib import PasswordHash
+from pwdlib.hashers.argon2 import Argon2Hasher
+
+from src.config.hasher_settings import HasherSettings
+from src.core.metrics import (
+    PASSWORD_HASHER_DURATION,
+    PASSWORD_HASHER_QUEUE_DEPTH,
+    PASSWORD_HASHER_REJECTED,
+)
+from src.domain.user.interfaces import IAsyncPasswordHasher, IPasswordHasher
+from src.shared.exceptions import PasswordHasherOverloadedError
 
-from src.domain.user.interfaces import IPasswordHasher
+T = TypeVar("T")
 
 
 class PasswordHasherImpl(IPasswordHasher):
-    def __init__(self) -> None:
-        self.hasher = PasswordHash.recommended()
+    def __init__(self, config: HasherSettings) -> None:
+        self.hasher = PasswordHash(
+            (
+                Argon2Hasher(
+                    time_cost=config.argon2_time_cost,
+                    memory_cost=config.argon2_memory_cost,
+                    parallelism=config.argon2_parallelism,
+                ),
+            )
+        )
 
     def hash(self, plain: str) -> str:
         return self.hasher.hash(plain)
 
     def verify(self, plain: str, hashed: str) -> bool:
         return self.hasher.verify(plain, hashed)
+
+    def verify_and_update(self, plain: str, hashed: str) -> tuple[bool, str | None]:
+        return self.hasher.verify_and_update(plain, hashed)
+
+
+# Функции пула должны быть на уровне модуля, чтобы ProcessPoolExecutor мог их сериализовать.
+# В каждом процессе пула initializer создаёт свой PasswordHash с параметрами из настроек.
+_worker_hasher: PasswordHasherImpl | None = None
+
+
+def _init_worker_hasher(config: HasherSettings) -> None:
+    global _worker_hasher
+    _worker_hasher = PasswordHasherImpl(config)
+
+
+def _hash_in_worker(plain: str) -> str:
+    return _worker_hasher.hash(plain)
+
+
+def _verify_in_worker(plain: str, hashed: str) -> bool:
+    return _worker_hasher.verify(plain, hashed)
+
+
+def _verify_and_update_in_worker(plain: str, hashed: str) -> tuple[bool, str | None]:
+    return _worker_hasher.verify_and_update(plain, hashed)
+
+
+class AsyncPasswordHasherImpl(IAsyncPasswordHasher):
+    """
+    Хеширует Argon2 в пуле потоков или процессов.
+    Очередь ограничена: если за acquire_timeout не нашлось места, задача отклоняется.
+    """
+
+    def __init__(self, config: HasherSettings) -> None:
+        executor_class = ProcessPoolExecutor if config.executor == "process" else ThreadPoolExecutor
+        self._executor: Executor = executor_class(
+            max_workers=config.max_workers,
+            initializer=_init_worker_hasher,
+            initargs=(config,),
+        )
+        self._slots = asyncio.Semaphore(config.max_workers + config.max_queue_size)
+        self._acquire_timeout = config.acquire_timeout
+
+    async def hash(self, plain: str) -> str:
+        return await self._submit("hash", _hash_in_worker, plain)
+
+    async def verify(self, plain: str, hashed: str) -> bool:
+        return await self._submit("verify", _verify_in_worker, plain, hashed)
+
+    async def verify_and_update(self, plain: str, hashed: str) -> tuple[bool, str | None]:
+        # Проверка и пересчёт хеша - одна задача пула, а не две
+        return await self._submit("verify", _verify_and_update_in_worker, plain, hashed)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    async def _submit(self, operation: str, func: Callable[..., T], *args: str) -> T:
+        try:
+            await asyncio.wait_for(self._slots.acquire(), timeout=self._acquire_timeout)
+        except TimeoutError as e:
+            PASSWORD_HASHER_REJECTED.labels(operation).inc()
+            raise PasswordHasherOverloadedError(
+                message_to_extend={"operation": operation, "timeout": self._acquire_timeout},
+                context=e,
+            )
+
+        PASSWORD_HASHER_QUEUE_DEPTH.inc()
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            PASSWORD_HASHER_DURATION.labels(operation).observe(time.perf_counter() - started)
+            PASSWORD_HASHER_QUEUE_DEPTH.dec()
+            self._slots.release()
@@ -0,0 +1,101 @@
+import logging
+import time
+import uuid
+from uuid import UUID
+
+import jwt
+
+from src.apps.auth.dtos import PrincipalDto, TokenPairDto
+from src.apps.auth.itokens import ITokenService
+from src.config.auth_settings import AuthSettings
+from src.shared.exceptions import InvalidTokenError
+
+ACCESS = "access"
+REFRESH = "refresh"
+
+logger = logging.getLogger(__name__)
+
+
+class JwtTokenService(ITokenService):
+    """
+    JWT, подписанные HS256 или EdDSA. Access-токен несёт всё, что нужно для авторизации
+    запроса (id, email, is_superuser); refresh-токен - только id пользователя.
+    """
+
+    def __init__(self, config: AuthSettings) -> None:
+        self._config = config
+        self._signing_key = config.signing_key
+        self._verification_key = config.verification_key
+        self._algorithms = [config.algorithm]
+
+    def issue_pair(self, principal: PrincipalDto) -> TokenPairDto:
+        now = int(time.time())
+        subject = str(principal.user_id)
+        access_token = self._encode(
+            {
+                "sub": subject,
+                "email": principal.email,
+                "su": principal.is_superuser,
+                "typ": ACCESS,
+                "iat": now,
+                "exp": now + self._config.access_ttl,
+            }
+        )
+        refresh_token = self._encode(
+            {
+                "sub": subject,
+                "typ": REFRESH,
+                # jti делает токены, выпущенные в одну секунду, различными
+                "jti": uuid.uuid4().hex,
+                "iat": now,
+                "exp": now + self._config.refresh_ttl,
+            }
+        )
+        return TokenPairDto(
+            access_token=access_token,
+            refresh_token=refresh_token,
+            expires_in=self._config.access_ttl,
+        )
+
+    def decode_access(self, token: str) -> PrincipalDto:
+        claims = self._decode(token, ACCESS)
+        return PrincipalDto(
+            user_id=self._subject(claims),
+            email=claims.get("email", ""),
+            is_superuser=bool(claims.get("su", False)),
+        )
+
+    def decode_refresh(self, token: str) -> UUID:
+        return self._subject(self._decode(token, REFRESH))
+
+    def _encode(self, claims: dict) -> str:
+        claims["iss"] = self._config.issuer
+        return jwt.encode(claims, self._signing_key, algorithm=self._config.algorithm)
+
+    def _decode(self, token: str, token_type: str) -> dict:
+        try:
+            claims = jwt.decode(
+                token,
+                self._verification_key,
+                algorithms=self._algorithms,
+                issuer=self._config.issuer,
+                leeway=self._config.leeway,
+                options={"require": ["sub", "exp", "typ"]},
+            )
+        except jwt.ExpiredSignatureError as e:
+            raise InvalidTokenError(message_to_extend={"reason": "token expired"}, context=e)
+        except jwt.PyJWTError as e:
+            # Текст PyJWT описывает, что именно не так с токеном: клиенту его не отдаём
+            logger.info("Rejected %s token: %s", token_type, e)
+            raise InvalidTokenError(message_to_extend={"reason": "invalid token"}, context=e)
+        # Refresh-токен не должен открывать API, а access - продлевать сессию
+        if claims["typ"] != token_type:
+            raise InvalidTokenError(message_to_extend={"reason": f"expected {token_type} token"})
+        return claims
+
+    @staticmethod
+    def _subject(claims: dict) -> UUID:
+        try:
+            return UUID(claims["sub"])
+        except ValueError as e:
+            raise InvalidTokenError(message_to_extend={"reason": "malformed subject"}, context=e)
@@ -0,0 +1,50 @@
+from collections.abc import Awaitable, Callable
+from typing import NewType
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import ORMExecuteState, Session, UOWTransaction
+
+# Sessionmaker для запросов, которые только читают (GET/HEAD/OPTIONS)
+ReadSessionMaker = NewType("ReadSessionMaker", async_sessionmaker[AsyncSession])
+
+READ_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+HAS_WRITES = "has_writes"
+AFTER_COMMIT = "after_commit"
+
+
+class WriteTrackingSession(Session):
+    """
+    Session, которая помнит, отправляла ли она изменения в БД (флаг в session.info).
+    По нему провайдер решает, нужен ли COMMIT в конце запроса.
+    """
+
+
+@event.listens_for(WriteTrackingSession, "after_flush")
+def _mark_flush(session: Session, flush_context: UOWTransaction) -> None:
+    session.info[HAS_WRITES] = True
+
+
+@event.listens_for(WriteTrackingSession, "do_orm_execute")
+def _mark_statement(orm_execute_state: ORMExecuteState) -> None:
+    # text() и DML считаются записью: лишний COMMIT дешевле потерянных изменений
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info[HAS_WRITES] = True
+
+
+def has_writes(session: AsyncSession) -> bool:
+    return bool(session.info.get(HAS_WRITES) or session.new or session.dirty or session.deleted)
+
+
+def after_commit(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """
+    Действие после успешного COMMIT запроса (сброс кешей и т.п.): до коммита
+    параллельный запрос прочитал бы старые данные и вернул их в кеш.
+    При откате или ошибке коммита не выполняется.
+    """
+    session.info.setdefault(AFTER_COMMIT, []).append(callback)
+
+
+async def run_after_commit(session: AsyncSession) -> None:
+    for callback in session.info.pop(AFTER_COMMIT, []):
+        await callback()
@@ -0,0 +1,88 @@
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.config.sql_profiler_settings import SqlProfilerSettings
+from src.data_access.engine_events import statement_operation
+
+logger = logging.getLogger(__name__)
+
+# EXPLAIN поддерживает только DML; ANALYZE выполняет запрос, поэтому он только для SELECT
+EXPLAIN_OPERATIONS = {"SELECT", "INSERT", "UPDATE", "DELETE"}
+_STARTED_KEY = "sql_profiler_started"
+
+
+@dataclass
+class SqlProfile:
+    """Запросы одного HTTP-запроса. Текст SQL с bind-параметрами и есть "форма" запроса."""
+
+    queries: int = 0
+    total_time: float = 0.0
+    shapes: Counter[str] = field(default_factory=Counter)
+    explaining: bool = False
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+
+# Задаётся middleware на время запроса; события engine пишут в профиль текущего контекста
+current_sql_profile: ContextVar[SqlProfile | None] = ContextVar("current_sql_profile", default=None)
+
+
+def bind_sql_profiler(engine: AsyncEngine, config: SqlProfilerSettings) -> None:
+    sync_engine = engine.sync_engine
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before(conn: Connection, cursor, statement, parameters, context, executemany) -> None:
+        profile = current_sql_profile.get()
+        if profile is not None and not profile.explaining:
+            conn.info.setdefault(_STARTED_KEY, []).append(time.perf_counter())
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after(conn: Connection, cursor, statement, parameters, context, executemany) -> None:
+        profile = current_sql_profile.get()
+        if profile is None or profile.explaining or not conn.info.get(_STARTED_KEY):
+            return
+        elapsed = time.perf_counter() - conn.info[_STARTED_KEY].pop()
+        profile.queries += 1
+        profile.total_time += elapsed
+        profile.shapes[statement] += 1
+
+        elapsed_ms = elapsed * 1000
+        if elapsed_ms < config.slow_ms:
+            return
+        plan = None
+        if config.explain and not executemany:
+            plan = _explain(conn, profile, statement, parameters)
+        logger.warning("Slow SQL (%.1f ms): %s\n%s", elapsed_ms, statement, plan or "")
+
+
+def _explain(conn: Connection, profile: SqlProfile, statement: str, parameters) -> str | None:
+    operation = statement_operation(statement)
+    if operation not in EXPLAIN_OPERATIONS:
+        return None
+    options = "ANALYZE, BUFFERS" if operation == "SELECT" else "COSTS"
+    # Запросы EXPLAIN сами проходят через события: не считаем и не объясняем их
+    profile.explaining = True
+    # Ошибка EXPLAIN не должна обрывать транзакцию запроса: откатываем только savepoint
+    autocommit = conn.get_execution_options().get("isolation_level") == "AUTOCOMMIT"
+    savepoint = conn.begin_nested() if conn.in_transaction() and not autocommit else None
+    try:
+        rows = conn.exec_driver_sql(f"EXPLAIN ({options}) {statement}", parameters).all()
+    except Exception as e:
+        if savepoint is not None:
+            savepoint.rollback()
+        logger.warning("EXPLAIN failed: %s", e)
+        return None
+    else:
+        if savepoint is not None:
+            savepoint.commit()
+    finally:
+        profile.explaining = False
+    return "\n".join(row[0] for row in rows)
@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from uuid import UUID
 
@@ -26,3 +26,32 @@ class UserOutputDto:
     last_name: str | None = None
     is_superuser: bool = False
     is_active: bool = True
+
+
+@dataclass
+class UserPageDto:
+    items: list[UserOutputDto]
+    # (created_at, id) последней строки страницы; None, если страница последняя
+    next_cursor: tuple[datetime, UUID] | None = None
+
+
+@dataclass
+class UserImportRowDto:
+    line: int
+    user: UserInputDto | None = None
+    error: str | None = None
+
+
+@dataclass
+class UserImportRowErrorDto:
+    line: int
+    error: str
+    email: str | None = None
+
+
+@dataclass
+class UserImportReportDto:
+    total: int = 0
+    created: int = 0
+    failed: int = 0
+    errors: list[UserImportRowErrorDto] = field(default_factory=list)
@@ -15,6 +15,19 @@ from src.shared.exceptions import InvalidTypeError
 
 
 class UserEntity:
+    # Хранилище значений ValidatedField (private_name = "_" + имя поля) и id
+    __slots__ = (
+        "_email",
+        "_password",
+        "_created_at",
+        "_updated_at",
+        "_first_name",
+        "_last_name",
+        "_is_superuser",
+        "_is_active",
+        "_id",
+    )
+
     email = ValidatedField(expected_type=UserEmailVo, nullable=False)
     password = ValidatedField(expected_type=PasswordHashVo, nullable=False)
     created_at = ValidatedField(expected_type=UserCreatedAtVo, nullable=True)
@@ -46,6 +59,35 @@ class UserEntity:
         self.is_active = is_active
         self._id = id_ or UserIdVo(uuid.uuid4())
 
+    @classmethod
+    def from_trusted(
+        cls,
+        id_: UserIdVo,
+        email: UserEmailVo,
+        password: PasswordHashVo,
+        created_at: UserCreatedAtVo,
+        updated_at: UserUpdatedAtVo,
+        first_name: UserFirstNameVo | None,
+        last_name: UserLastNameVo | None,
+        is_superuser: bool,
+        is_active: bool,
+    ) -> "UserEntity":
+        """
+        Собрать сущность без проверок ValidatedField.
+        Только для данных, которые уже прошли валидацию (строки из БД).
+        """
+        entity = object.__new__(cls)
+        entity._id = id_
+        entity._email = email
+        entity._password = password
+        entity._created_at = created_at
+        entity._updated_at = updated_at
+        entity._first_name = first_name
+        entity._last_name = last_name
+        entity._is_superuser = is_superuser
+        entity._is_active = is_active
+        return entity
+
     @property
     def id(self) -> UserIdVo:
         return self._id
@@ -70,7 +112,7 @@ class UserEntity:
     def __repr__(self) -> str:
         # TODO: для удобочитаемости, позже удалить
         if self.id is not None:
-            attr = "\n\t".join([f"{k}: {v}" for k, v in self.__dict__.items()])
+            attr = "\n\t".join([f"{k}: {getattr(self, k, None)}" for k in self.__slots__])
             print(f"{self.__class__.__name__}(")
             print("\t", end="")
             print(attr)
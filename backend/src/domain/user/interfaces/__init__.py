@@ -1,5 +1,6 @@
-from src.domain.user.interfaces.password_hasher import IPasswordHasher
+from src.domain.user.interfaces.password_hasher import IAsyncPasswordHasher, IPasswordHasher
 
 __all__ = [
+    "IAsyncPasswordHasher",
     "IPasswordHasher",
 ]
@@ -16,3 +16,27 @@ class IPasswordHasher(ABC):
     @abstractmethod
     def verify(self, plain: str, hashed: str) -> bool:
         raise NotImplementedError
+
+    @abstractmethod
+    def verify_and_update(self, plain: str, hashed: str) -> tuple[bool, str | None]:
+        """Проверка пароля и новый хеш, если hashed создан с устаревшими параметрами."""
+        raise NotImplementedError
+
+
+class IAsyncPasswordHasher(ABC):
+    """
+    Асинхронный порт хешера: реализация не должна блокировать event loop.
+    Async hasher port: implementations must not block the event loop.
+    """
+
+    @abstractmethod
+    async def hash(self, plain: str) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def verify(self, plain: str, hashed: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def verify_and_update(self, plain: str, hashed: str) -> tuple[bool, str | None]:
+        raise NotImplementedError
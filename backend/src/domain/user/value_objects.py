@@ -1,15 +1,15 @@
 import re
 from dataclasses import dataclass
-from typing import ClassVar
+from typing import Any, ClassVar
 
-from src.domain.user.interfaces import IPasswordHasher
+from src.domain.user.interfaces import IAsyncPasswordHasher, IPasswordHasher
 from src.shared.exceptions import (
     InvalidFormatError,
     PasswordInvalidCharactersError,
     PasswordTooLongError,
     PasswordTooShortError,
 )
-from src.shared.value_objects import DatetimeVo, StrWithSizeVo, UuidVo
+from src.shared.value_objects import DatetimeVo, Rule, StrWithSizeVo, TrustedVoMixin, UuidVo
 
 MIN_PASSWORD_LENGTH = 5
 MAX_PASSWORD_LENGTH = 70
@@ -25,7 +25,7 @@ class UserIdVo(UuidVo):
     Inherits all UUID validation from UuidVo base class.
     """
 
-    pass
+    __slots__ = ()
 
 
 @dataclass(frozen=True)
@@ -36,7 +36,7 @@ class UserCreatedAtVo(DatetimeVo):
     Represents the exact datetime when a user account was created.
     """
 
-    pass
+    __slots__ = ()
 
 
 @dataclass(frozen=True)
@@ -48,7 +48,7 @@ class UserUpdatedAtVo(DatetimeVo):
     Should be updated on every user profile change.
     """
 
-    pass
+    __slots__ = ()
 
 
 @dataclass(frozen=True)
@@ -64,6 +64,8 @@ class UserFirstNameVo(StrWithSizeVo):
         Maximum length: MAX_NAME_LENGTH characters
     """
 
+    __slots__ = ()
+
     MAX_SIZE: ClassVar[int] = MAX_NAME_LENGTH
 
 
@@ -81,6 +83,8 @@ class UserLastNameVo(StrWithSizeVo):
 
     """
 
+    __slots__ = ()
+
     MAX_SIZE: ClassVar[int] = MAX_NAME_LENGTH
 
 
@@ -106,6 +110,8 @@ class UserEmailVo(StrWithSizeVo):
         - Local part cannot contain consecutive dots
     """
 
+    __slots__ = ()
+
     MIN_SIZE: ClassVar[int] = MIN_EMAIL_LENGTH
     MAX_SIZE: ClassVar[int] = MAX_EMAIL_LENGTH
 
@@ -205,6 +211,34 @@ class UserEmailVo(StrWithSizeVo):
                 }
             )
 
+    @classmethod
+    def compile_rule(cls) -> Rule:
+        """
+        Те же проверки, что _validate_email_format и _validate_specific_rules,
+        за один partition вместо нескольких split.
+        """
+        size_rule = super().compile_rule()
+        invalid_format = InvalidFormatError.CODE
+
+        def rule(value: Any) -> str | None:
+            if (code := size_rule(value)) is not None:
+                return code
+            local_part, at, domain = value.partition("@")
+            if (
+                not at
+                or "@" in domain
+                or not local_part
+                or not domain
+                or "." not in domain
+                or local_part[0] == "."
+                or local_part[-1] == "."
+                or ".." in local_part
+            ):
+                return invalid_format
+            return None
+
+        return rule
+
     @property
     def domain(self) -> str:
         """
@@ -236,7 +270,9 @@ PASSWORD_RULES_REGEX = {
 
 
 @dataclass(frozen=True)
-class PasswordHashVo:
+class PasswordHashVo(TrustedVoMixin):
+    __slots__ = ("value",)
+
     value: str
 
     @classmethod
@@ -253,6 +289,13 @@ class PasswordHashVo:
         hashed = hasher.hash(plain)
         return cls(value=hashed)
 
+    @classmethod
+    async def from_plain_async(cls, plain: str, hasher: IAsyncPasswordHasher) -> "PasswordHashVo":
+        """Как from_plain, но хеширование выполняется вне event loop."""
+        cls._validate_plain(plain)
+        hashed = await hasher.hash(plain)
+        return cls(value=hashed)
+
     @property
     def hash(self) -> str:
         return self.value
@@ -261,6 +304,20 @@ class PasswordHashVo:
         """Проверить сырой пароль против хеша."""
         return hasher.verify(plain, self.value)
 
+    async def verify_async(self, plain: str, hasher: IAsyncPasswordHasher) -> bool:
+        """Проверить сырой пароль против хеша, не блокируя event loop."""
+        return await hasher.verify(plain, self.value)
+
+    async def verify_and_rehash_async(
+        self, plain: str, hasher: IAsyncPasswordHasher
+    ) -> tuple[bool, "PasswordHashVo | None"]:
+        """
+        Проверить пароль и, если хеш создан с устаревшими параметрами хешера,
+        вернуть новый VO для сохранения. Иначе второй элемент - None.
+        """
+        valid, updated = await hasher.verify_and_update(plain, self.value)
+        return valid, self.from_hash(updated) if updated else None
+
     # --- локальные правила валидации пароля (доменная логика) ---
     @staticmethod
     def _validate_plain(plain_password: str):
@@ -2,14 +2,16 @@ import asyncio
 import logging
 from contextlib import asynccontextmanager
 
-import uvicorn
 from dishka.integrations.fastapi import setup_dishka
 from fastapi import FastAPI
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from src.api import init_routes
-from src.apps.admin import init_sql_admin
-from src.config.server_settings import server_settings
-from src.core.bg_tasks.redis_broker import broker
+from src.api.metrics import init_metrics
+from src.api.sql_profiler import init_sql_profiler
+from src.config.server_settings import get_server_settings
+from src.config.sql_profiler_settings import get_sql_profiler_settings
+from src.core.metrics import mark_process_dead
 from src.provides import container_factory
 
 
@@ -20,11 +22,17 @@ def init_di(app: FastAPI) -> None:
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    if not broker.is_worker_process:
-        await broker.startup()
+    if get_server_settings().mount_admin:
+        # sqladmin импортируется только там, где админка действительно монтируется
+        from src.apps.admin import init_sql_admin
+
+        # Engine живёт в контейнере dishka (APP scope), а получить его можно только асинхронно
+        engine = await app.state.dishka_container.get(AsyncEngine)
+        init_sql_admin(app=app, engine=engine)
+    # Брокер API не нужен: задачи публикует outbox_relay из строк outbox
     yield
-    if not broker.is_worker_process:
-        await broker.shutdown()
+    await app.state.dishka_container.close()
+    mark_process_dead()
 
 
 def create_app() -> FastAPI:
@@ -36,13 +44,17 @@ def create_app() -> FastAPI:
         version="1.0.0",
     )
     init_di(app)
+    init_metrics(app)
+    init_sql_profiler(app, get_sql_profiler_settings())
     init_routes(app)  # Подключение роутеров
-    init_sql_admin(app=app)
     return app
 
 
 async def start_server(app: FastAPI) -> None:
     """Асинхронный запуск сервера"""
+    import uvicorn  # Нужен только при запуске через main(), воркеру taskiq он не нужен
+
+    server_settings = get_server_settings()
     config = uvicorn.Config(
         app=app,
         host=server_settings.HOST,
@@ -60,6 +72,7 @@ async def start_server(app: FastAPI) -> None:
 
 def main() -> None:
     """Основная функция запуска"""
+    server_settings = get_server_settings()
 
     # Настройка логирования
     logging.basicConfig(
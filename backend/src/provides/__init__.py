@@ -1,12 +1,15 @@
 from dishka import AsyncContainer, make_async_container
+from dishka.integrations.fastapi import FastapiProvider
 
 from src.provides.adapters import (
     ConfigProvider,
     PasswordHasherProvider,
+    RedisProvider,
     RepositoryProvider,
     SqlalchemyProvider,
+    TokenProvider,
 )
-from src.provides.usecases import UserUseCaseProvider
+from src.provides.usecases import AuthUseCaseProvider, UserUseCaseProvider
 
 
 def container_factory() -> AsyncContainer:
@@ -15,5 +18,9 @@ def container_factory() -> AsyncContainer:
         ConfigProvider(),
         RepositoryProvider(),
         PasswordHasherProvider(),
+        RedisProvider(),
+        TokenProvider(),
         UserUseCaseProvider(),
+        AuthUseCaseProvider(),
+        FastapiProvider(),
     )
@@ -1,6 +1,9 @@
-from collections.abc import AsyncIterable
+import secrets
+from collections.abc import AsyncIterable, Iterable
 
 from dishka import Provider, Scope, provide
+from fastapi import Request
+from redis.asyncio import Redis
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
@@ -9,30 +12,97 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+from src.apps.auth.itokens import ITokenService
+from src.apps.auth.use_cases.login_use_case import DummyPasswordHash
+from src.apps.outbox.ioutbox import IOutbox
+from src.apps.user.iquery import IUserQueryService
 from src.apps.user.irepo import IUserRepository
-from src.config.db_settings import DBSettings, db_settings
+from src.apps.user.loader import UserLoader
+from src.config.auth_settings import AuthSettings, get_auth_settings
+from src.config.cache_settings import CacheSettings, get_cache_settings
+from src.config.db_settings import DBSettings, get_db_settings
+from src.config.hasher_settings import HasherSettings, get_hasher_settings
+from src.config.redis_settings import RedisSettings, get_redis_settings
+from src.config.sql_profiler_settings import SqlProfilerSettings, get_sql_profiler_settings
+from src.data_access.cache.user_cache import UserCache
+from src.data_access.engine_events import bind_statement_metrics
+from src.data_access.pool import InstrumentedAsyncAdaptedQueuePool, bind_pool_metrics
+from src.data_access.queries.user_queries import UserQueryService
+from src.data_access.repositories.cached_user_repo import CachedUserRepository
+from src.data_access.repositories.outbox_repo import OutboxRepository
 from src.data_access.repositories.user_repo import UserRepository
-from src.data_access.services.hasher import PasswordHasherImpl
-from src.domain.user.interfaces import IPasswordHasher
+from src.data_access.services.hasher import AsyncPasswordHasherImpl, PasswordHasherImpl
+from src.data_access.services.tokens import JwtTokenService
+from src.data_access.session import (
+    READ_METHODS,
+    ReadSessionMaker,
+    WriteTrackingSession,
+    has_writes,
+    run_after_commit,
+)
+from src.data_access.sql_profiler import bind_sql_profiler
+from src.domain.user.interfaces import IAsyncPasswordHasher, IPasswordHasher
 
 
 class SqlalchemyProvider(Provider):
     @provide(scope=Scope.APP)
-    def provide_async_engine(self, db_config: DBSettings) -> AsyncEngine:
-        return create_async_engine(db_config.construct_sqlalchemy_url)
+    def provide_async_engine(
+        self, db_config: DBSettings, profiler_config: SqlProfilerSettings
+    ) -> AsyncEngine:
+        engine = create_async_engine(
+            db_config.construct_sqlalchemy_url,
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            **db_config.engine_options,
+        )
+        bind_pool_metrics(engine)
+        bind_statement_metrics(engine)
+        if profiler_config.enabled:
+            bind_sql_profiler(engine, profiler_config)
+        return engine
 
     @provide(scope=Scope.APP)
     def provide_async_sessionmaker(self, engine: AsyncEngine) -> async_sessionmaker[AsyncSession]:
-        return async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+        return async_sessionmaker(
+            bind=engine,
+            expire_on_commit=False,
+            class_=AsyncSession,
+            sync_session_class=WriteTrackingSession,
+        )
+
+    @provide(scope=Scope.APP)
+    def provide_read_sessionmaker(
+        self, engine: AsyncEngine, db_config: DBSettings
+    ) -> ReadSessionMaker:
+        # Тот же пул, но соединения получают режим чтения на время checkout
+        read_engine = engine.execution_options(**db_config.read_execution_options)
+        return ReadSessionMaker(
+            async_sessionmaker(
+                bind=read_engine,
+                expire_on_commit=False,
+                class_=AsyncSession,
+                sync_session_class=WriteTrackingSession,
+            )
+        )
 
     @provide(scope=Scope.REQUEST, provides=AsyncSession)
     async def provide_async_session(
-        self, sessionmaker: async_sessionmaker[AsyncSession]
+        self,
+        request: Request,
+        sessionmaker: async_sessionmaker[AsyncSession],
+        read_sessionmaker: ReadSessionMaker,
     ) -> AsyncIterable[AsyncSession]:
-        async with sessionmaker() as session:
+        """
+        Соединение из пула берётся только при первом запросе к БД.
+        COMMIT отправляется, только если сессия что-то записала; после него выполняются
+        действия, отложенные через after_commit.
+        """
+        factory = read_sessionmaker if request.method in READ_METHODS else sessionmaker
+        async with factory() as session:
             try:
                 yield session
-                await session.commit()
+                if has_writes(session):
+                    await session.commit()
+                    await run_after_commit(session)
             except SQLAlchemyError:
                 await session.rollback()
                 raise
@@ -46,16 +116,79 @@ class SqlalchemyProvider(Provider):
 class ConfigProvider(Provider):
     @provide(scope=Scope.APP)
     def provide_db_settings(self) -> DBSettings:
-        return db_settings
+        return get_db_settings()
+
+    @provide(scope=Scope.APP)
+    def provide_hasher_settings(self) -> HasherSettings:
+        return get_hasher_settings()
+
+    @provide(scope=Scope.APP)
+    def provide_redis_settings(self) -> RedisSettings:
+        return get_redis_settings()
+
+    @provide(scope=Scope.APP)
+    def provide_cache_settings(self) -> CacheSettings:
+        return get_cache_settings()
+
+    @provide(scope=Scope.APP)
+    def provide_sql_profiler_settings(self) -> SqlProfilerSettings:
+        return get_sql_profiler_settings()
+
+    @provide(scope=Scope.APP)
+    def provide_auth_settings(self) -> AuthSettings:
+        return get_auth_settings()
+
+
+class RedisProvider(Provider):
+    @provide(scope=Scope.APP)
+    async def provide_redis(self, config: RedisSettings) -> AsyncIterable[Redis]:
+        redis = Redis.from_url(config.redis_url, socket_timeout=config.socket_timeout)
+        yield redis
+        await redis.aclose()
+
+    @provide(scope=Scope.APP)
+    def provide_user_cache(self, redis: Redis, config: CacheSettings) -> UserCache:
+        return UserCache(redis=redis, config=config)
 
 
 class RepositoryProvider(Provider):
     scope = Scope.REQUEST
 
-    user_repository = provide(UserRepository, provides=IUserRepository)
+    user_repository_impl = provide(UserRepository)
+    user_query_service = provide(UserQueryService, provides=IUserQueryService)
+    outbox = provide(OutboxRepository, provides=IOutbox)
+    # Один на запрос: его результаты живут, пока живёт запрос
+    user_loader = provide(UserLoader)
+
+    @provide
+    def provide_user_repository(
+        self, repo: UserRepository, cache: UserCache, config: CacheSettings, session: AsyncSession
+    ) -> IUserRepository:
+        if not config.enabled:
+            return repo
+        return CachedUserRepository(repo=repo, cache=cache, session=session)
 
 
 class PasswordHasherProvider(Provider):
     @provide(scope=Scope.APP)
-    def provide_password_hasher(self) -> IPasswordHasher:
-        return PasswordHasherImpl()
+    def provide_password_hasher(self, config: HasherSettings) -> IPasswordHasher:
+        return PasswordHasherImpl(config)
+
+    @provide(scope=Scope.APP)
+    def provide_async_password_hasher(
+        self, config: HasherSettings
+    ) -> Iterable[IAsyncPasswordHasher]:
+        hasher = AsyncPasswordHasherImpl(config)
+        yield hasher
+        hasher.shutdown()
+
+    @provide(scope=Scope.APP)
+    async def provide_dummy_password_hash(self, hasher: IAsyncPasswordHasher) -> DummyPasswordHash:
+        # Один раз на процесс и теми же параметрами, что у настоящих хешей
+        return DummyPasswordHash(await hasher.hash(secrets.token_urlsafe(32)))
+
+
+class TokenProvider(Provider):
+    @provide(scope=Scope.APP)
+    def provide_token_service(self, config: AuthSettings) -> ITokenService:
+        return JwtTokenService(config)
@@ -1,7 +1,14 @@
 from dishka import Provider, Scope, provide
 
+from src.apps.auth.use_cases.login_use_case import LoginUseCase
+from src.apps.auth.use_cases.refresh_use_case import RefreshTokenUseCase
+from src.apps.user.use_cases.bulk_import_use_case import UserBulkImportUseCase
 from src.apps.user.use_cases.create_use_case import UserCreateUseCase
 from src.apps.user.use_cases.get_by_id_use_case import UserGetByIdUseCase
+from src.apps.user.use_cases.get_many_use_case import UserGetManyUseCase
+from src.apps.user.use_cases.get_updated_at_use_case import UserGetUpdatedAtUseCase
+from src.apps.user.use_cases.list_use_case import UserListUseCase
+from src.apps.user.use_cases.search_use_case import UserSearchUseCase
 
 
 class UserUseCaseProvider(Provider):
@@ -9,3 +16,15 @@ class UserUseCaseProvider(Provider):
 
     create_user_usecase = provide(UserCreateUseCase)
     get_user_usecase = provide(UserGetByIdUseCase)
+    get_users_usecase = provide(UserGetManyUseCase)
+    get_user_updated_at_usecase = provide(UserGetUpdatedAtUseCase)
+    bulk_import_usecase = provide(UserBulkImportUseCase)
+    list_users_usecase = provide(UserListUseCase)
+    search_users_usecase = provide(UserSearchUseCase)
+
+
+class AuthUseCaseProvider(Provider):
+    scope = Scope.REQUEST
+
+    login_usecase = provide(LoginUseCase)
+    refresh_token_usecase = provide(RefreshTokenUseCase)
@@ -0,0 +1,56 @@
+"""
+Production-запуск: несколько процессов uvicorn на одном сокете.
+
+    python -m src.server
+
+Супервизор uvicorn запускает WORKERS процессов (spawn), каждый сам импортирует
+src.main:create_app и проходит lifespan: свой пул БД, свой клиент брокера taskiq.
+На SIGTERM/SIGINT воркеры перестают принимать соединения, до GRACEFUL_TIMEOUT
+дожидаются текущих запросов и выполняют shutdown lifespan. Упавший воркер
+супервизор перезапускает.
+
+uvloop и httptools подхватываются, если установлены (loop="auto", http="auto").
+Для метрик всех процессов задайте PROMETHEUS_MULTIPROC_DIR.
+"""
+
+import logging
+
+import uvicorn
+
+from src.config.server_settings import get_server_settings
+from src.core.metrics_dir import clear_multiproc_dir
+
+APP = "src.main:create_app"
+
+
+def main() -> None:
+    settings = get_server_settings()
+    logging.basicConfig(
+        level=getattr(logging, settings.LOG_LEVEL.upper()),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    clear_multiproc_dir()
+    logging.info(f"Starting {settings.workers_count} workers on {settings.HOST}:{settings.PORT}")
+    uvicorn.run(
+        APP,
+        factory=True,
+        host=settings.HOST,
+        port=settings.PORT,
+        workers=settings.workers_count,
+        loop="auto",
+        http="auto",
+        backlog=settings.BACKLOG,
+        timeout_keep_alive=settings.KEEP_ALIVE,
+        limit_concurrency=settings.LIMIT_CONCURRENCY,
+        timeout_graceful_shutdown=settings.GRACEFUL_TIMEOUT,
+        log_level=settings.LOG_LEVEL,
+        use_colors=settings.USE_COLORS,
+        # Перед приложением стоит nginx: адрес клиента и схема - из X-Forwarded-*,
+        # доверенные адреса прокси uvicorn читает из FORWARDED_ALLOW_IPS
+        proxy_headers=True,
+        reload=False,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,12 +4,14 @@ from src.base_exceptions import TemplateAppError
 class EmptyValueError(TemplateAppError):
     """Empty value error."""
 
+    CODE = "empty"
     MESSAGE_TEMPLATE = "Field '{attr_name}' cannot be empty, but got value: {value}"
 
 
 class InvalidTypeError(TemplateAppError):
     """Invalid type error."""
 
+    CODE = "invalid_type"
     MESSAGE_TEMPLATE = (
         "Expected type '{expected_type}' for field '{attr_name}', "
         "but got '{actual_type}' with value: '{value}'"
@@ -19,12 +21,14 @@ class InvalidTypeError(TemplateAppError):
 class FieldNegativeError(TemplateAppError):
     """Negative error."""
 
+    CODE = "negative"
     MESSAGE_TEMPLATE = "Field '{attr_name}' cannot be negative, but got value: {value}"
 
 
 class FieldZeroError(TemplateAppError):
     """Zero error."""
 
+    CODE = "zero"
     MESSAGE_TEMPLATE = "Field '{attr_name}' cannot be zero"
 
 
@@ -40,6 +44,7 @@ class EntityWithoutIdHashError(TemplateAppError):
 class FieldTooShortError(TemplateAppError):
     """Field too short error."""
 
+    CODE = "too_short"
     MESSAGE_TEMPLATE = (
         "The '{attr_name}' field must be at least {min_length} characters long. "
         "Current length is {current_length} characters: '{value}'"
@@ -49,6 +54,7 @@ class FieldTooShortError(TemplateAppError):
 class FieldTooLongError(TemplateAppError):
     """Field too long error."""
 
+    CODE = "too_long"
     MESSAGE_TEMPLATE = (
         "Field '{attr_name}' exceeds maximum length of {max_length} characters. "
         "Got {current_length} characters: {value}"
@@ -58,6 +64,7 @@ class FieldTooLongError(TemplateAppError):
 class InvalidFormatError(TemplateAppError):
     """Invalid format error."""
 
+    CODE = "invalid_format"
     MESSAGE_TEMPLATE = (
         "Field '{attr_name}' has invalid format. Expected format: {expected_format}. Got: {value}"
     )
@@ -66,6 +73,7 @@ class InvalidFormatError(TemplateAppError):
 class PasswordTooShortError(TemplateAppError):
     """The password is too short"""
 
+    CODE = "password_too_short"
     MESSAGE_TEMPLATE = (
         "The password is too short!"
         "The '{attr_name}' field must be at least {min_length} characters long."
@@ -76,6 +84,7 @@ class PasswordTooShortError(TemplateAppError):
 class PasswordTooLongError(TemplateAppError):
     """The password is too long"""
 
+    CODE = "password_too_long"
     MESSAGE_TEMPLATE = (
         "The password is too long!"
         "The '{attr_name}' field must be at least {min_length} characters long."
@@ -86,8 +95,41 @@ class PasswordTooLongError(TemplateAppError):
 class PasswordInvalidCharactersError(TemplateAppError):
     """The password contains invalid characters"""
 
+    CODE = "password_invalid_characters"
     MESSAGE_TEMPLATE = (
         "The password contains invalid characters! "
         "The '{attr_name}' field must include only latin letters, digits and special symbols. "
         "Provided value: '{value}'"
     )
+
+
+class PasswordHasherOverloadedError(TemplateAppError):
+    """The password hasher queue is full"""
+
+    MESSAGE_TEMPLATE = (
+        "Password hasher is overloaded: no free slot for '{operation}' within {timeout} seconds"
+    )
+
+
+class UserAlreadyExistsError(TemplateAppError):
+    """A user with this email already exists"""
+
+    MESSAGE_TEMPLATE = "User with email '{email}' already exists"
+
+
+class InvalidCredentialsError(TemplateAppError):
+    """Wrong email or password"""
+
+    MESSAGE_TEMPLATE = "Invalid email or password"
+
+
+class InactiveUserError(TemplateAppError):
+    """The user account is disabled"""
+
+    MESSAGE_TEMPLATE = "User account is disabled"
+
+
+class InvalidTokenError(TemplateAppError):
+    """The token is malformed, expired or has a wrong type"""
+
+    MESSAGE_TEMPLATE = "Invalid token: {reason}"
@@ -0,0 +1,34 @@
+"""
+Пакетная проверка значений для Value Objects.
+
+validate_many проверяет столбец сырых значений правилом VO (compile_rule) и возвращает
+для каждой строки код ошибки (AppError.CODE) или None. Решения совпадают с конструктором
+VO, но объекты и исключения с отформатированными сообщениями не создаются - это
+дешевле при массовом импорте, где VO строятся только для прошедших проверку строк.
+"""
+
+from collections.abc import Iterable
+from functools import cache
+from typing import Any
+
+from src.shared.value_objects import Rule
+
+
+@cache
+def compiled_rule(vo_cls: type) -> Rule:
+    """Правило VO компилируется один раз на класс."""
+    return vo_cls.compile_rule()
+
+
+def validate_many(
+    vo_cls: type, values: Iterable[Any], *, optional: bool = False
+) -> list[str | None]:
+    """
+    Коды ошибок по строкам, без исключений.
+
+    optional=True - None считается допустимым значением (поле не заполнено).
+    """
+    rule = compiled_rule(vo_cls)
+    if optional:
+        return [None if value is None else rule(value) for value in values]
+    return [rule(value) for value in values]
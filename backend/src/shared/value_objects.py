@@ -1,5 +1,7 @@
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any, Self
 from uuid import UUID
 
 from src.shared.exceptions import (
@@ -10,9 +12,40 @@ from src.shared.exceptions import (
     InvalidTypeError,
 )
 
+# Правило для пакетной проверки (src.shared.validation.validate_many): код ошибки
+# (AppError.CODE) или None. Принимает те же решения, что и __post_init__ VO, но не
+# создаёт объектов и исключений
+Rule = Callable[[Any], str | None]
+
+
+def _isinstance_rule(expected_type: type) -> Rule:
+    code = InvalidTypeError.CODE
+
+    def rule(value: Any) -> str | None:
+        return None if isinstance(value, expected_type) else code
+
+    return rule
+
+
+class TrustedVoMixin:
+    """
+    Mixin adding a constructor that skips validation.
+
+    Only for values validated before they were stored, e.g. rows loaded
+    from the database. Everything else must go through the regular constructor.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_trusted(cls, value: Any) -> Self:
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "value", value)
+        return instance
+
 
 @dataclass(frozen=True)
-class UuidVo:
+class UuidVo(TrustedVoMixin):
     """
     UUID Value Object for validating and representing UUID values.
 
@@ -26,6 +59,8 @@ class UuidVo:
         InvalidTypeError: If value is not a UUID instance
     """
 
+    __slots__ = ("value",)
+
     value: UUID
 
     def __post_init__(self):
@@ -45,9 +80,13 @@ class UuidVo:
                 }
             )
 
+    @classmethod
+    def compile_rule(cls) -> Rule:
+        return _isinstance_rule(UUID)
+
 
 @dataclass(frozen=True)
-class IntVo:
+class IntVo(TrustedVoMixin):
     """
     Integer Value Object for validating and representing integer values.
 
@@ -61,6 +100,8 @@ class IntVo:
         InvalidTypeError: If value is not an integer
     """
 
+    __slots__ = ("value",)
+
     value: int
 
     def __post_init__(self):
@@ -80,9 +121,15 @@ class IntVo:
                 }
             )
 
+    @classmethod
+    def compile_rule(cls) -> Rule:
+        return _isinstance_rule(int)
+
 
 @dataclass(frozen=True)
 class PositiveIntVo(IntVo):
+    __slots__ = ()
+
     def __post_init__(self):
         super().__post_init__()
         if self.value < 0:
@@ -99,9 +146,24 @@ class PositiveIntVo(IntVo):
                 }
             )
 
+    @classmethod
+    def compile_rule(cls) -> Rule:
+        type_rule = super().compile_rule()
+
+        def rule(value: Any) -> str | None:
+            if (code := type_rule(value)) is not None:
+                return code
+            if value < 0:
+                return FieldNegativeError.CODE
+            if value == 0:
+                return FieldZeroError.CODE
+            return None
+
+        return rule
+
 
 @dataclass(frozen=True)
-class DatetimeVo:
+class DatetimeVo(TrustedVoMixin):
     """
     Datetime Value Object for validating and representing datetime values.
 
@@ -115,6 +177,8 @@ class DatetimeVo:
         InvalidTypeError: If value is not a datetime instance
     """
 
+    __slots__ = ("value",)
+
     value: datetime
 
     def __post_init__(self):
@@ -134,9 +198,13 @@ class DatetimeVo:
                 }
             )
 
+    @classmethod
+    def compile_rule(cls) -> Rule:
+        return _isinstance_rule(datetime)
+
 
 @dataclass(frozen=True)
-class StrVo:
+class StrVo(TrustedVoMixin):
     """
     String Value Object for validating and representing string values.
 
@@ -150,6 +218,8 @@ class StrVo:
         InvalidTypeError: If value is not a string
     """
 
+    __slots__ = ("value",)
+
     value: str
 
     def __post_init__(self):
@@ -169,6 +239,10 @@ class StrVo:
                 }
             )
 
+    @classmethod
+    def compile_rule(cls) -> Rule:
+        return _isinstance_rule(str)
+
 
 @dataclass(frozen=True)
 class StrWithSizeVo(StrVo):
@@ -189,6 +263,8 @@ class StrWithSizeVo(StrVo):
         FieldTooLongError: If value length is greater than max_size
     """
 
+    __slots__ = ()
+
     @property
     def min_size(self) -> int:
         """
@@ -258,3 +334,21 @@ class StrWithSizeVo(StrVo):
                     "value": self.value,
                 }
             )
+
+    @classmethod
+    def compile_rule(cls) -> Rule:
+        # Ограничения читаются один раз, а не getattr на каждое значение
+        min_size = getattr(cls, "MIN_SIZE", None)
+        max_size = getattr(cls, "MAX_SIZE", None)
+
+        def rule(value: Any) -> str | None:
+            if not isinstance(value, str):
+                return InvalidTypeError.CODE
+            length = len(value.strip())
+            if min_size is not None and length < min_size:
+                return FieldTooShortError.CODE
+            if max_size is not None and length > max_size:
+                return FieldTooLongError.CODE
+            return None
+
+        return rule
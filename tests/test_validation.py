@@ -0,0 +1,91 @@
+"""
+validate_many должен принимать те же решения, что и конструктор VO:
+значение проходит проверку тогда и только тогда, когда VO из него создаётся,
+а код ошибки совпадает с AppError.CODE исключения конструктора.
+"""
+
+import pytest
+from hypothesis import given
+from hypothesis import strategies as st
+
+from src.base_exceptions import AppError
+from src.domain.user.value_objects import (
+    UserCreatedAtVo,
+    UserEmailVo,
+    UserFirstNameVo,
+    UserIdVo,
+    UserLastNameVo,
+    UserUpdatedAtVo,
+)
+from src.shared.validation import validate_many
+from src.shared.value_objects import (
+    DatetimeVo,
+    IntVo,
+    PositiveIntVo,
+    StrVo,
+    StrWithSizeVo,
+    UuidVo,
+)
+
+VALUE_OBJECTS = [
+    UuidVo,
+    IntVo,
+    PositiveIntVo,
+    DatetimeVo,
+    StrVo,
+    StrWithSizeVo,
+    UserIdVo,
+    UserCreatedAtVo,
+    UserUpdatedAtVo,
+    UserFirstNameVo,
+    UserLastNameVo,
+    UserEmailVo,
+]
+
+# Строки из символов, на которых ветвятся правила email, и пробелов вокруг значения:
+# случайный text() почти никогда не похож на адрес
+email_like = st.text(alphabet="ab.@ ", max_size=12) | st.emails()
+long_text = st.text(min_size=25, max_size=300)
+
+any_value = st.one_of(
+    st.none(),
+    st.booleans(),
+    st.integers(),
+    st.floats(allow_nan=True),
+    st.text(),
+    long_text,
+    email_like,
+    st.binary(),
+    st.uuids(),
+    st.uuids().map(str),
+    st.datetimes(),
+    st.dates(),
+    st.lists(st.integers(), max_size=3),
+)
+
+
+def construct(vo_cls: type, value: object) -> str | None:
+    """None, если VO создан, иначе CODE исключения конструктора."""
+    try:
+        vo_cls(value)
+    except AppError as e:
+        return e.CODE
+    return None
+
+
+@pytest.mark.parametrize("vo_cls", VALUE_OBJECTS, ids=lambda vo_cls: vo_cls.__name__)
+@given(value=any_value)
+def test_validate_many_matches_constructor(vo_cls: type, value: object) -> None:
+    assert validate_many(vo_cls, [value])[0] == construct(vo_cls, value)
+
+
+@pytest.mark.parametrize("vo_cls", VALUE_OBJECTS, ids=lambda vo_cls: vo_cls.__name__)
+@given(values=st.lists(any_value, max_size=10))
+def test_validate_many_keeps_row_order(vo_cls: type, values: list) -> None:
+    assert validate_many(vo_cls, values) == [construct(vo_cls, value) for value in values]
+
+
+@given(values=st.lists(st.none() | st.text(), max_size=10))
+def test_optional_accepts_none(values: list) -> None:
+    expected = [None if value is None else construct(UserFirstNameVo, value) for value in values]
+    assert validate_many(UserFirstNameVo, values, optional=True) == expected